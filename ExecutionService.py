@@ -0,0 +1,169 @@
+import os
+import sys
+import json
+import subprocess
+import threading
+from PySide2 import QtCore
+from PySide2.QtCore import QThreadPool
+from core import core
+from node_exec.GraphManager import GraphManager
+from node_exec import execution_worker
+from node_exec import fork_server
+
+class ExecutionService(QtCore.QObject):
+    """
+    Executes the graph of the current session in a separate process without blocking the GUI.
+
+    The output of the process is read by a task of the global thread pool. The signals are emitted from
+    that thread and delivered to receivers of the GUI thread through queued connections.
+    Only one graph is executed at a time.
+
+    On POSIX systems the graphs are executed by forked children of a warm fork server
+    (see node_exec.fork_server), otherwise a new worker process is started for each execution.
+    """
+
+    outputWritten = QtCore.Signal(str)
+    nodeExecuted = QtCore.Signal(str)
+    finished = QtCore.Signal(str)
+    failed = QtCore.Signal(int)
+    cancelled = QtCore.Signal()
+    timedOut = QtCore.Signal()
+
+    def __init__(self, graphManager : GraphManager, useForkServer=True):
+        super().__init__()
+
+        self.graphManager = graphManager
+        self.process = None
+        self.timer = None
+        self.isStarted = False
+        self.isTimedOut = False
+        self.isCancelled = False
+        self.lock = threading.Lock()
+
+        self.env = dict(os.environ)
+        self.env["PYTHONPATH"] = os.pathsep.join([p for p in sys.path if p])
+
+        self.forkServer = None
+        if useForkServer and fork_server.isSupported():
+            self.forkServer = fork_server.ForkServerClient(self.env)
+            # Warm up the server before the first execution:
+            QThreadPool.globalInstance().start(core.LambdaTask(self.forkServer.start))
+
+    @property
+    def isRunning(self):
+        return self.isStarted
+
+    def start(self, timeout=None, interpret=False):
+        """
+        Starts the execution of the current session.
+
+        Args:
+            timeout (float): Optional time in seconds after which the execution is cancelled.
+            interpret (bool): If True the graph is executed by the graph interpreter without saving it and without
+                              generating code. Falls back to the generated code if the graph contains nodes the
+                              interpreter does not support (see GraphManager.executeGraph).
+
+        Returns:
+            bool: False if there is no session or an execution is already running.
+        """
+        if self.isRunning or self.graphManager.curSession == None:
+            return False
+
+        settings = self.graphManager.curSession.graphSettings
+        job = dict()
+        if interpret and self.graphManager.canInterpretCurrentSession():
+            job["interpret"] = True
+            job["session"] = self.graphManager.curSession.graph.serialize_session()
+            job["startNodeName"] = settings.startNodeName
+        else:
+            if interpret:
+                print("Note: The graph contains nodes that can't be interpreted. Executing the generated code instead.")
+
+            job["source"] = self.graphManager.getProgressSource()
+            job["filename"] = self.graphManager.getPythonCodePath(settings)
+            job["moduleName"] = self.graphManager.getModuleNameFromGraphName(settings.name)
+            job["cacheFilePath"] = self.graphManager.getCodeCachePath(settings) if self.graphManager.useCodeCacheFiles else None
+
+        job["createApplication"] = True
+
+        self.isStarted = True
+        self.isTimedOut = False
+        self.isCancelled = False
+
+        if timeout != None:
+            self.timer = threading.Timer(timeout, self.onTimeout)
+            self.timer.start()
+
+        QThreadPool.globalInstance().start(core.LambdaTask(self.execute, job))
+        return True
+
+    def cancel(self):
+        with self.lock:
+            if self.isStarted:
+                self.isCancelled = True
+                if self.process != None:
+                    self.process.kill()
+
+    def onTimeout(self):
+        with self.lock:
+            if self.isStarted:
+                self.isTimedOut = True
+                if self.process != None:
+                    self.process.kill()
+
+    def startProcess(self, job):
+        if self.forkServer != None:
+            process = self.forkServer.submit(job)
+            if process != None:
+                return process
+
+        process = subprocess.Popen([sys.executable, "-u", "-m", "node_exec.execution_worker"], stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=self.env, text=True)
+        process.stdin.write(json.dumps(job))
+        process.stdin.close()
+        return process
+
+    def execute(self, job):
+        if self.forkServer != None:
+            # Starting the server takes a while, the lock must not be held meanwhile:
+            self.forkServer.start()
+
+        with self.lock:
+            if not self.isCancelled and not self.isTimedOut:
+                self.process = self.startProcess(job)
+
+        if self.process != None:
+            self.readOutput(self.process)
+        else:
+            self.onFinished(None, 0)
+
+    def readOutput(self, process):
+        result = None
+        for line in process.stdout:
+            if line.startswith(execution_worker.PROGRESS_PREFIX):
+                self.nodeExecuted.emit(line[len(execution_worker.PROGRESS_PREFIX):].rstrip("\n"))
+            elif line.startswith(execution_worker.RESULT_PREFIX):
+                result = line[len(execution_worker.RESULT_PREFIX):].rstrip("\n")
+            else:
+                self.outputWritten.emit(line)
+
+        self.onFinished(result, process.wait())
+
+    def onFinished(self, result, exitCode):
+        with self.lock:
+            if self.timer != None:
+                self.timer.cancel()
+                self.timer = None
+
+            self.process = None
+            self.isStarted = False
+
+        # The result is reported before the process exits, a failing shutdown doesn't fail the execution.
+        if result != None:
+            self.finished.emit(result)
+        elif self.isTimedOut:
+            self.timedOut.emit()
+        elif self.isCancelled:
+            self.cancelled.emit()
+        else:
+            self.failed.emit(exitCode)
@@ -114,11 +114,16 @@ class NodeAddedCmd(QtWidgets.QUndoCommand):
 
     def undo(self):
         self.pos = self.pos or self.node.pos()
-        self.model.nodes.pop(self.node.id)
+        self.model.remove_node(self.node)
         self.node.view.delete()
 
     def redo(self):
-        self.model.nodes[self.node.id] = self.node
+        self.model.add_node(self.node)
+        if self.viewer is None:
+            # headless graphs have no viewer to add the node item to.
+            if self.pos:
+                self.node.view.xy_pos = self.pos
+            return
         self.viewer.add_node(self.node.view, self.pos)
 
 
@@ -147,8 +152,9 @@ class NodeRemovedCmd(QtWidgets.QUndoCommand):
             self.outputs = [(p, p.connected_ports()) for p in output_ports]
 
     def undo(self):
-        self.model.nodes[self.node.id] = self.node
-        self.scene.addItem(self.node.view)
+        self.model.add_node(self.node)
+        if self.scene is not None:
+            self.scene.addItem(self.node.view)
         for port, connected_ports in self.inputs:
             [port.connect_to(p) for p in connected_ports]
         for port, connected_ports in self.outputs:
@@ -159,10 +165,83 @@ class NodeRemovedCmd(QtWidgets.QUndoCommand):
             [port.disconnect_from(p) for p in connected_ports]
         for port, connected_ports in self.outputs:
             [port.disconnect_from(p) for p in connected_ports]
-        self.model.nodes.pop(self.node.id)
+        self.model.remove_node(self.node)
         self.node.view.delete()
 
 
+class NodesRemovedCmd(QtWidgets.QUndoCommand):
+    """
+    Nodes deleted command.
+
+    Removes the nodes and their connections in one batch with the signals
+    of the node graph and the viewer updates suspended.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        nodes (list[NodeGraphQt.NodeObject]): nodes.
+    """
+
+    def __init__(self, graph, nodes):
+        QtWidgets.QUndoCommand.__init__(self)
+        self.setText('deleted nodes')
+        self.graph = graph
+        self.scene = graph.scene()
+        self.model = graph.model
+        self.nodes = list(nodes)
+
+        # (port, connected port) of each connection, listed once.
+        self.connections = []
+        connected = set()
+        for node in self.nodes:
+            ports = []
+            if hasattr(node, 'inputs'):
+                ports.extend(node.inputs().values())
+            if hasattr(node, 'outputs'):
+                ports.extend(node.outputs().values())
+            for port in ports:
+                for connected_port in port.connected_ports():
+                    if (connected_port, port) not in connected:
+                        connected.add((port, connected_port))
+                        self.connections.append((port, connected_port))
+
+        # connections to nodes that remain in the graph are reported with the
+        # port signals once the signals of the graph are restored.
+        node_ids = set(n.id for n in self.nodes)
+        self.outer_connections = [
+            (port, connected_port)
+            for port, connected_port in self.connections
+            if connected_port.node().id not in node_ids]
+
+    def undo(self):
+        state = self.graph._begin_bulk_update()
+        try:
+            for node in self.nodes:
+                self.model.add_node(node)
+                if self.scene is not None:
+                    self.scene.addItem(node.view)
+            for port, connected_port in self.connections:
+                PortConnectedCmd(port, connected_port).redo()
+        finally:
+            self.graph._end_bulk_update(state)
+
+        for port, connected_port in self.outer_connections:
+            self.graph.port_connected.emit(port, connected_port)
+
+    def redo(self):
+        state = self.graph._begin_bulk_update()
+        try:
+            for port, connected_port in self.connections:
+                PortDisconnectedCmd(port, connected_port).redo()
+            for node in self.nodes:
+                self.model.remove_node(node)
+                node.view.delete()
+        finally:
+            self.graph._end_bulk_update(state)
+
+        for port, connected_port in self.outer_connections:
+            self.graph.port_disconnected.emit(port, connected_port)
+
+
 class PortConnectedCmd(QtWidgets.QUndoCommand):
     """
     Port connected command.
@@ -170,12 +249,15 @@ class PortConnectedCmd(QtWidgets.QUndoCommand):
     Args:
         src_port (NodeGraphQt.Port): source port.
         trg_port (NodeGraphQt.Port): target port.
+        emit_signal (bool): emit the "port_connected" signal on redo and
+            the "port_disconnected" signal on undo.
     """
 
-    def __init__(self, src_port, trg_port):
+    def __init__(self, src_port, trg_port, emit_signal=False):
         QtWidgets.QUndoCommand.__init__(self)
         self.source = src_port
         self.target = trg_port
+        self.emit_signal = emit_signal
 
     def undo(self):
         src_model = self.source.model
@@ -195,8 +277,14 @@ class PortConnectedCmd(QtWidgets.QUndoCommand):
         if port_names and self.source.name() in port_names:
             port_names.remove(self.source.name())
 
+        graph = self.source.node().graph
+        graph._remove_port_connection(self.source, self.target)
+
         self.source.view.disconnect_from(self.target.view)
 
+        if self.emit_signal:
+            graph.port_disconnected.emit(self.source, self.target)
+
     def redo(self):
         src_model = self.source.model
         trg_model = self.target.model
@@ -206,8 +294,14 @@ class PortConnectedCmd(QtWidgets.QUndoCommand):
         src_model.connected_ports[trg_id].append(self.target.name())
         trg_model.connected_ports[src_id].append(self.source.name())
 
+        graph = self.source.node().graph
+        graph._add_port_connection(self.source, self.target)
+
         self.source.view.connect_to(self.target.view)
 
+        if self.emit_signal:
+            graph.port_connected.emit(self.source, self.target)
+
 
 class PortDisconnectedCmd(QtWidgets.QUndoCommand):
     """
@@ -216,12 +310,15 @@ class PortDisconnectedCmd(QtWidgets.QUndoCommand):
     Args:
         src_port (NodeGraphQt.Port): source port.
         trg_port (NodeGraphQt.Port): target port.
+        emit_signal (bool): emit the "port_disconnected" signal on redo and
+            the "port_connected" signal on undo.
     """
 
-    def __init__(self, src_port, trg_port):
+    def __init__(self, src_port, trg_port, emit_signal=False):
         QtWidgets.QUndoCommand.__init__(self)
         self.source = src_port
         self.target = trg_port
+        self.emit_signal = emit_signal
 
     def undo(self):
         src_model = self.source.model
@@ -232,8 +329,14 @@ class PortDisconnectedCmd(QtWidgets.QUndoCommand):
         src_model.connected_ports[trg_id].append(self.target.name())
         trg_model.connected_ports[src_id].append(self.source.name())
 
+        graph = self.source.node().graph
+        graph._add_port_connection(self.source, self.target)
+
         self.source.view.connect_to(self.target.view)
 
+        if self.emit_signal:
+            graph.port_connected.emit(self.source, self.target)
+
     def redo(self):
         src_model = self.source.model
         trg_model = self.target.model
@@ -252,8 +355,14 @@ class PortDisconnectedCmd(QtWidgets.QUndoCommand):
         if port_names and self.source.name() in port_names:
             port_names.remove(self.source.name())
 
+        graph = self.source.node().graph
+        graph._remove_port_connection(self.source, self.target)
+
         self.source.view.disconnect_from(self.target.view)
 
+        if self.emit_signal:
+            graph.port_disconnected.emit(self.source, self.target)
+
 
 class PortVisibleCmd(QtWidgets.QUndoCommand):
     """
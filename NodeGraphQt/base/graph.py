@@ -7,6 +7,7 @@ import re
 from NodeGraphQt import QtCore, QtWidgets
 from NodeGraphQt.base.commands import (NodeAddedCmd,
                                        NodeRemovedCmd,
+                                       NodesRemovedCmd,
                                        NodeMovedCmd,
                                        PortConnectedCmd)
 from NodeGraphQt.base.factory import NodeFactory
@@ -15,14 +16,20 @@ from NodeGraphQt.base.model import NodeGraphModel
 from NodeGraphQt.base.node import NodeObject
 from NodeGraphQt.base.port import Port
 from NodeGraphQt.constants import (DRAG_DROP_ID,
+                                   OUT_PORT,
                                    PIPE_LAYOUT_CURVED,
                                    PIPE_LAYOUT_STRAIGHT)
+from NodeGraphQt.qgraphics.node_headless import is_headless
 from NodeGraphQt.widgets.viewer import NodeViewer
 
 
 class NodeGraph(QtCore.QObject):
     """
     base node graph controller.
+
+    Without a QApplication the node graph is headless: nodes, ports and
+    connections only live in their models and no viewer is created
+    (see :meth:`NodeGraph.headless`).
     """
 
     #: signal emits the node object when a node is created in the node graph.
@@ -41,15 +48,40 @@ class NodeGraph(QtCore.QObject):
     property_changed = QtCore.Signal(NodeObject, str, object)
     #: signal for when drop data has been added to the graph.
     data_dropped = QtCore.Signal(QtCore.QMimeData, QtCore.QPoint)
+    #: signal emits the session file path (empty if loaded from a dict) when a session has been loaded.
+    session_loaded = QtCore.Signal(str)
 
     def __init__(self, parent=None):
         super(NodeGraph, self).__init__(parent)
         self.setObjectName('NodeGraphQt')
         self._model = NodeGraphModel()
-        self._viewer = NodeViewer(parent)
+        self._viewer = None if is_headless() else NodeViewer(parent)
         self._node_factory = NodeFactory()
         self._undo_stack = QtWidgets.QUndoStack(self)
 
+        # port -> tuple of the connected ports (see Port.connected_ports).
+        self._port_connections = {}
+
+        # node id -> position of the node in a topological order maintained
+        # while ports are connected (see NodeGraph.topological_order).
+        self._topo_indices = {}
+        self._topo_next_index = 0
+        self._topo_valid = True
+
+        # node id -> frozenset of the node ids reachable through the inputs
+        # (upstream) or outputs (downstream) of the node.
+        self._upstream_cache = {}
+        self._downstream_cache = {}
+        # node id -> set of the cached node ids whose closure contains it,
+        # so a connection change only visits the affected cache entries.
+        self._upstream_members = {}
+        self._downstream_members = {}
+
+        if self._viewer is None:
+            return
+
+        self._viewer.cycle_check = self._cycle_check
+
         tab = QtWidgets.QAction('Search Nodes', self)
         tab.setShortcut('tab')
         tab.triggered.connect(self._toggle_tab_search)
@@ -213,6 +245,343 @@ class NodeGraph(QtCore.QObject):
             port1.disconnect_from(port2)
         self._undo_stack.endMacro()
 
+    def _add_port_connection(self, src_port, trg_port):
+        """
+        add the ports to the connected ports of each other.
+        (used internally by the port commands)
+
+        Args:
+            src_port (NodeGraphQt.Port): source port.
+            trg_port (NodeGraphQt.Port): target port.
+        """
+        connections = self._port_connections
+        connections[src_port] = connections.get(src_port, ()) + (trg_port,)
+        connections[trg_port] = connections.get(trg_port, ()) + (src_port,)
+
+        if src_port.type_() == OUT_PORT:
+            out_node, in_node = src_port.node(), trg_port.node()
+        else:
+            out_node, in_node = trg_port.node(), src_port.node()
+        self._topo_add_connection(out_node, in_node)
+        self._invalidate_reachability(out_node, in_node)
+
+    def _remove_port_connection(self, src_port, trg_port):
+        """
+        remove the ports from the connected ports of each other.
+        (used internally by the port commands)
+
+        Args:
+            src_port (NodeGraphQt.Port): source port.
+            trg_port (NodeGraphQt.Port): target port.
+        """
+        connections = self._port_connections
+        for port, connected_port in ((src_port, trg_port),
+                                     (trg_port, src_port)):
+            ports = list(connections.get(port, ()))
+            if connected_port in ports:
+                ports.remove(connected_port)
+            if ports:
+                connections[port] = tuple(ports)
+            else:
+                connections.pop(port, None)
+
+        if src_port.type_() == OUT_PORT:
+            self._invalidate_reachability(src_port.node(), trg_port.node())
+        else:
+            self._invalidate_reachability(trg_port.node(), src_port.node())
+
+    def _connected_ports(self, port):
+        """
+        Returns the ports connected to the port.
+        (used internally by the port)
+
+        Args:
+            port (NodeGraphQt.Port): port object.
+
+        Returns:
+            tuple[NodeGraphQt.Port]: connected ports.
+        """
+        return self._port_connections.get(port, ())
+
+    def _invalidate_reachability(self, out_node, in_node):
+        """
+        remove the cached upstream and downstream nodes affected by a
+        connection change from the output of out_node to the input of
+        in_node.
+        (used internally by the node graph)
+        """
+        for cache, members, node_id in (
+                (self._downstream_cache, self._downstream_members, out_node.id),
+                (self._upstream_cache, self._upstream_members, in_node.id)):
+            if not cache:
+                continue
+            stale = members.pop(node_id, set())
+            stale.add(node_id)
+            for n_id in stale:
+                reachable = cache.pop(n_id, None)
+                if reachable is None:
+                    continue
+                for r_id in reachable:
+                    member_ids = members.get(r_id)
+                    if member_ids is None:
+                        continue
+                    member_ids.discard(n_id)
+                    if not member_ids:
+                        del members[r_id]
+
+    def _reachable_node_ids(self, node, downstream):
+        """
+        Returns the ids of the nodes reachable from the node.
+        (used internally by the node graph)
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+            downstream (bool): follow the outputs instead of the inputs.
+
+        Returns:
+            frozenset[str]: node ids.
+        """
+        if downstream:
+            cache, members = self._downstream_cache, self._downstream_members
+        else:
+            cache, members = self._upstream_cache, self._upstream_members
+        reachable = cache.get(node.id)
+        if reachable is not None:
+            return reachable
+
+        node_ids = set()
+        stack = [node]
+        while stack:
+            ports = getattr(stack.pop(), '_outputs' if downstream else '_inputs', ())
+            for port in ports:
+                for connected_port in port.connected_ports():
+                    connected_node = connected_port.node()
+                    if connected_node.id in node_ids:
+                        continue
+                    node_ids.add(connected_node.id)
+                    cached = cache.get(connected_node.id)
+                    if cached is None:
+                        stack.append(connected_node)
+                    else:
+                        # the cached closure is complete, don't walk it again.
+                        node_ids.update(cached)
+
+        reachable = frozenset(node_ids)
+        cache[node.id] = reachable
+        for n_id in reachable:
+            members.setdefault(n_id, set()).add(node.id)
+        return reachable
+
+    def _reset_reachability(self):
+        """
+        clear the cached upstream and downstream nodes.
+        (used internally by the node graph)
+        """
+        self._upstream_cache = {}
+        self._downstream_cache = {}
+        self._upstream_members = {}
+        self._downstream_members = {}
+
+    def upstream(self, node):
+        """
+        Returns all nodes the node depends on through its inputs.
+
+        The result is cached until a connection of the upstream nodes changes.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+
+        Returns:
+            list[NodeGraphQt.NodeObject]: upstream nodes.
+        """
+        nodes = self._model.nodes
+        return [nodes[n_id] for n_id in self._reachable_node_ids(node, False)
+                if n_id in nodes]
+
+    def downstream(self, node):
+        """
+        Returns all nodes depending on the node through its outputs.
+
+        The result is cached until a connection of the downstream nodes changes.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+
+        Returns:
+            list[NodeGraphQt.NodeObject]: downstream nodes.
+        """
+        nodes = self._model.nodes
+        return [nodes[n_id] for n_id in self._reachable_node_ids(node, True)
+                if n_id in nodes]
+
+    def _topo_index(self, node):
+        """
+        Returns the position of the node in the topological order,
+        nodes without one are appended.
+        (used internally by the node graph)
+        """
+        index = self._topo_indices.get(node.id)
+        if index is None:
+            index = self._topo_next_index
+            self._topo_indices[node.id] = index
+            self._topo_next_index += 1
+        return index
+
+    def _topo_search(self, start_node, bound, downstream, stop_node=None):
+        """
+        Depth first search from the start node that only follows nodes with
+        a topological index up to the bound (downstream) or from the bound
+        (upstream).
+        (used internally by the node graph)
+
+        Returns:
+            list[NodeGraphQt.NodeObject]: visited nodes or None if the stop
+                node was reached.
+        """
+        visited = {start_node.id}
+        nodes = [start_node]
+        stack = [start_node]
+        while stack:
+            node = stack.pop()
+            ports = getattr(node, '_outputs' if downstream else '_inputs', ())
+            for port in ports:
+                for connected_port in port.connected_ports():
+                    connected_node = connected_port.node()
+                    if connected_node is stop_node:
+                        return None
+                    if connected_node.id in visited:
+                        continue
+                    index = self._topo_index(connected_node)
+                    if (index > bound) if downstream else (index < bound):
+                        continue
+                    visited.add(connected_node.id)
+                    nodes.append(connected_node)
+                    stack.append(connected_node)
+        return nodes
+
+    def _topo_add_connection(self, src_node, trg_node):
+        """
+        update the topological order for a new connection from the output
+        of the source node to the input of the target node (Pearce-Kelly).
+        Only the nodes between the two in the order are visited and moved.
+        (used internally by the node graph)
+        """
+        if not self._topo_valid:
+            return
+        lower = self._topo_index(trg_node)
+        upper = self._topo_index(src_node)
+        if upper < lower:
+            return
+        if src_node is trg_node:
+            self._topo_valid = False
+            return
+
+        forward = self._topo_search(trg_node, upper, True, src_node)
+        if forward is None:
+            # the connection closed a cycle.
+            self._topo_valid = False
+            return
+        backward = self._topo_search(src_node, lower, False)
+
+        # the upstream nodes of the source take the lower indices.
+        key = lambda n: self._topo_indices[n.id]
+        nodes = sorted(backward, key=key) + sorted(forward, key=key)
+        indices = sorted(self._topo_indices[n.id] for n in nodes)
+        for node, index in zip(nodes, indices):
+            self._topo_indices[node.id] = index
+
+    def _topo_rebuild(self):
+        """
+        rebuild the topological order from scratch (Kahn).
+        (used internally by the node graph)
+
+        Returns:
+            bool: False if the connections contain a cycle.
+        """
+        nodes = list(self._model.nodes.values())
+        in_degrees = {}
+        for node in nodes:
+            in_degrees[node.id] = sum(len(p.connected_ports())
+                                      for p in getattr(node, '_inputs', ()))
+
+        ready = [n for n in nodes if in_degrees[n.id] == 0]
+        indices = {}
+        while ready:
+            node = ready.pop()
+            indices[node.id] = len(indices)
+            for port in getattr(node, '_outputs', ()):
+                for connected_port in port.connected_ports():
+                    node_id = connected_port.node().id
+                    if node_id not in in_degrees:
+                        continue
+                    in_degrees[node_id] -= 1
+                    if in_degrees[node_id] == 0:
+                        ready.append(connected_port.node())
+
+        if len(indices) != len(nodes):
+            return False
+        self._topo_indices = indices
+        self._topo_next_index = len(indices)
+        self._topo_valid = True
+        return True
+
+    def _topo_reset(self):
+        """
+        reset the topological order, it's rebuilt when needed.
+        (used internally by the node graph)
+        """
+        self._topo_indices = {}
+        self._topo_next_index = 0
+        self._topo_valid = False
+
+    def _creates_cycle(self, src_node, trg_node):
+        """
+        Returns True if connecting an output of the source node to an input
+        of the target node would create a cycle.
+        (used internally by the node graph)
+        """
+        if src_node is trg_node:
+            return True
+        if self._topo_valid or self._topo_rebuild():
+            if self._topo_index(src_node) < self._topo_index(trg_node):
+                return False
+            upper = self._topo_index(src_node)
+        else:
+            # the graph already contains a cycle, search all nodes.
+            upper = float('inf')
+        return self._topo_search(trg_node, upper, True, src_node) is None
+
+    def _cycle_check(self, start_port_view, end_port_view):
+        """
+        check used by the viewer to validate a new pipe connection.
+        (used internally by the viewer)
+
+        Returns:
+            bool: True if the connection doesn't create a cycle.
+        """
+        start_node = self._model.nodes.get(start_port_view.node.id)
+        end_node = self._model.nodes.get(end_port_view.node.id)
+        if start_node is None or end_node is None:
+            return None
+        if start_port_view.port_type == OUT_PORT:
+            return not self._creates_cycle(start_node, end_node)
+        return not self._creates_cycle(end_node, start_node)
+
+    def topological_order(self):
+        """
+        Returns the nodes sorted so that every node comes before the nodes
+        connected to its outputs.
+
+        The order is maintained incrementally while ports are connected.
+
+        Returns:
+            list[NodeGraphQt.NodeObject]: nodes or None if the connections
+                contain a cycle.
+        """
+        if not self._topo_valid and not self._topo_rebuild():
+            return None
+        return sorted(self._model.nodes.values(), key=self._topo_index)
+
     @property
     def model(self):
         """
@@ -237,12 +606,25 @@ class NodeGraph(QtCore.QObject):
         """
         self._viewer.close()
 
+    def headless(self):
+        """
+        Returns True if the node graph was created without a QApplication,
+        it then has no viewer and its nodes have no graphics items.
+
+        Sessions can still be loaded, edited and serialized.
+
+        Returns:
+            bool: true if the node graph is headless.
+        """
+        return self._viewer is None
+
     def viewer(self):
         """
         Return the node graph viewer widget.
 
         Returns:
-            NodeGraphQt.widgets.viewer.NodeViewer: viewer widget.
+            NodeGraphQt.widgets.viewer.NodeViewer: viewer widget
+                (None if the node graph is headless).
         """
         return self._viewer
 
@@ -251,8 +633,11 @@ class NodeGraph(QtCore.QObject):
         Return the scene object.
 
         Returns:
-            NodeGraphQt.widgets.scene.NodeScene: node scene.
+            NodeGraphQt.widgets.scene.NodeScene: node scene
+                (None if the node graph is headless).
         """
+        if self._viewer is None:
+            return None
         return self._viewer.scene()
 
     def background_color(self):
@@ -383,7 +768,8 @@ class NodeGraph(QtCore.QObject):
             mode (bool): true to enable acyclic.
         """
         self._model.acyclic = mode
-        self._viewer.acyclic = mode
+        if self._viewer is not None:
+            self._viewer.acyclic = mode
 
     def set_pipe_style(self, style=None):
         """
@@ -542,7 +928,17 @@ class NodeGraph(QtCore.QObject):
             pos (list[float]): node x,y position. (optional)
         """
         assert isinstance(node, NodeObject), 'node must be a Node instance.'
+        self._init_node(node)
+        self._undo_stack.push(NodeAddedCmd(self, node, pos))
+
+    def _init_node(self, node):
+        """
+        prepare the node before it's added to the node graph.
+        (used internally by the node graph)
 
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+        """
         wid_types = node.model.__dict__.pop('_TEMP_property_widget_types')
         prop_attrs = node.model.__dict__.pop('_TEMP_property_attrs')
 
@@ -559,7 +955,6 @@ class NodeGraph(QtCore.QObject):
         node.model._graph_model = self.model
         node.model.name = node.NODE_NAME
         node.update()
-        self._undo_stack.push(NodeAddedCmd(self, node, pos))
 
     def delete_node(self, node):
         """
@@ -580,10 +975,10 @@ class NodeGraph(QtCore.QObject):
         Args:
             nodes (list[NodeGraphQt.BaseNode]): list of node instances.
         """
+        if not nodes:
+            return
         self.nodes_deleted.emit([n.id for n in nodes])
-        self._undo_stack.beginMacro('delete nodes')
-        [self._undo_stack.push(NodeRemovedCmd(self, n)) for n in nodes]
-        self._undo_stack.endMacro()
+        self._undo_stack.push(NodesRemovedCmd(self, nodes))
 
     def all_nodes(self):
         """
@@ -601,6 +996,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             list[NodeGraphQt.BaseNode]: list of nodes.
         """
+        if self._viewer is None:
+            return [n for n in self.all_nodes() if n.selected()]
         nodes = []
         for item in self._viewer.selected_nodes():
             node = self._model.nodes[item.id]
@@ -646,9 +1043,7 @@ class NodeGraph(QtCore.QObject):
         Returns:
             NodeGraphQt.NodeObject: node object.
         """
-        for node_id, node in self._model.nodes.items():
-            if node.name() == name:
-                return node
+        return self._model.get_node_by_name(name)
 
     def get_unique_name(self, name):
         """
@@ -661,24 +1056,15 @@ class NodeGraph(QtCore.QObject):
             str: unique node name.
         """
         name = ' '.join(name.split())
-        node_names = [n.name() for n in self.all_nodes()]
-        if name not in node_names:
+        if not self._model.is_node_name_used(name):
             return name
 
         regex = re.compile('[\w ]+(?: )*(\d+)')
         search = regex.search(name)
-        if not search:
-            for x in range(1, len(node_names) + 1):
-                new_name = '{} {}'.format(name, x)
-                if new_name not in node_names:
-                    return new_name
-
-        version = search.group(1)
-        name = name[:len(version) * -1].strip()
-        for x in range(1, len(node_names) + 1):
-            new_name = '{} {}'.format(name, x)
-            if new_name not in node_names:
-                return new_name
+        if search:
+            version = search.group(1)
+            name = name[:len(version) * -1].strip()
+        return '{} {}'.format(name, self._model.get_free_name_suffix(name))
 
     def current_session(self):
         """
@@ -693,33 +1079,38 @@ class NodeGraph(QtCore.QObject):
         """
         Clears the current node graph session.
         """
-        for n in self.all_nodes():
-            self._undo_stack.push(NodeRemovedCmd(self, n))
+        NodesRemovedCmd(self, self.all_nodes()).redo()
         self._undo_stack.clear()
+        self._topo_reset()
+        self._reset_reachability()
         self._model.session = None
 
-    def _serialize(self, nodes):
+    def _serialize_nodes(self, nodes, connections):
         """
-        serialize nodes to a dict.
+        serialize the nodes one at a time.
         (used internally by the node graph)
 
+        Each connection is added once to the connections list, in the
+        order it is first found.
+
         Args:
             nodes (list[NodeGraphQt.Nodes]): list of node instances.
+            connections (list[dict]): list the connections are added to.
 
-        Returns:
-            dict: serialized data.
+        Yields:
+            tuple(str, dict): node id and serialized node data.
         """
-        serial_data = {'nodes': {}, 'connections': []}
-        nodes_data = {}
+        node_ids = set()
+        pipes = set()
         for n in nodes:
+            if n.id in node_ids:
+                continue
+            node_ids.add(n.id)
 
             # update the node model.
             n.update_model()
 
-            nodes_data.update(n.model.to_dict)
-
-        for n_id, n_data in nodes_data.items():
-            serial_data['nodes'][n_id] = n_data
+            n_id, n_data = next(iter(n.model.to_dict.items()))
 
             inputs = n_data.pop('inputs') if n_data.get('inputs') else {}
             outputs = n_data.pop('outputs') if n_data.get('outputs') else {}
@@ -727,67 +1118,193 @@ class NodeGraph(QtCore.QObject):
             for pname, conn_data in inputs.items():
                 for conn_id, prt_names in conn_data.items():
                     for conn_prt in prt_names:
-                        pipe = {'in': [n_id, pname], 'out': [conn_id, conn_prt]}
-                        if pipe not in serial_data['connections']:
-                            serial_data['connections'].append(pipe)
+                        pipe = (conn_id, conn_prt, n_id, pname)
+                        if pipe not in pipes:
+                            pipes.add(pipe)
+                            connections.append({'in': [n_id, pname],
+                                                'out': [conn_id, conn_prt]})
 
             for pname, conn_data in outputs.items():
                 for conn_id, prt_names in conn_data.items():
                     for conn_prt in prt_names:
-                        pipe = {'out': [n_id, pname], 'in': [conn_id, conn_prt]}
-                        if pipe not in serial_data['connections']:
-                            serial_data['connections'].append(pipe)
+                        pipe = (n_id, pname, conn_id, conn_prt)
+                        if pipe not in pipes:
+                            pipes.add(pipe)
+                            connections.append({'out': [n_id, pname],
+                                                'in': [conn_id, conn_prt]})
 
-        if not serial_data['connections']:
-            serial_data.pop('connections')
+            yield n_id, n_data
 
-        return serial_data
-
-    def _deserialize(self, data, relative_pos=False, pos=None):
+    def _serialize(self, nodes):
         """
-        deserialize node data.
+        serialize nodes to a dict.
         (used internally by the node graph)
 
         Args:
-            data (dict): node data.
-            relative_pos (bool): position node relative to the cursor.
+            nodes (list[NodeGraphQt.Nodes]): list of node instances.
 
         Returns:
-            list[NodeGraphQt.Nodes]: list of node instances.
+            dict: serialized data.
         """
-        nodes = {}
+        connections = []
+        serial_data = {'nodes': dict(self._serialize_nodes(nodes, connections))}
+        if connections:
+            serial_data['connections'] = connections
+        return serial_data
 
-        # build the nodes.
-        for n_id, n_data in data.get('nodes', {}).items():
-            identifier = n_data['type_']
-            NodeCls = self._node_factory.create_node_instance(identifier)
-            if NodeCls:
-                node = NodeCls()
-                node.NODE_NAME = n_data.get('name', node.NODE_NAME)
+    def iter_serialized_json(self, nodes=None, indent=None, separators=None):
+        """
+        Serializes the nodes to a `JSON` string in chunks without building
+        the whole serialized data first.
 
-                node.deserialize(n_data)
+        The joined chunks are equal to
+        ``json.dumps(self._serialize(nodes), indent=indent, separators=separators)``.
 
-                nodes[n_id] = node
-                self.add_node(node, n_data.get('pos'))
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]): list of nodes (default: all nodes).
+            indent (int or str): indent as used by :func:`json.dumps`.
+            separators (tuple(str, str)): separators as used by :func:`json.dumps`.
+
+        Yields:
+            str: chunk of the JSON string.
+        """
+        if nodes is None:
+            nodes = self.all_nodes()
+
+        encoder = json.JSONEncoder(indent=indent, separators=separators)
+        item_sep = encoder.item_separator
+        key_sep = encoder.key_separator
+        if isinstance(indent, int):
+            indent = ' ' * indent
+
+        def newline(level):
+            return '' if indent is None else '\n' + indent * level
+
+        def encode(value, level):
+            # nested values are indented relative to their level.
+            return encoder.encode(value).replace('\n', newline(level))
+
+        connections = []
+        chunk = '{' + newline(1) + '"nodes"' + key_sep + '{'
+        is_empty = True
+        for n_id, n_data in self._serialize_nodes(nodes, connections):
+            if not is_empty:
+                chunk += item_sep
+            yield chunk + newline(2) + encode(n_id, 2) + key_sep + encode(n_data, 2)
+            chunk = ''
+            is_empty = False
+        yield chunk + ('}' if is_empty else newline(1) + '}')
+
+        if connections:
+            yield item_sep + newline(1) + '"connections"' + key_sep + '['
+            for i, connection in enumerate(connections):
+                yield (item_sep if i else '') + newline(2) + encode(connection, 2)
+            yield newline(1) + ']'
+        yield newline(0) + '}'
+
+    def _begin_bulk_update(self):
+        """
+        suspend the signals of the node graph and the updates of the viewer
+        while many items are added or removed.
+        (used internally by the node graph and the undo commands)
 
-        # build the connections.
-        for connection in data.get('connections', []):
-            nid, pname = connection.get('in', ('', ''))
-            in_node = nodes.get(nid)
-            if not in_node:
-                continue
-            in_port = in_node.inputs().get(pname) if in_node else None
+        Returns:
+            tuple: previous state passed to :meth:`NodeGraph._end_bulk_update`.
+        """
+        if self._viewer is None:
+            state = (self.signalsBlocked(), None, None)
+            self.blockSignals(True)
+            return state
 
-            nid, pname = connection.get('out', ('', ''))
-            out_node = nodes.get(nid)
-            if not out_node:
-                continue
-            out_port = out_node.outputs().get(pname) if out_node else None
+        scene = self.scene()
+        state = (self.signalsBlocked(),
+                 self._viewer.updatesEnabled(),
+                 scene.itemIndexMethod())
+        self.blockSignals(True)
+        self._viewer.setUpdatesEnabled(False)
+        # the index is built once at the end instead of per added item.
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+        return state
+
+    def _end_bulk_update(self, state):
+        """
+        restore the state saved by :meth:`NodeGraph._begin_bulk_update`.
+        (used internally by the node graph and the undo commands)
+        """
+        signals_blocked, updates_enabled, index_method = state
+        if self._viewer is not None:
+            self.scene().setItemIndexMethod(index_method)
+            self._viewer.setUpdatesEnabled(updates_enabled)
+        self.blockSignals(signals_blocked)
+
+    def _deserialize(self, data, relative_pos=False, pos=None, bulk=False):
+        """
+        deserialize node data.
+        (used internally by the node graph)
+
+        Args:
+            data (dict): node data.
+            relative_pos (bool): position node relative to the cursor.
+            bulk (bool): add the nodes and connections directly without
+                undo commands while signals and viewer updates are suspended.
 
-            if in_port and out_port:
-                self._undo_stack.push(PortConnectedCmd(in_port, out_port))
+        Returns:
+            list[NodeGraphQt.Nodes]: list of node instances.
+        """
+        state = self._begin_bulk_update() if bulk else None
+        if bulk:
+            # rebuilt once when needed instead of updated per connection.
+            self._topo_reset()
+            self._reset_reachability()
+        try:
+            nodes = {}
+
+            # build the nodes.
+            for n_id, n_data in data.get('nodes', {}).items():
+                identifier = n_data['type_']
+                NodeCls = self._node_factory.create_node_instance(identifier)
+                if NodeCls:
+                    node = NodeCls()
+                    node.NODE_NAME = n_data.get('name', node.NODE_NAME)
+
+                    node.deserialize(n_data)
+
+                    nodes[n_id] = node
+                    if bulk:
+                        self._init_node(node)
+                        NodeAddedCmd(self, node, n_data.get('pos')).redo()
+                    else:
+                        self.add_node(node, n_data.get('pos'))
+
+            # build the connections.
+            for connection in data.get('connections', []):
+                nid, pname = connection.get('in', ('', ''))
+                in_node = nodes.get(nid)
+                if not in_node:
+                    continue
+                in_port = in_node.inputs().get(pname) if in_node else None
+
+                nid, pname = connection.get('out', ('', ''))
+                out_node = nodes.get(nid)
+                if not out_node:
+                    continue
+                out_port = out_node.outputs().get(pname) if out_node else None
+
+                if in_port and out_port:
+                    connect_cmd = PortConnectedCmd(in_port, out_port,
+                                                   emit_signal=not bulk)
+                    if bulk:
+                        connect_cmd.redo()
+                    else:
+                        self._undo_stack.push(connect_cmd)
+        finally:
+            if bulk:
+                self._end_bulk_update(state)
 
         node_objs = list(nodes.values())
+        if self._viewer is None:
+            # headless nodes keep their serialized positions.
+            return node_objs
         if relative_pos:
             self._viewer.move_nodes([n.view for n in node_objs])
             [setattr(n.model, 'pos', n.view.xy_pos) for n in node_objs]
@@ -814,8 +1331,9 @@ class NodeGraph(QtCore.QObject):
             layout_data (dict): dictionary object containing a node session.
         """
         self.clear_session()
-        self._deserialize(layout_data)
+        self._deserialize(layout_data, bulk=True)
         self._undo_stack.clear()
+        self.session_loaded.emit('')
 
     def save_session(self, file_path):
         """
@@ -824,10 +1342,10 @@ class NodeGraph(QtCore.QObject):
         Args:
             file_path (str): path to the saved node layout.
         """
-        serliazed_data = self._serialize(self.all_nodes())
         file_path = file_path.strip()
         with open(file_path, 'w') as file_out:
-            json.dump(serliazed_data, file_out, indent=2, separators=(',', ':'))
+            file_out.writelines(self.iter_serialized_json(
+                indent=2, separators=(',', ':')))
 
     def load_session(self, file_path):
         """
@@ -852,9 +1370,10 @@ class NodeGraph(QtCore.QObject):
         if not layout_data:
             return
 
-        self._deserialize(layout_data)
+        self._deserialize(layout_data, bulk=True)
         self._undo_stack.clear()
         self._model.session = file_path
+        self.session_loaded.emit(file_path)
 
     def copy_nodes(self, nodes=None):
         """
@@ -867,8 +1386,7 @@ class NodeGraph(QtCore.QObject):
         if not nodes:
             return False
         clipboard = QtWidgets.QApplication.clipboard()
-        serial_data = self._serialize(nodes)
-        serial_str = json.dumps(serial_data)
+        serial_str = ''.join(self.iter_serialized_json(nodes))
         if serial_str:
             clipboard.setText(serial_str)
             return True
@@ -135,6 +135,9 @@ class NodeModel(object):
 
     def set_property(self, name, value):
         if name in self.properties.keys():
+            if name == 'name' and value != self.name and \
+                    self._graph_model is not None:
+                self._graph_model.set_node_name(self.id, self.name, value)
             setattr(self, name, value)
         elif name in self._custom_prop.keys():
             self._custom_prop[name] = value
@@ -262,6 +265,102 @@ class NodeGraphModel(object):
         self.acyclic = True
         self.__common_node_props = {}
 
+        # node name -> ids of the nodes with the name.
+        self.__node_ids_by_name = {}
+        # base name -> lowest number that may be free as name suffix.
+        self.__name_suffixes = {}
+
+    def add_node(self, node):
+        """
+        add the node to the model and index its name.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+        """
+        self.nodes[node.id] = node
+        self.__add_name(node.id, node.name())
+
+    def remove_node(self, node):
+        """
+        remove the node from the model and its name from the index.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+        """
+        self.nodes.pop(node.id)
+        self.__remove_name(node.id, node.name())
+
+    def set_node_name(self, node_id, old_name, new_name):
+        """
+        update the name index when a node in the model is renamed.
+
+        Args:
+            node_id (str): node id.
+            old_name (str): current name of the node.
+            new_name (str): new name of the node.
+        """
+        if node_id not in self.nodes:
+            return
+        self.__remove_name(node_id, old_name)
+        self.__add_name(node_id, new_name)
+
+    def get_node_by_name(self, name):
+        """
+        Args:
+            name (str): node name.
+
+        Returns:
+            NodeGraphQt.NodeObject: node object or None.
+        """
+        node_ids = self.__node_ids_by_name.get(name)
+        if node_ids:
+            return self.nodes[node_ids[0]]
+
+    def is_node_name_used(self, name):
+        """
+        Args:
+            name (str): node name.
+
+        Returns:
+            bool: True if a node in the model has the name.
+        """
+        return name in self.__node_ids_by_name
+
+    def get_free_name_suffix(self, base_name):
+        """
+        Returns the lowest number x where "<base_name> <x>" is not used
+        as node name.
+
+        Args:
+            base_name (str): node name without suffix.
+
+        Returns:
+            int: name suffix.
+        """
+        suffix = self.__name_suffixes.get(base_name, 1)
+        while '{} {}'.format(base_name, suffix) in self.__node_ids_by_name:
+            suffix += 1
+        self.__name_suffixes[base_name] = suffix
+        return suffix
+
+    def __add_name(self, node_id, name):
+        self.__node_ids_by_name.setdefault(name, []).append(node_id)
+
+    def __remove_name(self, node_id, name):
+        node_ids = self.__node_ids_by_name.get(name)
+        if node_ids is None or node_id not in node_ids:
+            return
+        node_ids.remove(node_id)
+        if node_ids:
+            return
+        del self.__node_ids_by_name[name]
+
+        # the suffix of the freed name can be used again.
+        base_name, sep, suffix = name.rpartition(' ')
+        if sep and suffix.isdecimal() and \
+                int(suffix) < self.__name_suffixes.get(base_name, 1):
+            self.__name_suffixes[base_name] = int(suffix)
+
     def common_properties(self):
         return self.__common_node_props
 
@@ -11,6 +11,9 @@ from NodeGraphQt.constants import (NODE_PROP,
 from NodeGraphQt.errors import PortRegistrationError
 from NodeGraphQt.qgraphics.node_backdrop import BackdropNodeItem
 from NodeGraphQt.qgraphics.node_base import NodeItem
+from NodeGraphQt.qgraphics.node_headless import (HeadlessNodeItem,
+                                                 HeadlessNodeWidget,
+                                                 is_headless)
 from NodeGraphQt.widgets.node_property import (NodeComboBox,
                                                NodeLineEdit,
                                                NodeCheckBox)
@@ -114,6 +117,16 @@ class NodeObject(object):
         """
         return self._view
 
+    def headless(self):
+        """
+        Returns True if the node has no graphics item because it was created
+        without a QApplication (see :meth:`NodeGraph.headless`).
+
+        Returns:
+            bool: true if the node is headless.
+        """
+        return isinstance(self._view, HeadlessNodeItem)
+
     def set_view(self, item):
         """
         Sets the qgraphics item to use for the scene.
@@ -151,10 +164,10 @@ class NodeObject(object):
         Update the node model from view.
         """
         for name, val in self.view.properties.items():
-            if name in self.model.properties.keys():
-                setattr(self.model, name, val)
-            if name in self.model.custom_properties.keys():
-                self.model.custom_properties[name] = val
+            # set_property keeps the name index of the graph model up to date.
+            if name in self.model.properties.keys() or \
+                    name in self.model.custom_properties.keys():
+                self.model.set_property(name, val)
 
     def update(self):
         """
@@ -391,7 +404,8 @@ class BaseNode(NodeObject):
     NODE_NAME = 'Base Node'
 
     def __init__(self):
-        super(BaseNode, self).__init__(NodeItem())
+        super(BaseNode, self).__init__(
+            HeadlessNodeItem() if is_headless() else NodeItem())
         self._inputs = []
         self._outputs = []
 
@@ -408,6 +422,30 @@ class BaseNode(NodeObject):
             if widget.has_property:
                 self.model.set_property(name, widget.value)
 
+    def _add_property_widget(self, widget_cls, name, label, *args):
+        """
+        create the widget of the custom property and embed it into the node,
+        headless nodes get a widget that only holds the property value.
+        (used internally by the node)
+
+        Args:
+            widget_cls (type): node widget class.
+            name (str): name of the custom property.
+            label (str): label to be displayed.
+            args: additional arguments of the widget class.
+
+        Returns:
+            NodeGraphQt.widgets.node_property.NodeBaseWidget: the widget.
+        """
+        if self.headless():
+            widget = HeadlessNodeWidget(
+                self.view, name, label, self.get_property(name))
+        else:
+            widget = widget_cls(self.view, name, label, *args)
+        widget.value_changed.connect(lambda k, v: self.set_property(k, v))
+        self.view.add_widget(widget)
+        return widget
+
     def set_icon(self, icon=None):
         """
         Set the node icon.
@@ -440,10 +478,7 @@ class BaseNode(NodeObject):
         items = items or []
         self.create_property(
             name, items[0], items=items, widget_type=NODE_PROP_QCOMBO, tab=tab)
-
-        widget = NodeComboBox(self.view, name, label, items)
-        widget.value_changed.connect(lambda k, v: self.set_property(k, v))
-        self.view.add_widget(widget)
+        self._add_property_widget(NodeComboBox, name, label, items)
 
     def add_text_input(self, name='', label='', text='', tab=None):
         """
@@ -458,11 +493,7 @@ class BaseNode(NodeObject):
         """
         self.create_property(
             name, text, widget_type=NODE_PROP_QLINEEDIT, tab=tab)
-        widget = NodeLineEdit(self.view, name, label, text)
-        widget.value_changed.connect(lambda k, v: self.set_property(k, v))
-        self.view.add_widget(widget)
-
-        return widget
+        return self._add_property_widget(NodeLineEdit, name, label, text)
 
     def add_checkbox(self, name='', label='', text='', state=False, tab=None):
         """
@@ -478,11 +509,8 @@ class BaseNode(NodeObject):
         """
         self.create_property(
             name, state, widget_type=NODE_PROP_QCHECKBOX, tab=tab)
-        widget = NodeCheckBox(self.view, name, label, text, state)
-        widget.value_changed.connect(lambda k, v: self.set_property(k, v))
-        self.view.add_widget(widget)
-
-        return widget
+        return self._add_property_widget(
+            NodeCheckBox, name, label, text, state)
 
     def add_input(self, name='input', multi_input=False, display_name=True,
                   color=None):
@@ -617,7 +645,8 @@ class BackdropNode(NodeObject):
     NODE_NAME = 'Backdrop'
 
     def __init__(self):
-        super(BackdropNode, self).__init__(BackdropNodeItem())
+        super(BackdropNode, self).__init__(
+            HeadlessNodeItem() if is_headless() else BackdropNodeItem())
         # override base default color.
         self.model.color = (5, 129, 138, 255)
         self.create_property('backdrop_text', '',
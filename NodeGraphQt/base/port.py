@@ -101,7 +101,7 @@ class Port(object):
         connected_ports = self.connected_ports()
         if connected_ports:
             for port in connected_ports:
-                undo_stack.push(PortDisconnectedCmd(self, port))
+                undo_stack.push(PortDisconnectedCmd(self, port, emit_signal=True))
 
         undo_stack.push(PortVisibleCmd(self))
         undo_stack.endMacro()
@@ -110,19 +110,15 @@ class Port(object):
         """
         Returns all connected ports.
 
+        The ports are looked up in the adjacency index of the node graph.
+
         Returns:
             list[NodeGraphQt.Port]: list of connected ports.
         """
-        ports = []
         graph = self.node().graph
-        for node_id, port_names in self.model.connected_ports.items():
-            for port_name in port_names:
-                node = graph.get_node_by_id(node_id)
-                if self.type_() == 'in':
-                    ports.append(node.outputs()[port_name])
-                elif self.type_() == 'out':
-                    ports.append(node.inputs()[port_name])
-        return ports
+        if graph is None:
+            return []
+        return list(graph._connected_ports(self))
 
     def connect_to(self, port=None):
         """
@@ -139,6 +135,13 @@ class Port(object):
         viewer = graph.viewer()
         undo_stack = graph.undo_stack()
 
+        if viewer is None and graph.acyclic():
+            # headless graphs have no viewer, the graph checks for cycles and
+            # refuses the connection if it creates one (False) or if a node
+            # isn't part of the graph (None).
+            if not graph._cycle_check(self.view, port.view):
+                return
+
         undo_stack.beginMacro('connect port')
 
         pre_conn_port = None
@@ -148,27 +151,27 @@ class Port(object):
 
         if not port:
             if pre_conn_port:
-                undo_stack.push(PortDisconnectedCmd(self, port))
+                undo_stack.push(PortDisconnectedCmd(self, port, emit_signal=True))
             return
 
-        if graph.acyclic() and viewer.acyclic_check(self.view, port.view):
+        if viewer is not None and graph.acyclic() and \
+                viewer.acyclic_check(self.view, port.view):
             if pre_conn_port:
-                undo_stack.push(PortDisconnectedCmd(self, pre_conn_port))
+                undo_stack.push(PortDisconnectedCmd(self, pre_conn_port, emit_signal=True))
                 return
 
         trg_conn_ports = port.connected_ports()
         if not port.multi_connection() and trg_conn_ports:
             dettached_port = trg_conn_ports[0]
-            undo_stack.push(PortDisconnectedCmd(port, dettached_port))
+            undo_stack.push(PortDisconnectedCmd(port, dettached_port, emit_signal=True))
         if pre_conn_port:
-            undo_stack.push(PortDisconnectedCmd(self, pre_conn_port))
+            undo_stack.push(PortDisconnectedCmd(self, pre_conn_port, emit_signal=True))
 
-        undo_stack.push(PortConnectedCmd(self, port))
+        # the commands emit the "port_connected" and "port_disconnected"
+        # signals from the parent graph, on undo and redo as well.
+        undo_stack.push(PortConnectedCmd(self, port, emit_signal=True))
         undo_stack.endMacro()
 
-        # emit "port_connected" signal from the parent graph.
-        graph.port_connected.emit(self, port)
-
     def disconnect_from(self, port=None):
         """
         Disconnect from the specified port and emits the "port_disconnected"
@@ -180,7 +183,7 @@ class Port(object):
         if not port:
             return
         graph = self.node().graph
-        graph.undo_stack().push(PortDisconnectedCmd(self, port))
-
-        # emit "port_disconnected" signal from the parent graph.
-        graph.port_disconnected.emit(self, port)
+        # the command emits the "port_disconnected" signal from the parent
+        # graph and "port_connected" when it is undone.
+        graph.undo_stack().push(
+            PortDisconnectedCmd(self, port, emit_signal=True))
@@ -0,0 +1,255 @@
+#!/usr/bin/python
+from NodeGraphQt import QtCore, QtWidgets
+
+from NodeGraphQt.constants import IN_PORT, OUT_PORT, NODE_WIDTH, NODE_HEIGHT
+
+
+def is_headless():
+    """
+    Returns True if there's no QApplication to create graphics items and
+    widgets, nodes then use the headless items of this module.
+
+    Returns:
+        bool: true if running headless.
+    """
+    app = QtCore.QCoreApplication.instance()
+    return not isinstance(app, QtWidgets.QApplication)
+
+
+class HeadlessPortItem(object):
+    """
+    Stand in for the port item of a headless node, it only holds the port
+    attributes.
+
+    Args:
+        node (HeadlessNodeItem): the parent node item.
+    """
+
+    def __init__(self, node=None):
+        self.node = node
+        self.name = 'port'
+        self.port_type = None
+        self.multi_connection = False
+        self.display_name = True
+        self.color = (0, 0, 0, 255)
+        self.border_color = (0, 0, 0, 255)
+        self.visible = True
+
+    def __repr__(self):
+        return '{}.HeadlessPortItem("{}")'.format(self.__module__, self.name)
+
+    def setVisible(self, visible):
+        self.visible = visible
+
+    def setParentItem(self, item):
+        self.node = item
+
+    def connect_to(self, port):
+        pass
+
+    def disconnect_from(self, port):
+        pass
+
+
+class HeadlessNodeWidget(QtCore.QObject):
+    """
+    Stand in for the embedded widget of a headless node, it holds the value
+    and emits "value_changed" like the node widgets.
+
+    Args:
+        parent (HeadlessNodeItem): the parent node item.
+        name (str): name of the widget property.
+        label (str): widget label.
+        value (object): initial value.
+    """
+
+    value_changed = QtCore.Signal(str, object)
+
+    def __init__(self, parent=None, name='widget', label='', value=None):
+        super(HeadlessNodeWidget, self).__init__()
+        self._node = parent
+        self._name = name
+        self._label = label
+        self._value = value
+
+    def _value_changed(self):
+        self.value_changed.emit(self.name, self.value)
+
+    def setToolTip(self, tooltip):
+        pass
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if value != self._value:
+            self._value = value
+            self._value_changed()
+
+    @property
+    def label(self):
+        return self._label
+
+    @label.setter
+    def label(self, label):
+        self._label = label
+
+    @property
+    def type_(self):
+        return str(self.__class__.__name__)
+
+    @property
+    def node(self):
+        return self._node
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def has_property(self):
+        return True
+
+
+class HeadlessNodeItem(object):
+    """
+    Stand in for the node item of a headless node, nodes, ports and
+    connections only live in their models and nothing is drawn.
+
+    Args:
+        name (str): name displayed on the node.
+    """
+
+    def __init__(self, name='node'):
+        self._properties = {
+            'id': None,
+            'name': name.strip(),
+            'color': (13, 18, 23, 255),
+            'border_color': (46, 57, 66, 255),
+            'text_color': (255, 255, 255, 180),
+            'type_': 'AbstractBaseNode',
+            'selected': False,
+            'disabled': False,
+            'icon': None,
+        }
+        self.width = NODE_WIDTH
+        self.height = NODE_HEIGHT
+        self.xy_pos = [0.0, 0.0]
+        self.backdrop_text = ''
+        self._input_items = {}
+        self._output_items = {}
+        self._widgets = {}
+
+    def __repr__(self):
+        return '{}.{}(\'{}\')'.format(
+            self.__module__, self.__class__.__name__, self.name)
+
+    def __getattr__(self, name):
+        properties = self.__dict__.get('_properties', {})
+        if name in properties:
+            return properties[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in self.__dict__.get('_properties', {}):
+            self._properties[name] = value
+        else:
+            super(HeadlessNodeItem, self).__setattr__(name, value)
+
+    @property
+    def properties(self):
+        """
+        return the node view attributes.
+
+        Returns:
+            dict: {property_name: property_value}
+        """
+        props = {'width': self.width,
+                 'height': self.height,
+                 'pos': self.xy_pos}
+        props.update(self._properties)
+        return props
+
+    @property
+    def widgets(self):
+        return self._widgets.copy()
+
+    def from_dict(self, node_dict):
+        """
+        set the node view attributes from the dictionary.
+
+        Args:
+            node_dict (dict): serialized node dict.
+        """
+        node_attrs = list(self._properties.keys()) + ['width', 'height', 'pos']
+        for name, value in node_dict.items():
+            if name in node_attrs:
+                if name == 'pos':
+                    name = 'xy_pos'
+                setattr(self, name, value)
+
+        widgets = node_dict.pop('widgets', {})
+        for name, value in widgets.items():
+            if self._widgets.get(name):
+                self._widgets[name].value = value
+
+    def isSelected(self):
+        return self.selected
+
+    def setSelected(self, selected):
+        self.selected = selected
+
+    def viewer(self):
+        return None
+
+    def scene(self):
+        return None
+
+    def delete(self):
+        pass
+
+    def _add_port(self, name, port_type, multi_port, display_name):
+        port = HeadlessPortItem(self)
+        port.name = name
+        port.port_type = port_type
+        port.multi_connection = multi_port
+        port.display_name = display_name
+        items = self._input_items if port_type == IN_PORT else self._output_items
+        # headless ports have no text item.
+        items[port] = None
+        return port
+
+    def add_input(self, name='input', multi_port=False, display_name=True):
+        return self._add_port(name, IN_PORT, multi_port, display_name)
+
+    def add_output(self, name='output', multi_port=False, display_name=True):
+        return self._add_port(name, OUT_PORT, multi_port, display_name)
+
+    def get_input_text_item(self, port_item):
+        return self._input_items.get(port_item)
+
+    def get_output_text_item(self, port_item):
+        return self._output_items.get(port_item)
+
+    def add_widget(self, widget):
+        self._widgets[widget.name] = widget
+
+    def draw_node(self):
+        pass
+
+    def post_init(self, viewer=None, pos=None):
+        pass
+
+    def adjustSize(self):
+        pass
+
+    def setResizable(self, resizable):
+        pass
+
+    def get_nodes(self, inc_intersects=False):
+        return []
+
+    def auto_resize(self, nodes=None):
+        pass
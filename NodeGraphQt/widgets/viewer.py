@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 import os
 import math
+from collections import deque
 
 from NodeGraphQt import QtGui, QtCore, QtWidgets
 from NodeGraphQt.constants import (IN_PORT, OUT_PORT,
@@ -53,6 +54,10 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self.setAcceptDrops(True)
         self.resize(1000, 800)
 
+        # optional callable(start_port, end_port) used by the acyclic check,
+        # returns True, False or None if it can't check the ports.
+        self.cycle_check = None
+
         self._pipe_layout = PIPE_LAYOUT_CURVED
         self._detached_port = None
         self._start_port = None
@@ -557,18 +562,24 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             bool: True if port connection is valid.
         """
+        if self.cycle_check is not None:
+            valid = self.cycle_check(start_port, end_port)
+            if valid is not None:
+                return valid
+
         start_node = start_port.node
-        check_nodes = [end_port.node]
+        check_nodes = deque([end_port.node])
+        visited = {end_port.node}
         io_types = {IN_PORT: 'outputs', OUT_PORT: 'inputs'}
         while check_nodes:
-            check_node = check_nodes.pop(0)
+            check_node = check_nodes.popleft()
             for check_port in getattr(check_node, io_types[end_port.port_type]):
-                if check_port.connected_ports:
-                    for port in check_port.connected_ports:
-                        if port.node != start_node:
-                            check_nodes.append(port.node)
-                        else:
-                            return False
+                for port in check_port.connected_ports:
+                    if port.node == start_node:
+                        return False
+                    if port.node not in visited:
+                        visited.add(port.node)
+                        check_nodes.append(port.node)
         return True
 
     # --- viewer ---
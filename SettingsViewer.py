@@ -21,6 +21,11 @@ class SettingsViewer(object):
 
         self.updateSerializationFoldersList()
 
+        self.widget.interpretGraphsCheckBox.setChecked(self.visualScripting.interpretGraphs)
+        self.widget.interpretGraphsCheckBox.toggled.connect(self.onInterpretGraphsToggled)
+        self.widget.executionTimeoutSpinBox.setValue(self.visualScripting.executionTimeout)
+        self.widget.executionTimeoutSpinBox.valueChanged.connect(self.onExecutionTimeoutChanged)
+
         self.setupAsDockWidget(parent)
 
     def updateSerializationFoldersList(self):
@@ -61,6 +66,12 @@ class SettingsViewer(object):
         except Exception as e:
             QMessageBox.warning(self.widget, "Warning", f'Failed to delete folder. Reason: {str(e)}')
 
+    def onInterpretGraphsToggled(self, checked):
+        self.visualScripting.interpretGraphs = checked
+
+    def onExecutionTimeoutChanged(self, value):
+        self.visualScripting.executionTimeout = value
+
     def setupAsDockWidget(self, parent):
         self.dockWidget = QtWidgets.QDockWidget("Visual Scripting Settings", parent)
         self.dockWidget.setWidget(self.widget)
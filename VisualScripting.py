@@ -1,8 +1,19 @@
 from node_exec.GraphManager import GraphManager
 
 class VisualScripting(object):
-    def __init__(self, graphSerializationFolders, codeGenerator=None):
-        self.graphManager = GraphManager(graphSerializationFolders, codeGenerator=codeGenerator)
+    def __init__(self, graphSerializationFolders, codeGenerator=None, catalogPath=None):
+        self.graphManager = GraphManager(graphSerializationFolders, codeGenerator=codeGenerator, catalogPath=catalogPath)
+
+        # Execute graphs in the editor with the graph interpreter instead of the generated code (see ExecutionService.start):
+        self.interpretGraphs = False
+        # Seconds after which the execution of a graph in the editor is cancelled, 0 for no timeout:
+        self.executionTimeout = 0
+
+    def close(self):
+        """
+        Closes the graph catalog of the graph manager.
+        """
+        self.graphManager.close()
 
     def save(self, settings, dbManager):
         """
@@ -13,6 +24,8 @@ class VisualScripting(object):
             - dbManager: MongoDBManager
         """
         settings.setValue("graph_serialization_folders", self.graphManager.serializationFolders)
+        settings.setValue("interpret_graphs", self.interpretGraphs)
+        settings.setValue("execution_timeout", self.executionTimeout)
 
     def load(self, settings, dbManager):
         """
@@ -25,4 +38,16 @@ class VisualScripting(object):
         graphSerializationFolders = settings.value("graph_serialization_folders")
 
         if graphSerializationFolders != None:
-            self.graphManager.setSerializationFolders(graphSerializationFolders)
\ No newline at end of file
+            self.graphManager.setSerializationFolders(graphSerializationFolders)
+
+        interpretGraphs = settings.value("interpret_graphs")
+        if interpretGraphs != None:
+            # Some settings formats store booleans as strings:
+            self.interpretGraphs = interpretGraphs in [True, "true"]
+
+        executionTimeout = settings.value("execution_timeout")
+        if executionTimeout != None:
+            try:
+                self.executionTimeout = max(0, int(executionTimeout))
+            except ValueError:
+                print(f"Note: Invalid execution timeout in the settings: {executionTimeout}")
\ No newline at end of file
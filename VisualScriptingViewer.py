@@ -27,6 +27,7 @@ from PySide2.QtCore import QThreadPool
 from VisualScripting import VisualScripting
 from PySide2.QtWidgets import QMessageBox
 from SettingsViewer import SettingsViewer
+from ExecutionService import ExecutionService
 from typing import List
 from VisualScripting import asset_manager
 
@@ -37,6 +38,7 @@ class VisualScriptingViewer(QtCore.QObject):
         self.graph = NodeGraph()
         self.graphViewer = self.graph.viewer()
 
+        self.visualScripting = visualScripting
         self.graphManager = visualScripting.graphManager
 
         self.initNodes()
@@ -59,6 +61,33 @@ class VisualScriptingViewer(QtCore.QObject):
         self.settingsViewer = SettingsViewer(self.window, visualScripting)
         self.setupDockWidget(self.settingsViewer.dockWidget)
 
+        self.setupExecutionService()
+
+    def setupExecutionService(self):
+        self.outputTextEdit = QtWidgets.QPlainTextEdit()
+        self.outputTextEdit.setReadOnly(True)
+        self.outputDockWidget = QtWidgets.QDockWidget("Output", self.window)
+        self.outputDockWidget.setObjectName("visualScriptingOutputDockWidget")
+        self.outputDockWidget.setWidget(self.outputTextEdit)
+        self.setupDockWidget(self.outputDockWidget)
+
+        self.executionService = ExecutionService(self.graphManager)
+        self.executionService.outputWritten.connect(lambda text: self.outputTextEdit.insertPlainText(text))
+        self.executionService.nodeExecuted.connect(self.onNodeExecuted)
+        self.executionService.finished.connect(lambda result: self.onExecutionEnded(f"Finished. Result: {result}"))
+        self.executionService.failed.connect(lambda exitCode: self.onExecutionEnded(f"Failed with exit code {exitCode}."))
+        self.executionService.cancelled.connect(lambda: self.onExecutionEnded("Cancelled."))
+        self.executionService.timedOut.connect(lambda: self.onExecutionEnded("Timed out."))
+
+    def onNodeExecuted(self, nodeId):
+        node = self.graph.get_node_by_id(nodeId)
+        if node != None:
+            self.outputDockWidget.setWindowTitle(f"Output - Running: {node.name()}")
+
+    def onExecutionEnded(self, message):
+        self.outputTextEdit.appendPlainText(message)
+        self.outputDockWidget.setWindowTitle("Output")
+
     def onOpenInVisualStudioCode(self):
         QThreadPool.globalInstance().start(core.LambdaTask(self.openInVisualStudioCode))
         
@@ -157,6 +186,10 @@ class VisualScriptingViewer(QtCore.QObject):
         self.runAction.triggered.connect(self.onRun)
         self.runAction.setShortcut(QtGui.QKeySequence("R"))
 
+        self.cancelRunAction = QtWidgets.QAction("Cancel Run")
+        self.cancelRunAction.triggered.connect(self.onCancelRun)
+        self.cancelRunAction.setShortcut(QtGui.QKeySequence("Shift+R"))
+
         self.openInCode = QtWidgets.QAction("Show Code In Visual Studio Code")
         self.openInCode.triggered.connect(self.onOpenInVisualStudioCode)
         self.openInCode.setShortcut(QtGui.QKeySequence("Q"))
@@ -165,6 +198,7 @@ class VisualScriptingViewer(QtCore.QObject):
         sessionMenu.addAction(self.saveAsAction)
         sessionMenu.addAction(self.loadAction)
         sessionMenu.addAction(self.runAction)
+        sessionMenu.addAction(self.cancelRunAction)
         sessionMenu.addAction(self.openInCode)
         self.sessionMenu = sessionMenu
 
@@ -174,10 +208,18 @@ class VisualScriptingViewer(QtCore.QObject):
         self.window.verticalLayout.insertWidget(0, menuBar)
 
     def onRun(self):
-        if self.graphManager.curSession != None:
-            self.graphManager.executeGraph()
-        else:
+        if self.graphManager.curSession == None:
             QMessageBox.critical(None, "Unsaved state", "Please save the graph first.")
+        elif self.executionService.isRunning:
+            QMessageBox.information(None, "Running", "The graph is already running.")
+        else:
+            self.outputTextEdit.clear()
+            self.outputDockWidget.show()
+            timeout = self.visualScripting.executionTimeout
+            self.executionService.start(timeout=timeout if timeout > 0 else None, interpret=self.visualScripting.interpretGraphs)
+
+    def onCancelRun(self):
+        self.executionService.cancel()
         
     def setupCategoryComboBox(self, comboBox):
         categories = self.graphManager.graphCategoryToNamesMap.keys()
@@ -346,8 +388,11 @@ if __name__ == '__main__':
 
     saveDataFolder = os.path.join(os.path.dirname(os.path.realpath(__file__)), "VisualScripting_SaveData")
     
-    visualScripting = VisualScripting([saveDataFolder])
+    catalogPath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "VisualScripting_Catalog.sqlite")
+    
+    visualScripting = VisualScripting([saveDataFolder], catalogPath=catalogPath)
     visualScriptingViewer = VisualScriptingViewer(visualScripting)
     visualScriptingViewer.window.show()
 
     app.exec_()
+    visualScripting.close()
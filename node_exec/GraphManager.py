@@ -2,14 +2,39 @@
 Manages serialized visual graphs and their execution models.
 """
 
-import node_exec.code_generator
+from node_exec.code_cache import CompiledCodeCache
 import os
 import json
 import sys
 import importlib
+import hashlib
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
+def writeFileIfChanged(filePath, content):
+    """
+    Writes the content to the file unless the file already has the same content.
+    Keeps the modification time of unchanged files.
+
+    Returns:
+        bool: True if the file was written.
+    """
+    try:
+        with open(filePath, "r") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+
+    with open(filePath, "w+") as f:
+        f.write(content)
+
+    return True
+
 class GraphSettings(object):
     def __init__(self, name, category, startNodeName, graphFolder):
         """Stores that settings of a visual scripting graph.
@@ -60,14 +85,16 @@ class GraphSettings(object):
     def getGraphId(graphName, graphCategory):
         return f'{graphCategory}_{graphName}'
 
+    def serialize(self):
+        settings = dict()
+        settings["name"] = self.name
+        settings["startNodeName"] = self.startNodeName
+        settings["category"] = self.category
+        return json.dumps(settings)
+
     def save(self, settingsPath):
         try:
-            settings = dict()
-            settings["name"] = self.name
-            settings["startNodeName"] = self.startNodeName
-            settings["category"] = self.category
-            with open(settingsPath, mode='w+') as f:
-                json.dump(settings, f)
+            writeFileIfChanged(settingsPath, self.serialize())
         except Exception as e:
             print(e)
 
@@ -76,18 +103,489 @@ class Session(object):
         self.graphSettings = graphSettings
         self.graph = graph
 
+SETTINGS_FILE_SUFFIX = "_settings.json"
+
+def getDirectoryMtimes(graphsFolder, settingsPaths=None):
+    """
+    Returns the modification times of the graphs folder, its category folders and the settings files
+    of the graph folders. Adding, removing or editing a graph changes the result, including a settings
+    file that is written after its graph folder was scanned.
+
+    Args:
+        graphsFolder (str): The graphs folder of a serialization folder.
+        settingsPaths (list): Optional list the paths of the settings files are appended to.
+    """
+    mtimes = dict()
+    try:
+        mtimes[graphsFolder] = os.stat(graphsFolder).st_mtime_ns
+    except OSError:
+        return mtimes
+
+    # The graphs folder contains the category folders which contain the graph folders:
+    categoryFolders = []
+    try:
+        with os.scandir(graphsFolder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    mtimes[entry.path] = entry.stat().st_mtime_ns
+                    categoryFolders.append(entry.path)
+    except OSError:
+        pass
+
+    for categoryFolder in categoryFolders:
+        try:
+            with os.scandir(categoryFolder) as entries:
+                graphFolders = [entry for entry in entries if entry.is_dir()]
+        except OSError:
+            continue
+
+        for graphFolder in graphFolders:
+            settingsPath = os.path.join(graphFolder.path, graphFolder.name + SETTINGS_FILE_SUFFIX)
+            try:
+                mtimes[settingsPath] = os.stat(settingsPath).st_mtime_ns
+            except OSError:
+                continue
+
+            if settingsPaths != None:
+                settingsPaths.append(settingsPath)
+
+    return mtimes
+
+class FolderCatalog(object):
+    def __init__(self, graphsFolder):
+        """The settings of the graphs in one graphs folder.
+
+        The folder is only scanned again if the modification time of a folder or settings file in it changed
+        (see getDirectoryMtimes).
+
+        Args:
+            graphsFolder (str): The graphs folder of a serialization folder.
+        """
+        self.graphsFolder = graphsFolder
+        self.graphSettings = dict()
+        self.directoryMtimes = None
+
+    def scan(self):
+        """
+        Scans the graphs folder if it changed since the last scan. Doesn't change the catalog, so it can run on another thread.
+
+        Returns:
+            tuple: The directory mtimes and the graph settings keyed by (category, name) or None if the folder didn't change.
+        """
+        settingsPaths = []
+        mtimes = getDirectoryMtimes(self.graphsFolder, settingsPaths)
+        if mtimes == self.directoryMtimes:
+            return None
+
+        graphSettings = dict()
+        for graphSettingsPath in settingsPaths:
+            settings = GraphSettings.loadFromSettings(graphSettingsPath)
+            if settings != None:
+                graphSettings[(settings.category, settings.name)] = settings
+
+        return mtimes, graphSettings
+
+class GraphCatalog(object):
+    def __init__(self, validationInterval=1.0):
+        """An in-memory index of the graph settings in the graphs folders keyed by (category, name).
+
+        Queries only read the index. The folders are checked for changes at most once per validation interval.
+        Folders that are already in the index are checked on a background thread and the changes are swapped in
+        when the check is done, so the queries of the editor don't wait for the file system. New folders are
+        scanned before the query returns. Graphs saved by the GraphManager are added directly.
+
+        Args:
+            validationInterval (float): The minimum time in seconds between two checks of the folders.
+        """
+        self.validationInterval = validationInterval
+        self.folderCatalogs = dict()
+        self.graphsFolders = []
+        self.lastValidationTime = None
+        self.lock = threading.RLock()
+        self.refreshLock = threading.Lock()
+        self.refreshThread = None
+
+        # Graphs added while a refresh is running, the refresh must not drop them:
+        self.addedGraphs = []
+
+        # Merged over all folders, the first folder containing a graph wins:
+        self.graphSettings = dict()
+        self.graphIds = set()
+
+    def waitForRefresh(self):
+        refreshThread = self.refreshThread
+        if refreshThread != None:
+            refreshThread.join()
+
+    def invalidate(self):
+        """
+        Forces a scan of all folders on the next query.
+        """
+        with self.lock:
+            self.lastValidationTime = None
+            for folderCatalog in self.folderCatalogs.values():
+                folderCatalog.directoryMtimes = None
+
+    def update(self, graphsFolders):
+        with self.lock:
+            curTime = time.monotonic()
+            if graphsFolders == self.graphsFolders and self.lastValidationTime != None and \
+               curTime - self.lastValidationTime < self.validationInterval:
+                return
+
+            isChanged = graphsFolders != self.graphsFolders
+            folderCatalogs = dict((f, self.folderCatalogs.get(f) or FolderCatalog(f)) for f in graphsFolders)
+            newFolders = [f for f in graphsFolders if not f in self.folderCatalogs]
+            knownFolders = [f for f in graphsFolders if f in self.folderCatalogs]
+
+            self.folderCatalogs = folderCatalogs
+            self.graphsFolders = list(graphsFolders)
+            self.lastValidationTime = curTime
+            if isChanged:
+                self.merge()
+
+        if len(newFolders) > 0:
+            self.refresh(newFolders)
+
+        with self.lock:
+            if len(knownFolders) > 0 and (self.refreshThread == None or not self.refreshThread.is_alive()):
+                self.refreshThread = threading.Thread(target=self.refresh, args=(knownFolders,), daemon=True)
+                self.refreshThread.start()
+
+    def refresh(self, graphsFolders):
+        """
+        Scans the graphs folders and swaps the changed folders into the catalog.
+        """
+        # Only one refresh runs at a time, each one keeps the graphs added since its start:
+        with self.refreshLock:
+            self.refreshFolders(graphsFolders)
+
+    def refreshFolders(self, graphsFolders):
+        with self.lock:
+            folderCatalogs = [self.folderCatalogs[f] for f in graphsFolders if f in self.folderCatalogs]
+            self.addedGraphs = []
+
+        results = [folderCatalog.scan() for folderCatalog in folderCatalogs]
+
+        with self.lock:
+            isChanged = False
+            for folderCatalog, result in zip(folderCatalogs, results):
+                # Skip folders that were removed in the meantime:
+                if result == None or self.folderCatalogs.get(folderCatalog.graphsFolder) is not folderCatalog:
+                    continue
+
+                folderCatalog.directoryMtimes, folderCatalog.graphSettings = result
+                isChanged = True
+
+            if isChanged:
+                for graphsFolder, settings in self.addedGraphs:
+                    folderCatalog = self.folderCatalogs.get(graphsFolder)
+                    if folderCatalog != None:
+                        folderCatalog.graphSettings[(settings.category, settings.name)] = settings
+                self.merge()
+
+            self.addedGraphs = []
+
+    def merge(self):
+        graphSettings = dict()
+        for graphsFolder in self.graphsFolders:
+            for key, settings in self.folderCatalogs[graphsFolder].graphSettings.items():
+                graphSettings.setdefault(key, settings)
+
+        # Queries may run concurrently to a refresh, the results are replaced instead of changed:
+        self.graphIds = set(s.id for s in graphSettings.values())
+        self.graphSettings = graphSettings
+
+    def add(self, graphsFolder, settings : GraphSettings, settingsPath):
+        with self.lock:
+            folderCatalog = self.folderCatalogs.get(graphsFolder)
+            if folderCatalog != None:
+                folderCatalog.graphSettings[(settings.category, settings.name)] = settings
+                self.addedGraphs.append((graphsFolder, settings))
+                self.merge()
+
+    def getAllGraphSettings(self, graphsFolders) -> List[GraphSettings]:
+        self.update(graphsFolders)
+        return list(self.graphSettings.values())
+
+    def getGraphSettings(self, graphsFolders, graphName, category):
+        self.update(graphsFolders)
+        return self.graphSettings.get((category, graphName))
+
+    def getGraphIds(self, graphsFolders):
+        self.update(graphsFolders)
+        return self.graphIds
+
+    def containsGraph(self, graphsFolders, graphName, category):
+        self.update(graphsFolders)
+        return (category, graphName) in self.graphSettings
+
+    def close(self):
+        self.waitForRefresh()
+
+def scanGraphsFolder(graphsFolder, directoryMtimes, knownGraphs):
+    """Scans the graphs folder for graph settings unless it didn't change since the last scan.
+
+    Args:
+        graphsFolder (str): The graphs folder of a serialization folder.
+        directoryMtimes (dict): The result of getDirectoryMtimes at the last scan or None.
+        knownGraphs (dict): Maps the settings paths of the last scan to their (mtime, category, name, startNodeName).
+                            Unchanged settings files are not read again.
+
+    Returns:
+        tuple: The directory mtimes and a list of (path, mtime, category, name, startNodeName) or None if the folder didn't change.
+    """
+    settingsPaths = []
+    mtimes = getDirectoryMtimes(graphsFolder, settingsPaths)
+    if mtimes == directoryMtimes:
+        return None
+
+    graphs = []
+    for path in settingsPaths:
+        mtime = mtimes[path]
+        knownGraph = knownGraphs.get(path)
+        if knownGraph != None and knownGraph[0] == mtime:
+            graphs.append((path,) + knownGraph)
+            continue
+
+        settings = GraphSettings.loadFromSettings(path)
+        if settings != None:
+            graphs.append((path, mtime, settings.category, settings.name, settings.startNodeName))
+
+    return mtimes, graphs
+
+class GraphCatalogDatabase(object):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS folders (
+            graphsFolder TEXT PRIMARY KEY,
+            directoryMtimes TEXT
+        );
+        CREATE TABLE IF NOT EXISTS graphs (
+            graphsFolder TEXT NOT NULL,
+            path TEXT NOT NULL,
+            mtime INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            name TEXT NOT NULL,
+            startNodeName TEXT,
+            PRIMARY KEY (graphsFolder, path)
+        );
+        CREATE INDEX IF NOT EXISTS graphsByName ON graphs (category, name);
+    """
+
+    def __init__(self, databasePath, validationInterval=1.0):
+        """A persistent index of the graph settings in the graphs folders, stored in a SQLite database.
+
+        Has the interface of the GraphCatalog. Queries only read the database. The graphs folders are scanned
+        concurrently by one thread per folder, at most once per validation interval. Folders that are already
+        in the database are scanned in the background, so slow folders (e.g. on network mounts) don't delay queries.
+        New folders are scanned before the query returns.
+
+        Args:
+            databasePath (str): The path of the database file.
+            validationInterval (float): The minimum time in seconds between two scans of the folders.
+        """
+        self.databasePath = databasePath
+        self.validationInterval = validationInterval
+        self.graphsFolders = []
+        self.lastValidationTime = None
+        self.lock = threading.RLock()
+        self.refreshThread = None
+
+        # Graphs added while a refresh is running, the refresh must not drop them:
+        self.addedGraphs = []
+
+        self.connection = sqlite3.connect(databasePath, timeout=30.0, check_same_thread=False)
+        self.connection.executescript(GraphCatalogDatabase.SCHEMA)
+
+    def close(self):
+        self.waitForRefresh()
+        with self.lock:
+            self.connection.close()
+
+    def waitForRefresh(self):
+        refreshThread = self.refreshThread
+        if refreshThread != None:
+            refreshThread.join()
+
+    def invalidate(self):
+        """
+        Forces a scan of all folders on the next query.
+        """
+        with self.lock, self.connection:
+            self.lastValidationTime = None
+            self.connection.execute("UPDATE folders SET directoryMtimes = NULL")
+
+    def getKnownFolders(self, graphsFolders):
+        with self.lock:
+            rows = self.connection.execute("SELECT graphsFolder FROM folders").fetchall()
+
+        knownFolders = set(row[0] for row in rows)
+        return [f for f in graphsFolders if f in knownFolders]
+
+    def update(self, graphsFolders):
+        with self.lock:
+            curTime = time.monotonic()
+            if graphsFolders == self.graphsFolders and self.lastValidationTime != None and \
+               curTime - self.lastValidationTime < self.validationInterval:
+                return
+
+            self.graphsFolders = list(graphsFolders)
+            self.lastValidationTime = curTime
+
+        knownFolders = self.getKnownFolders(graphsFolders)
+        newFolders = [f for f in graphsFolders if not f in knownFolders]
+        if len(newFolders) > 0:
+            self.refresh(newFolders)
+
+        with self.lock:
+            if len(knownFolders) > 0 and (self.refreshThread == None or not self.refreshThread.is_alive()):
+                self.refreshThread = threading.Thread(target=self.refresh, args=(knownFolders,), daemon=True)
+                self.refreshThread.start()
+
+    def refresh(self, graphsFolders):
+        """
+        Scans the graphs folders concurrently and stores the changes in the database.
+        """
+        with self.lock:
+            directoryMtimes = dict()
+            for graphsFolder, mtimes in self.connection.execute("SELECT graphsFolder, directoryMtimes FROM folders"):
+                directoryMtimes[graphsFolder] = json.loads(mtimes) if mtimes != None else None
+
+            knownGraphs = dict((f, dict()) for f in graphsFolders)
+            for graphsFolder, path, mtime, category, name, startNodeName in self.connection.execute(
+                "SELECT graphsFolder, path, mtime, category, name, startNodeName FROM graphs"):
+                if graphsFolder in knownGraphs:
+                    knownGraphs[graphsFolder][path] = (mtime, category, name, startNodeName)
+
+            self.addedGraphs = []
+
+        with ThreadPoolExecutor(max_workers=len(graphsFolders)) as executor:
+            results = list(executor.map(lambda f: scanGraphsFolder(f, directoryMtimes.get(f), knownGraphs[f]), graphsFolders))
+
+        with self.lock, self.connection:
+            for graphsFolder, result in zip(graphsFolders, results):
+                if result == None:
+                    continue
+
+                mtimes, graphs = result
+                self.connection.execute("DELETE FROM graphs WHERE graphsFolder = ?", (graphsFolder,))
+                self.connection.executemany("INSERT OR REPLACE INTO graphs VALUES (?, ?, ?, ?, ?, ?)",
+                                            [(graphsFolder,) + graph for graph in graphs])
+                self.connection.execute("INSERT OR REPLACE INTO folders VALUES (?, ?)", (graphsFolder, json.dumps(mtimes)))
+
+            self.connection.executemany("INSERT OR REPLACE INTO graphs VALUES (?, ?, ?, ?, ?, ?)", self.addedGraphs)
+            self.addedGraphs = []
+
+    def add(self, graphsFolder, settings : GraphSettings, settingsPath):
+        try:
+            mtime = os.stat(settingsPath).st_mtime_ns
+        except OSError:
+            return
+
+        # The path is stored like the scans find it, otherwise the next scan adds a second row for the graph:
+        settingsPath = os.path.join(graphsFolder, settings.relativePath, settings.name + SETTINGS_FILE_SUFFIX)
+        graph = (graphsFolder, settingsPath, mtime, settings.category, settings.name, settings.startNodeName)
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM graphs WHERE graphsFolder = ? AND category = ? AND name = ?",
+                                    (graphsFolder, settings.category, settings.name))
+            self.connection.execute("INSERT OR REPLACE INTO graphs VALUES (?, ?, ?, ?, ?, ?)", graph)
+            self.addedGraphs.append(graph)
+
+    def queryGraphSettings(self, graphsFolders, condition="", params=()):
+        """
+        Returns the graph settings of the folders that match the SQL condition keyed by (category, name).
+        """
+        self.update(graphsFolders)
+
+        placeholders = ", ".join("?" * len(graphsFolders))
+        with self.lock:
+            rows = self.connection.execute(f"SELECT graphsFolder, path, category, name, startNodeName FROM graphs "
+                                           f"WHERE graphsFolder IN ({placeholders}){condition}", tuple(graphsFolders) + params).fetchall()
+
+        # The first folder containing a graph wins:
+        folderIndices = dict((f, i) for i, f in enumerate(graphsFolders))
+        graphSettings = dict()
+        for _, path, category, name, startNodeName in sorted(rows, key=lambda row: folderIndices[row[0]]):
+            if not (category, name) in graphSettings:
+                graphSettings[(category, name)] = GraphSettings(name, category, startNodeName, Path(os.path.dirname(path)).parent.parent)
+
+        return graphSettings
+
+    def getAllGraphSettings(self, graphsFolders) -> List[GraphSettings]:
+        return list(self.queryGraphSettings(graphsFolders).values())
+
+    def getGraphSettings(self, graphsFolders, graphName, category):
+        return self.queryGraphSettings(graphsFolders, " AND category = ? AND name = ?", (category, graphName)).get((category, graphName))
+
+    def getGraphIds(self, graphsFolders):
+        return set(s.id for s in self.queryGraphSettings(graphsFolders).values())
+
+    def containsGraph(self, graphsFolders, graphName, category):
+        self.update(graphsFolders)
+
+        placeholders = ", ".join("?" * len(graphsFolders))
+        with self.lock:
+            row = self.connection.execute(f"SELECT 1 FROM graphs WHERE category = ? AND name = ? AND graphsFolder IN ({placeholders}) LIMIT 1",
+                                          (category, graphName) + tuple(graphsFolders)).fetchone()
+
+        return row != None
+
 class GraphManager(object):
     GRAPHS_FOLDER = "Graphs"
 
-    def __init__(self, serializationFolders, codeGenerator = None):
+    def __init__(self, serializationFolders, codeGenerator = None, compileInMemory = True, useCodeCacheFiles = False, catalogPath = None):
+        """
+        Args:
+            serializationFolders (list): The folders that contain the graphs folder.
+            codeGenerator (CodeGenerator): The code generator for the graph modules.
+                                           The default generator is created on first use (see getCodeGenerator).
+            compileInMemory (bool): If True graph modules are compiled in memory and executed without the import system.
+                                    Otherwise their folder is added to sys.path and they are imported.
+            useCodeCacheFiles (bool): If True the compiled code of in memory modules is additionally stored next to the graph.
+            catalogPath (str): Optional path of a SQLite database that stores the catalog of the graphs between sessions
+                               (see GraphCatalogDatabase). Otherwise the catalog is only kept in memory.
+        """
         self.codeGenerator = codeGenerator
-        if codeGenerator == None:
-            self.codeGenerator = node_exec.code_generator.CodeGenerator()
+        self.graphCatalog = GraphCatalog() if catalogPath == None else GraphCatalogDatabase(catalogPath)
 
         self.setSerializationFolders(serializationFolders)
 
         self.curSession = None
 
+        # Content hashes of the saved graphs (graph file path -> hash) and the modules of executed graphs
+        # (python file path -> (source hash or modification time, module)). Used to skip unnecessary saves and reloads.
+        self.graphContentHashes = dict()
+        self.executedModules = dict()
+
+        self.compileInMemory = compileInMemory
+        self.useCodeCacheFiles = useCodeCacheFiles
+        self.compiledCodeCache = CompiledCodeCache()
+        self.generatedSources = dict()
+        self.progressSources = dict()
+        self.graphInterpreter = None
+
+    def close(self):
+        """
+        Closes the graph catalog. Waits for a running scan of the catalog to finish.
+        """
+        self.graphCatalog.close()
+
+    def getCodeGenerator(self):
+        # The code generator and the interpreter import the node modules of the editor, which load Qt.
+        # They are only imported when needed, so saved graphs can be executed without them.
+        if self.codeGenerator == None:
+            import node_exec.code_generator
+            self.codeGenerator = node_exec.code_generator.CodeGenerator(incremental=True)
+
+        return self.codeGenerator
+
+    def getGraphInterpreter(self):
+        if self.graphInterpreter == None:
+            from node_exec.graph_interpreter import GraphInterpreter
+            self.graphInterpreter = GraphInterpreter()
+
+        return self.graphInterpreter
+
     def normpath(self, path):
         return os.path.normpath(os.path.normcase(path))
 
@@ -141,19 +639,14 @@ class GraphManager(object):
         except Exception as e:
             print(str(e))
     
-    def retrieveAvailableGraphSettings(self) -> List[GraphSettings]:
-        graphSettings = []
-        for serializationFolder in self.serializationFolders:
-            graphFolder = os.path.join(serializationFolder, GraphManager.GRAPHS_FOLDER)
-            for graphSettingsPath in Path(graphFolder).rglob("*_settings.json"):
-                settings = GraphSettings.loadFromSettings(graphSettingsPath)
-                if settings != None:
-                    graphSettings.append(settings)
+    def getGraphsFolders(self):
+        return [self.normpath(os.path.join(f, GraphManager.GRAPHS_FOLDER)) for f in self.serializationFolders]
 
-        return graphSettings
+    def retrieveAvailableGraphSettings(self) -> List[GraphSettings]:
+        return self.graphCatalog.getAllGraphSettings(self.getGraphsFolders())
 
     def retrieveAvailableGraphIds(self):
-        return [s.id for s in self.retrieveAvailableGraphSettings()]
+        return list(self.graphCatalog.getGraphIds(self.getGraphsFolders()))
 
     @property
     def graphCategoryToNamesMap(self):
@@ -180,8 +673,12 @@ class GraphManager(object):
         moduleName = self.getModuleNameFromGraphName(graphSettings.name)
         return os.path.join(self.getGraphDataFolder(graphSettings), moduleName + ".py")
 
+    def getCodeCachePath(self, graphSettings : GraphSettings):
+        moduleName = self.getModuleNameFromGraphName(graphSettings.name)
+        return os.path.join(self.getGraphDataFolder(graphSettings), moduleName + ".codecache")
+
     def getSettingsPath(self, graphSettings : GraphSettings):
-        return os.path.join(self.getGraphDataFolder(graphSettings), graphSettings.name + "_settings.json")
+        return os.path.join(self.getGraphDataFolder(graphSettings), graphSettings.name + SETTINGS_FILE_SUFFIX)
 
     def getSessionGraphName(self):
         return self.curSession.graphSettings.name if self.curSession != None else ""
@@ -204,29 +701,56 @@ class GraphManager(object):
             self.saveGraph(self.curSession.graph, s.visualScriptingSerializationFolder, s.name, s.category, s.startNodeName)
 
     def doesGraphExist(self, graphName, graphCategory):
-        graphId = GraphSettings.getGraphId(graphName, graphCategory)
-
-        if graphId in self.retrieveAvailableGraphIds() and (self.curSession == None or self.curSession.graphSettings.name != graphName):
+        if self.graphCatalog.containsGraph(self.getGraphsFolders(), graphName, graphCategory) and \
+           (self.curSession == None or self.curSession.graphSettings.name != graphName):
             return True
-        
+
         return False
 
+    def getGraphContentHash(self, serializedGraph, settings : GraphSettings):
+        content = serializedGraph + settings.serialize()
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
     def saveGraph(self, graph, visualScriptingSerializationFolder, graphName, graphCategory, startNodeName):
+        """
+        Saves the graph, its settings and the generated python code.
+        Nothing is written if the graph and settings did not change since the last save.
+
+        Returns:
+            bool: True if the graph was saved, False if it was unchanged.
+        """
         graphFolder = os.path.join(visualScriptingSerializationFolder, GraphManager.GRAPHS_FOLDER)
         settings = GraphSettings(graphName, graphCategory, startNodeName, graphFolder)
+        self.curSession = Session(settings, graph)
+
+        graphFilePath = self.getGraphFilePath(settings)
+        serializedGraph = "".join(graph.iter_serialized_json(indent=2, separators=(',', ':')))
+        contentHash = self.getGraphContentHash(serializedGraph, settings)
+        if self.graphContentHashes.get(graphFilePath) == contentHash and os.path.isfile(graphFilePath) and \
+           os.path.isfile(self.getPythonCodePath(settings)) and os.path.isfile(self.getSettingsPath(settings)):
+            return False
 
         graphFolder = self.getGraphDataFolder(settings)
         self.mkDir(graphFolder)
 
-        graph.save_session(self.getGraphFilePath(settings))
+        writeFileIfChanged(graphFilePath, serializedGraph)
         startNode = graph.get_node_by_name(startNodeName)
-        moduleName = self.getModuleNameFromGraphName(graphName)
-        self.codeGenerator.generatePythonCode(graph, graphName, startNode, moduleName, graphFolder)
+        pythonFile = self.getPythonCodePath(settings)
+        codeGenerator = self.getCodeGenerator()
+        source, progressSource = codeGenerator.generatePythonSources(graph, graphName, startNode)
+        if len(codeGenerator.prunedNodes) > 0:
+            prunedNodeNames = ", ".join(sorted(n.name() for n in codeGenerator.prunedNodes))
+            print(f"Note: The following nodes of {graphName} are not reachable from {startNodeName} and are not part of the generated code: {prunedNodeNames}")
+        writeFileIfChanged(pythonFile, source)
+        self.generatedSources[pythonFile] = source
+        self.progressSources[pythonFile] = progressSource
 
         settingsFile = self.getSettingsPath(settings)
         settings.save(settingsFile)
+        self.graphCatalog.add(self.normpath(settings.graphFolder), settings, settingsFile)
 
-        self.curSession = Session(settings, graph)
+        self.graphContentHashes[graphFilePath] = contentHash
+        return True
 
     def loadGraph(self, graph, graphName : str, category : str):
         graphSettings = self.getGraphSettings(graphName, category)
@@ -236,32 +760,99 @@ class GraphManager(object):
             self.curSession = Session(graphSettings, graph)
 
     def getGraphSettings(self, graphName : str, category : str):
-        for s in self.retrieveAvailableGraphSettings():
-            if s.name == graphName and s.category == category:
-                return s
-
-        return None
+        return self.graphCatalog.getGraphSettings(self.getGraphsFolders(), graphName, category)
         
-    def executeGraph(self):
+    def getProgressSource(self):
+        """
+        Saves the current session and returns the source of its module with progress reports
+        (see CodeGenerator.generatePythonSources). The source is created by the same pass as the saved module.
+        """
+        if self.curSession == None:
+            return None
+
+        self.saveCurrentSession()
+        return self.progressSources.get(self.getPythonCodePath(self.curSession.graphSettings))
+
+    def canInterpretCurrentSession(self):
+        """
+        Returns True if the graph interpreter supports all execution nodes of the current session (see GraphInterpreter.isSupported).
+        """
+        if self.curSession == None:
+            return False
+
+        startNode = self.curSession.graph.get_node_by_name(self.curSession.graphSettings.startNodeName)
+        return startNode != None and self.getGraphInterpreter().isSupported(startNode)
+
+    def executeGraph(self, interpret=False):
+        """
+        Executes the graph of the current session in this process and returns its result.
+        The editor executes graphs in a worker process instead (see ExecutionService).
+
+        Args:
+            interpret (bool): If True the graph is executed by the graph interpreter without saving it and
+                              without generating code. Falls back to the generated code if the graph contains
+                              nodes the interpreter does not support.
+        """
         if self.curSession == None:
             return
 
         sessionSettings = self.curSession.graphSettings
-        self.saveGraph(self.curSession.graph, sessionSettings.visualScriptingSerializationFolder, sessionSettings.name, 
-                       sessionSettings.category, startNodeName=sessionSettings.startNodeName)
+        if interpret:
+            if self.canInterpretCurrentSession():
+                startNode = self.curSession.graph.get_node_by_name(sessionSettings.startNodeName)
+                return self.getGraphInterpreter().execute(startNode)
+
+            print("Note: The graph contains nodes that can't be interpreted. Executing the generated code instead.")
+
+        isSaved = self.saveGraph(self.curSession.graph, sessionSettings.visualScriptingSerializationFolder, sessionSettings.name, 
+                                 sessionSettings.category, startNodeName=sessionSettings.startNodeName)
 
         sessionSettings = self.curSession.graphSettings
-        moduleName = self.getModuleNameFromGraphName(sessionSettings.name)
         pythonFile = self.getPythonCodePath(sessionSettings)
+
+        # Reuse the loaded module if the graph is unchanged since it was loaded:
+        executedModule = self.executedModules.get(pythonFile)
+        if executedModule != None and not isSaved:
+            return executedModule[1].execute()
+
+        if self.compileInMemory:
+            execModule = self.createModule(sessionSettings, executedModule)
+        else:
+            execModule = self.importModule(sessionSettings, executedModule)
+
+        return execModule.execute()
+
+    def createModule(self, graphSettings : GraphSettings, executedModule):
+        pythonFile = self.getPythonCodePath(graphSettings)
+        source = self.generatedSources.get(pythonFile)
+        if source == None:
+            with open(pythonFile, "r") as f:
+                source = f.read()
+
+        sourceHash = CompiledCodeCache.getSourceHash(source)
+        if executedModule != None and executedModule[0] == sourceHash:
+            return executedModule[1]
+
+        moduleName = self.getModuleNameFromGraphName(graphSettings.name)
+        cacheFilePath = self.getCodeCachePath(graphSettings) if self.useCodeCacheFiles else None
+        execModule = self.compiledCodeCache.createModule(source, moduleName, pythonFile, cacheFilePath)
+        self.executedModules[pythonFile] = (sourceHash, execModule)
+        return execModule
+
+    def importModule(self, graphSettings : GraphSettings, executedModule):
+        # The python file is only rewritten if its content changed:
+        pythonFile = self.getPythonCodePath(graphSettings)
+        mtime = os.stat(pythonFile).st_mtime_ns
+        if executedModule != None and executedModule[0] == mtime:
+            return executedModule[1]
+
         pathonFileDir = os.path.dirname(pythonFile)
 
         if not pathonFileDir in sys.path:
             sys.path.append(pathonFileDir)
 
+        moduleName = self.getModuleNameFromGraphName(graphSettings.name)
         execModule = importlib.import_module(moduleName)
         importlib.reload(execModule)
-        return execModule.execute()
-
-
-
-        
\ No newline at end of file
+        self.executedModules[pythonFile] = (mtime, execModule)
+        return execModule
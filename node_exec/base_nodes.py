@@ -56,6 +56,22 @@ class BaseCustomNode(BaseNode):
     @property
     def isScriptingNode(self):
         return True
+
+    @property
+    def isPure(self):
+        """
+        Pure nodes have no side effects and their results only depend on their inputs.
+        They don't create mutable objects: Their results are immutable if their inputs are immutable.
+        The code generator is allowed to evaluate their code once and share the results of immutable inputs.
+        """
+        return False
+
+    @property
+    def hasImmutableOutputs(self):
+        """
+        True if the outputs are immutable values (e.g. numbers or strings) regardless of the inputs.
+        """
+        return False
         
     @property
     def fullClassName(self):
@@ -65,6 +81,10 @@ class BaseCustomNode(BaseNode):
         return f"{self.fullClassName}.execute"
 
     def getModule(self):
+        """
+        Returns the module the generated code of the node refers to or None if the code doesn't refer to a module.
+        Generated code must only refer to modules of node_exec.runtime, which can be imported without Qt.
+        """
         return self.__class__.__module__
 
     def getDefaultInput(self, port):
@@ -172,7 +192,9 @@ class BaseCustomNode(BaseNode):
         nodeView = self.view
         portView = port.view
         portView.setParentItem(None)
-        textItem.setParentItem(None)
+        # Headless nodes have no text items:
+        if textItem != None:
+            textItem.setParentItem(None)
         del items[portView]
 
         nodeView.draw_node()
@@ -195,7 +217,10 @@ class BaseCustomNode(BaseNode):
         if port_names and source.name() in port_names:
             port_names.remove(source.name())
 
+        graph = source.node().graph
+        graph._remove_port_connection(source, target)
         source.view.disconnect_from(target.view)
+        graph.port_disconnected.emit(source, target)
 
     def add_output(self, name='output', multi_output=True, display_name=True,
                 color=DEFAULT_PORT_COLOR):
@@ -216,6 +241,10 @@ class BaseCustomNode(BaseNode):
         return port
 
     def add_button(self, name, onClick):
+        # Buttons have no property, headless nodes don't need them:
+        if self.headless():
+            return
+
         widget = NodeButton(onClick, parent=self.view, name=name)
         self.view.add_widget(widget)
 
@@ -232,12 +261,7 @@ class BaseCustomNode(BaseNode):
         """
         items = items or []
         self.create_property(name, items[0] if len(items) > 0 else None, items=items, widget_type=node.NODE_PROP_QCOMBO, tab=tab)
-
-        widget = node.NodeComboBox(self.view, name, label, items)
-        widget.value_changed.connect(lambda k, v: self.set_property(k, v))
-        self.view.add_widget(widget)
-
-        return widget
+        return self._add_property_widget(node.NodeComboBox, name, label, items)
 
     def addTextEdit(self, name='', label='', text='', tab=None):
             """
@@ -251,11 +275,7 @@ class BaseCustomNode(BaseNode):
                 tab (str): name of the widget tab to display in.
             """
             self.create_property(name, text, widget_type=NODE_PROP_QLINEEDIT, tab=tab)
-            widget = TextEditNodeWidget(self.view, name, label, text)
-            widget.value_changed.connect(lambda k, v: self.set_property(k, v))
-            self.view.add_widget(widget)
-
-            return widget
+            return self._add_property_widget(TextEditNodeWidget, name, label, text)
 
 @excludeFromRegistration
 class BaseCustomCodeNode(BaseCustomNode):
@@ -272,6 +292,9 @@ class BaseCustomCodeNode(BaseCustomNode):
     def generateCode(self, sourceCodeLines, indent):
         return 'None'
 
+    def getModule(self):
+        return None
+
 @excludeFromRegistration
 class VariableInputCountNode(BaseCustomNode):
     """
@@ -344,6 +367,9 @@ class InlineNode(BaseCustomNode):
     def getInlineCode(self):
         return 'None'
 
+    def getModule(self):
+        return None
+
 @excludeFromRegistration
 class BaseExecuteNode(BaseCustomNode):
     """
@@ -379,11 +405,11 @@ def contains_explicit_return(f):
     except:
         return False
 
-def defNode(name, isExecutable=False, returnNames=[], identifier=DEFAULT_IDENTIFIER):
+def defNode(name, isExecutable=False, returnNames=[], identifier=DEFAULT_IDENTIFIER, isPure=False, hasImmutableOutputs=False):
     """
     Decorator for functions to allow easy node creation.
     Example (isExecutable=False):
-    @defNode('Add', returnNames=['Sum'], identifier='Math')
+    @defNode('Add', returnNames=['Sum'], identifier='Math', isPure=True)
     def add(lhs, rhs):
         return lhs + rhs
 
@@ -419,6 +445,14 @@ def defNode(name, isExecutable=False, returnNames=[], identifier=DEFAULT_IDENTIF
                         defaultValue = v.default if v.default is not inspect.Parameter.empty else ''
                         self.add_input(k, default_value=(f"\"{defaultValue}\"" if isinstance(defaultValue, str) else defaultValue))
 
+            @property
+            def isPure(self):
+                return isPure
+
+            @property
+            def hasImmutableOutputs(self):
+                return hasImmutableOutputs
+
             def getFunctionName(self):
                 return f"{fn.__module__}.{fn.__name__}"
 
@@ -429,7 +463,7 @@ def defNode(name, isExecutable=False, returnNames=[], identifier=DEFAULT_IDENTIF
         return fn
     return wrapper
 
-def defInlineNode(name, isExecutable=False, returnNames=[], identifier=DEFAULT_IDENTIFIER):
+def defInlineNode(name, isExecutable=False, returnNames=[], identifier=DEFAULT_IDENTIFIER, isPure=False, hasImmutableOutputs=False):
     def wrapper(fn):
         class CustomInlineNode(InlineNode):
             __identifier__ = identifier
@@ -453,6 +487,14 @@ def defInlineNode(name, isExecutable=False, returnNames=[], identifier=DEFAULT_I
                     defaultValue = v.default if v.default is not inspect.Parameter.empty else ''
                     self.add_input(k, default_value=(f"\"{defaultValue}\"" if isinstance(defaultValue, str) else defaultValue))
 
+            @property
+            def isPure(self):
+                return isPure
+
+            @property
+            def hasImmutableOutputs(self):
+                return hasImmutableOutputs
+
             def getInlineCode(self, *args, **kwargs):
                 return fn(*args, **kwargs)
 
@@ -0,0 +1,94 @@
+"""
+Compiles generated graph modules in memory and caches their code objects.
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import types
+from collections import OrderedDict
+
+class CompiledCodeCache(object):
+    """
+    A bounded LRU cache of compiled code objects keyed by the hash of their source.
+
+    Code objects can additionally be stored in marshalled cache files. A cache file starts with
+    the magic number of the running interpreter and the source hash, so stale or foreign files are ignored.
+    """
+
+    def __init__(self, maxSize=32):
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+
+    @staticmethod
+    def getSourceHash(source):
+        return hashlib.sha1(source.encode("utf-8")).digest()
+
+    def getCode(self, source, filename, cacheFilePath=None):
+        """
+        Returns the compiled code of the source.
+
+        Args:
+            source (str): The python source code.
+            filename (str): The file name shown in tracebacks.
+            cacheFilePath (str): Optional path of a marshalled cache file to load the code from or store it in.
+        """
+        sourceHash = CompiledCodeCache.getSourceHash(source)
+        code = self.entries.get(sourceHash)
+        if code != None:
+            self.entries.move_to_end(sourceHash)
+            return code
+
+        if cacheFilePath != None:
+            code = self.loadCodeFile(cacheFilePath, sourceHash)
+
+        if code == None:
+            code = compile(source, filename, "exec")
+            if cacheFilePath != None:
+                self.saveCodeFile(cacheFilePath, sourceHash, code)
+
+        self.entries[sourceHash] = code
+        if len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+
+        return code
+
+    def getCodeFileHeader(self, sourceHash):
+        return importlib.util.MAGIC_NUMBER + sourceHash
+
+    def loadCodeFile(self, cacheFilePath, sourceHash):
+        header = self.getCodeFileHeader(sourceHash)
+        try:
+            with open(cacheFilePath, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if not data.startswith(header):
+            return None
+
+        try:
+            return marshal.loads(data[len(header):])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def saveCodeFile(self, cacheFilePath, sourceHash, code):
+        try:
+            with open(cacheFilePath, "wb") as f:
+                f.write(self.getCodeFileHeader(sourceHash) + marshal.dumps(code))
+        except OSError as e:
+            print(f"Failed to write the code cache file {cacheFilePath}: {str(e)}")
+
+    def createModule(self, source, moduleName, filename, cacheFilePath=None):
+        """
+        Creates a module from the source without going through the import system.
+        The module is not added to sys.modules.
+        """
+        return CompiledCodeCache.createModuleFromCode(self.getCode(source, filename, cacheFilePath), moduleName, filename)
+
+    @staticmethod
+    def createModuleFromCode(code, moduleName, filename):
+        module = types.ModuleType(moduleName)
+        module.__file__ = filename
+        exec(code, module.__dict__)
+        return module
@@ -2,15 +2,293 @@
 This module generates python code from a node graph.
 """
 
+import ast
+import builtins
+import weakref
 from os import path
 from typing import List
 from node_exec import base_nodes
 from node_exec import flow_nodes
 from node_exec import inline_nodes
 import VisualScripting
+from NodeGraphQt.constants import IN_PORT
 from node_exec import GraphManager
+from node_exec.GraphManager import writeFileIfChanged
+from node_exec.runtime import PROGRESS_FUNCTION_NAME
 
 DEFAULT_INDENT = "    "
+NOT_CONSTANT = object()
+# Only small values are folded to literals, larger ones keep their original expression:
+MAX_CONSTANT_REPR_LENGTH = 256
+MAX_CONSTANT_INT_BITS = 64
+
+def getConnectedPorts(port):
+    """
+    Returns the stored tuple of the ports connected to the port. Unlike Port.connected_ports it doesn't copy them.
+    """
+    graph = port.node().graph
+    return graph._connected_ports(port) if graph != None else ()
+
+def getConnectedNode(port):
+    """
+    Returns the node of the first port connected to the port or None.
+    """
+    connectedPorts = getConnectedPorts(port)
+    return connectedPorts[0].node() if len(connectedPorts) > 0 else None
+
+def getIndentCount(codeLine):
+    return len(codeLine) - len(codeLine.lstrip(' '))
+
+class CodeScope(object):
+    """
+    A run of consecutive code lines with the same indentation.
+    Stores the variables that were bound by data nodes within the run.
+    With common subexpression elimination the expressions of pure nodes (see getExpressionKey)
+    and the variables that alias the result of an equal expression are stored as well.
+    """
+
+    def __init__(self, indentCount):
+        self.indentCount = indentCount
+        self.boundVarNames = set()
+        self.expressions = dict()
+        self.canonicalVarNames = dict()
+
+    def copy(self):
+        scope = CodeScope(self.indentCount)
+        scope.boundVarNames = set(self.boundVarNames)
+        scope.expressions = dict(self.expressions)
+        scope.canonicalVarNames = dict(self.canonicalVarNames)
+        return scope
+
+class ExecContinuation(object):
+    """
+    An execution chain whose code generation was deferred by expandExecCode.
+    Stores the position and the scopes at the time of the request.
+    """
+
+    def __init__(self, node, sourceCodeLines, indent):
+        self.node = node
+        self.indent = indent
+        self.lineCount = len(sourceCodeLines)
+        self.scopes = sourceCodeLines.copyScopes()
+
+class ProgressCodeLine(str):
+    """
+    A code line that reports the progress of the execution.
+    These lines are left out of modules without progress reports (see CodeGenerator.generatePythonSources).
+    """
+
+class LoopPreheader(object):
+    """
+    The position in front of a loop header.
+    The flags of the loop invariant code in the loop body are initialized here. The lines are
+    inserted in front of the header once the body is complete.
+    """
+
+    def __init__(self, lineIndex, indent):
+        self.lineIndex = lineIndex
+        self.indent = indent
+        self.codeLines = []
+        self.flagNames = set()
+
+    def addFlag(self, flagName):
+        if not flagName in self.flagNames:
+            self.flagNames.add(flagName)
+            self.codeLines.append(makeCodeLine(f"{flagName} = True", self.indent))
+
+class NodeCodeCache(object):
+    """
+    The code of single nodes from previous generation runs (see CodeGenerator incremental).
+
+    The property_changed, port_connected and port_disconnected signals of the tracked graphs add the
+    ids of the changed nodes to dirtyNodeIds. Dirty nodes are regenerated, all other nodes reuse their code.
+    The code of a node only depends on its properties, its ports and the nodes connected to its inputs.
+    Deleted nodes are removed and loading a session clears the cache.
+    """
+
+    def __init__(self):
+        # node id -> (weak reference to the node, code). The reference detects reused ids.
+        self.entries = dict()
+        self.dirtyNodeIds = set()
+        self.trackedGraphs = weakref.WeakSet()
+
+    def trackGraph(self, graph):
+        if graph == None or graph in self.trackedGraphs:
+            return
+
+        self.trackedGraphs.add(graph)
+        graph.property_changed.connect(self.onPropertyChanged)
+        graph.port_connected.connect(self.onConnectionChanged)
+        graph.port_disconnected.connect(self.onConnectionChanged)
+        graph.nodes_deleted.connect(self.onNodesDeleted)
+        graph.session_loaded.connect(self.onSessionLoaded)
+
+    def markDirty(self, node):
+        self.dirtyNodeIds.add(node.id)
+
+    def onPropertyChanged(self, node, name, value):
+        self.markDirty(node)
+        # Properties can add or remove ports. The nodes connected to the outputs refer to them by index:
+        for port in getattr(node, "_outputs", []):
+            for connectedPort in getConnectedPorts(port):
+                self.markDirty(connectedPort.node())
+
+    def onConnectionChanged(self, port, connectedPort):
+        # Only the code of the node with the input port refers to the connection:
+        inPort = port if port.type_() == IN_PORT else connectedPort
+        self.markDirty(inPort.node())
+
+    def onNodesDeleted(self, nodeIds):
+        for nodeId in nodeIds:
+            self.entries.pop(nodeId, None)
+            self.dirtyNodeIds.discard(nodeId)
+
+    def onSessionLoaded(self, *args):
+        self.entries.clear()
+        self.dirtyNodeIds.clear()
+
+    def getCode(self, node, createCode):
+        """
+        Returns the cached code of the node or the result of createCode() if the node is dirty or new.
+        """
+        entry = self.entries.get(node.id)
+        if entry != None and not node.id in self.dirtyNodeIds and entry[0]() is node:
+            return entry[1]
+
+        code = createCode()
+        self.entries[node.id] = (weakref.ref(node), code)
+        self.dirtyNodeIds.discard(node.id)
+        return code
+
+class SourceCodeLines(list):
+    """
+    The source code lines of the generated execute function.
+    Additionally stores the state that is shared by the code generation functions during one run.
+
+    The scope stack is updated from the indentation of the appended lines. This way blocks are
+    entered and left by expandCodeWithCondition, the loop handlers and custom code nodes alike.
+    """
+
+    def __init__(self, lines=None, hoistLoopInvariants=False, eliminateCommonSubexpressions=False, foldConstants=False, reportProgress=False,
+                 nodeCodeCache=None):
+        super().__init__()
+        self.nodeCodeCache : NodeCodeCache = nodeCodeCache
+        self.hoistLoopInvariants = hoistLoopInvariants
+        self.eliminateCommonSubexpressions = eliminateCommonSubexpressions
+        self.foldConstants = foldConstants
+        self.constantValues = dict()
+        self.reportProgress = reportProgress
+        self.reachedNodeIds = set()
+        self.importNodes = dict()
+        self.scopes : List[CodeScope] = []
+        self.continuationSlots : List[ExecContinuation] = []
+        self.loopPreheaders : List[LoopPreheader] = []
+        self.loopInvariantNodeIds = dict()
+        self.immutableNodeIds = dict()
+
+        if lines != None:
+            self.extend(lines)
+
+    def append(self, codeLine):
+        self.updateScopes(codeLine)
+        super().append(codeLine)
+
+    def extend(self, codeLines):
+        for codeLine in codeLines:
+            self.append(codeLine)
+
+    def __iadd__(self, codeLines):
+        self.extend(codeLines)
+        return self
+
+    def updateScopes(self, codeLine):
+        indentCount = getIndentCount(codeLine)
+        leftScope = False
+        while len(self.scopes) > 0 and self.scopes[-1].indentCount > indentCount:
+            self.scopes.pop()
+            leftScope = True
+
+        if len(self.scopes) > 0 and self.scopes[-1].indentCount == indentCount:
+            # The code following a nested block starts a new context because
+            # the block may have rebound variables (e.g. in a loop body).
+            if leftScope:
+                self.scopes[-1] = CodeScope(indentCount)
+        else:
+            self.scopes.append(CodeScope(indentCount))
+
+    def copyScopes(self):
+        # Enclosing scopes are reset when they are re-entered, only the current scope keeps its variables.
+        scopes = [CodeScope(scope.indentCount) for scope in self.scopes]
+        if len(scopes) > 0:
+            scopes[-1] = self.scopes[-1].copy()
+
+        return scopes
+
+    @property
+    def currentScope(self) -> CodeScope:
+        return self.scopes[-1] if len(self.scopes) > 0 else None
+
+    def getVisibleScopes(self, indent):
+        """
+        Returns the scopes whose variables can be used by a code line with the given indentation.
+        """
+        scope = self.currentScope
+        if scope != None and scope.indentCount == len(indent):
+            return [scope]
+
+        return []
+
+    def isBound(self, varName, indent):
+        for scope in self.getVisibleScopes(indent):
+            if varName in scope.boundVarNames:
+                return True
+
+        return False
+
+    def bind(self, varName):
+        self.currentScope.boundVarNames.add(varName)
+
+    def reach(self, node, isImportNeeded=True):
+        """
+        Records a node whose code was generated.
+        Only nodes whose code refers to their module or import lines contribute to the imports.
+        """
+        self.reachedNodeIds.add(node.id)
+        if isImportNeeded:
+            self.importNodes[node.id] = node
+
+    def enterLoop(self, indent):
+        preheader = LoopPreheader(len(self), indent)
+        self.loopPreheaders.append(preheader)
+        return preheader
+
+    def leaveLoop(self):
+        preheader = self.loopPreheaders.pop()
+        self[preheader.lineIndex:preheader.lineIndex] = preheader.codeLines
+
+    def getLoopPreheader(self, node, indent):
+        """
+        Returns the preheader that initializes the flag of the node's loop invariant code or None if the code
+        has to be computed in every iteration. Code is only hoisted out of loop bodies that directly contain it,
+        never out of if or try blocks. Directly nested loops are left as a whole.
+        """
+        if not self.hoistLoopInvariants:
+            return None
+
+        target = None
+        indentCount = len(indent)
+        for preheader in reversed(self.loopPreheaders):
+            if len(preheader.indent) + len(DEFAULT_INDENT) != indentCount:
+                break
+
+            target = preheader
+            indentCount = len(preheader.indent)
+
+        # The result is shared by all iterations, a mutable result could be changed by one of them:
+        if target == None or not isLoopInvariant(node, self.loopInvariantNodeIds) or not isImmutableResult(node, self.immutableNodeIds):
+            return None
+
+        return target
 
 def isExecNode(node):
     return node.is_exec
@@ -21,12 +299,190 @@ def getExecuteSource(node, params):
     else:
         return f"{node.getFunctionName()}({','.join(params)})"
 
+def isPureNode(node):
+    return getattr(node, "isPure", False)
+
+def isLoopInvariant(node, invariantNodeIds):
+    """
+    A data node is loop invariant if it is pure and all of its inputs are either
+    unconnected (default values) or connected to loop invariant nodes.
+    The results are memoized in invariantNodeIds (node id -> bool).
+    """
+    stack = [node]
+    while len(stack) > 0:
+        n = stack[-1]
+        if n.id in invariantNodeIds:
+            stack.pop()
+            continue
+
+        if isExecNode(n) or not isPureNode(n):
+            invariantNodeIds[n.id] = False
+            stack.pop()
+            continue
+
+        srcNodes = [srcNode for srcNode in map(getConnectedNode, n._inputs) if srcNode != None]
+        pendingNodes = [srcNode for srcNode in srcNodes if not srcNode.id in invariantNodeIds]
+        if len(pendingNodes) > 0:
+            stack.extend(pendingNodes)
+            continue
+
+        invariantNodeIds[n.id] = all(invariantNodeIds[srcNode.id] for srcNode in srcNodes)
+        stack.pop()
+
+    return invariantNodeIds[node.id]
+
+def isImmutableValue(value):
+    if isinstance(value, tuple):
+        return all(isImmutableValue(v) for v in value)
+
+    return value is None or isinstance(value, (bool, int, float, complex, str, bytes))
+
+def isImmutableLiteral(source):
+    try:
+        return isImmutableValue(ast.literal_eval(str(source)))
+    except:
+        return False
+
+def isImmutableResult(node, immutableNodeIds):
+    """
+    Returns True if the outputs of the node are known to be immutable values. Pure nodes don't create mutable
+    objects, their results are immutable if all of their inputs are either literals of immutable values
+    or connected to nodes with immutable results. Other nodes need to declare it (see hasImmutableOutputs).
+    The results are memoized in immutableNodeIds (node id -> bool).
+    """
+    stack = [node]
+    while len(stack) > 0:
+        n = stack[-1]
+        if n.id in immutableNodeIds:
+            stack.pop()
+            continue
+
+        hasImmutableOutputs = getattr(n, "hasImmutableOutputs", False)
+        if hasImmutableOutputs or isExecNode(n) or not isPureNode(n):
+            immutableNodeIds[n.id] = hasImmutableOutputs
+            stack.pop()
+            continue
+
+        srcNodes = [srcNode for srcNode in map(getConnectedNode, n._inputs) if srcNode != None]
+        pendingNodes = [srcNode for srcNode in srcNodes if not srcNode.id in immutableNodeIds]
+        if len(pendingNodes) > 0:
+            stack.extend(pendingNodes)
+            continue
+
+        immutableNodeIds[n.id] = all(immutableNodeIds[srcNode.id] for srcNode in srcNodes) and \
+            all(isImmutableLiteral(n.getDefaultInput(i)) for i in n._inputs if len(getConnectedPorts(i)) == 0)
+        stack.pop()
+
+    return immutableNodeIds[node.id]
+
+def isLiteral(value):
+    try:
+        return bool(ast.literal_eval(repr(value)) == value)
+    except:
+        return False
+
+def isSmallLiteral(value):
+    """
+    Returns True if the value is None, a bool, a number or a short string, bytes or tuple of such values
+    whose literal is at most MAX_CONSTANT_REPR_LENGTH characters long.
+    The sizes are checked before repr is called, it is slow for large values.
+    """
+    if isinstance(value, tuple):
+        if len(value) > MAX_CONSTANT_REPR_LENGTH or not all(isSmallLiteral(v) for v in value):
+            return False
+    elif isinstance(value, int):
+        if value.bit_length() > MAX_CONSTANT_INT_BITS:
+            return False
+    elif isinstance(value, (str, bytes)):
+        if len(value) > MAX_CONSTANT_REPR_LENGTH:
+            return False
+    elif not (value is None or isinstance(value, (float, complex))):
+        return False
+
+    return len(repr(value)) <= MAX_CONSTANT_REPR_LENGTH and isLiteral(value)
+
+def evaluateConstantNode(node, inputValues):
+    """
+    Evaluates the code of a pure node with the given constant input values at code generation time.
+    Returns NOT_CONSTANT if the evaluation fails or the result is not a small literal (see isSmallLiteral).
+    The input values are small literals as well which keeps the cost of the evaluation low.
+    """
+    try:
+        namespace = {"__builtins__": builtins}
+        exec("\n".join(node.importLines), namespace)
+        moduleName = node.getModule()
+        if moduleName != None:
+            namespace[moduleName.split('.')[0]] = __import__(moduleName)
+        value = eval(getExecuteSource(node, [repr(v) for v in inputValues]), namespace)
+    except:
+        return NOT_CONSTANT
+
+    return value if isSmallLiteral(value) else NOT_CONSTANT
+
+def getConstantValue(node, constantValues):
+    """
+    Returns the value of a pure data node if all of its inputs are constant or NOT_CONSTANT otherwise.
+    Unconnected inputs are constant if their default value is a small python literal (see isSmallLiteral).
+    The results are memoized in constantValues (node id -> value).
+    """
+    stack = [node]
+    while len(stack) > 0:
+        n = stack[-1]
+        if n.id in constantValues:
+            stack.pop()
+            continue
+
+        if isExecNode(n) or not isPureNode(n):
+            constantValues[n.id] = NOT_CONSTANT
+            stack.pop()
+            continue
+
+        pendingNodes = []
+        for i in n._inputs:
+            srcNode = getConnectedNode(i)
+            if srcNode != None and not srcNode.id in constantValues:
+                pendingNodes.append(srcNode)
+
+        if len(pendingNodes) > 0:
+            stack.extend(pendingNodes)
+            continue
+
+        inputValues = []
+        for i in n._inputs:
+            if len(getConnectedPorts(i)) > 0:
+                srcOutputPort = getConnectedPorts(i)[0]
+                srcNode = srcOutputPort.node()
+                value = constantValues[srcNode.id]
+                srcOutputPorts = getNonExecutionOutputPorts(srcNode)
+                if value is not NOT_CONSTANT and len(srcOutputPorts) > 1:
+                    value = value[srcOutputPorts.index(srcOutputPort)]
+            else:
+                try:
+                    value = ast.literal_eval(str(n.getDefaultInput(i)))
+                except:
+                    value = NOT_CONSTANT
+
+                if value is not NOT_CONSTANT and not isSmallLiteral(value):
+                    value = NOT_CONSTANT
+
+            inputValues.append(value)
+
+        if any(value is NOT_CONSTANT for value in inputValues):
+            constantValues[n.id] = NOT_CONSTANT
+        else:
+            constantValues[n.id] = evaluateConstantNode(n, inputValues)
+
+        stack.pop()
+
+    return constantValues[node.id]
+
 def getVarNameSource(node,idx=0):
     return f"var_{node.id}_{idx}" if idx != None else f"var_{node.id}"
 
 def getParamName(port):
-    if len(port.connected_ports()) > 0: 
-        return getVarNameSource(port.connected_ports()[0].node())
+    srcNode = getConnectedNode(port)
+    if srcNode != None:
+        return getVarNameSource(srcNode)
     else:
         return str(port.node().getDefaultInput(port))
 
@@ -34,8 +490,8 @@ def getInputParamsSource(node):
     params = []
     for inPort in node._inputs:
         if not inPort.is_exec:
-            if len(inPort.connected_ports()) > 0:
-                srcOutputPort = inPort.connected_ports()[0]
+            if len(getConnectedPorts(inPort)) > 0:
+                srcOutputPort = getConnectedPorts(inPort)[0]
                 srcNode = srcOutputPort.node()
                 
                 outputPortIdx = getNonExecutionOutputPorts(srcNode).index(srcOutputPort)
@@ -48,8 +504,8 @@ def getInputParamsSource(node):
 
 def getDefaultInputParamSource(node, inPort):
     if not inPort.is_exec:
-        if len(inPort.connected_ports()) > 0:
-            srcOutputPort = inPort.connected_ports()[0]
+        if len(getConnectedPorts(inPort)) > 0:
+            srcOutputPort = getConnectedPorts(inPort)[0]
             srcNode = srcOutputPort.node()
             if isinstance(srcNode, inline_nodes.ConstInputNode):
                 return srcNode.getInlineCode()
@@ -69,61 +525,139 @@ def getDefaultInputParamsSource(node):
     
     return params
 
-def isCodeLineInSameContext(codeLine: str, sourceCodeLines: List[str]):
-    # Start and current line and trace backwards. The context changes of indent changes:
-    i = len(sourceCodeLines) - 1
-    expectedIndentCount = len(codeLine) - len(codeLine.lstrip(' '))
-    while i >= 0:
-        currentLine = sourceCodeLines[i]
-        currentIndentCount = len(currentLine) - len(currentLine.lstrip(' '))
-
-        if currentIndentCount != expectedIndentCount:
-            return False
-        
-        if currentLine == codeLine:
-            return True
-
-        i -= 1
-    
-    return False
-
 # Supports only one output but multiple inputs.
-# Construct a call recursively by the following logic:
+# Construct a call by the following logic:
 # node.execute(node.in[0].execute(), node.in[1].execute())
 def generatePythonGetSourceCodeLines(node, sourceCodeLines, indent):
-    # Recursion ends when base_nodes without input are reached or an execute node.
-    if isExecNode(node):
-        return
+    # Depth-first walk with an explicit stack (no recursion limit for long data chains).
+    # A node is pushed again with inputsExpanded=True so its line follows the lines of its inputs.
+    stack = [(node, False)]
+    while len(stack) > 0:
+        node, inputsExpanded = stack.pop()
+
+        # The walk ends when base_nodes without input are reached or an execute node.
+        if isExecNode(node):
+            continue
+
+        # Each node is expanded at most once per scope. If its variables are bound
+        # its inputs were already expanded in the same scope as well.
+        varName = getOutputVarNamesSource(node)
+        if sourceCodeLines.isBound(varName, indent):
+            continue
+
+        if inputsExpanded:
+            generateDataNodeSourceCodeLine(node, varName, sourceCodeLines, indent)
+        else:
+            stack.append((node, True))
+            for i in reversed(node._inputs):
+                srcNode = getConnectedNode(i)
+                if srcNode != None:
+                    stack.append((srcNode, False))
 
-    codeLine = getExecuteSource(node, getInputParamsSource(node))
-    for i in node._inputs:
-        if len(i.connected_ports()) > 0:
-            nextNode = i.connected_ports()[0].node()
-            generatePythonGetSourceCodeLines(nextNode, sourceCodeLines, indent)
+def getExpressionKey(node, visibleScopes):
+    """
+    Returns a key which is equal for pure nodes that compute the same value:
+    The node type, the properties which are no input defaults and the input parameters.
+    Input variables that alias an equal expression are replaced by the variable they alias.
+    """
+    inputPropertyNames = [node.getPropertyName(name) for name in node.inputNames]
+    properties = [(k, v) for k, v in node.model.custom_properties.items() if not k in inputPropertyNames]
+
+    params = []
+    for param in getInputParamsSource(node):
+        for scope in visibleScopes:
+            param = scope.canonicalVarNames.get(param, param)
+
+        params.append(param)
+
+    return (node.type_, repr(properties), tuple(params))
+
+def generateDataNodeSourceCodeLine(node, varName, sourceCodeLines, indent):
+    """
+    Appends the code line of a data node whose inputs are already expanded.
+    Its expression is replaced by a literal if it can be evaluated at generation time or by an alias
+    if an equal expression is already computed in a visible scope. Otherwise loop invariant code is
+    only computed once per loop (see getHoistedCode).
+    """
+    preheader = sourceCodeLines.getLoopPreheader(node, indent)
+    visibleScopes = sourceCodeLines.getVisibleScopes(indent)
+
+    constantValue = NOT_CONSTANT
+    if sourceCodeLines.foldConstants:
+        constantValue = getConstantValue(node, sourceCodeLines.constantValues)
+
+    expressionKey = None
+    firstVarName = None
+    # Aliases share the result object, which is only safe if it can't be changed:
+    if sourceCodeLines.eliminateCommonSubexpressions and isPureNode(node) and constantValue is NOT_CONSTANT and \
+            isImmutableResult(node, sourceCodeLines.immutableNodeIds):
+        expressionKey = getExpressionKey(node, visibleScopes)
+        for scope in visibleScopes:
+            firstVarName = scope.expressions.get(expressionKey, firstVarName)
+
+    if constantValue is not NOT_CONSTANT:
+        code = f"{varName} = {constantValue!r}"
+    elif firstVarName != None:
+        code = f"{varName} = {firstVarName}"
+    else:
+        code = getCachedCode(node, sourceCodeLines, lambda: getDataNodeCode(node))
+        if preheader != None:
+            code = getHoistedCode(node, preheader, code)
+
+    sourceCodeLines.reach(node, isImportNeeded=constantValue is NOT_CONSTANT and firstVarName == None)
+    sourceCodeLines.append(makeCodeLine(code, indent))
 
+    scope = sourceCodeLines.currentScope
+    scope.boundVarNames.add(varName)
+    if firstVarName != None:
+        scope.canonicalVarNames.update(zip(varName.split(','), firstVarName.split(',')))
+    elif expressionKey != None:
+        scope.expressions[expressionKey] = varName
+
+def getOutputVarNamesSource(node):
     varNames = [getVarNameSource(node, idx) for idx in range(0, len(getNonExecutionOutputPorts(node)))]
-    varName = ','.join(varNames)
-    codeLine = f"{indent}{varName} = {codeLine}"
-    
-    if not isCodeLineInSameContext(codeLine, sourceCodeLines):
-        sourceCodeLines.append(codeLine)
+    return ','.join(varNames)
+
+def getDataNodeCode(node):
+    return f"{getOutputVarNamesSource(node)} = {getExecuteSource(node, getInputParamsSource(node))}"
+
+def getCachedCode(node, sourceCodeLines, createCode):
+    if sourceCodeLines.nodeCodeCache == None:
+        return createCode()
+
+    return sourceCodeLines.nodeCodeCache.getCode(node, createCode)
+
+def getHoistedCode(node, preheader, code):
+    """
+    Returns the code of a loop invariant node which is only computed when it is reached for the first time.
+    Pure nodes can still raise (e.g. a division by zero) and loops can run zero times, so the code itself is
+    not moved in front of the loop. Only its flag is initialized in the preheader.
+    """
+    flagName = getVarNameSource(node, "pending")
+    preheader.addFlag(flagName)
+    return f"if {flagName}: {code}; {flagName} = False"
+
+def getExecNodeCode(node, initialParams=None):
+    codeLine = getExecuteSource(node, getInputParamsSource(node) if initialParams == None else initialParams)
+    if len(getNonExecutionOutputPorts(node)) > 0:
+        codeLine =  f"{getOutputVarNamesSource(node)} = {codeLine}"
+
+    return codeLine
 
 def generateParamSourceCodeLines(node, sourceCodeLines, indent):
     for i in node._inputs:
-        if not i.is_exec and len(i.connected_ports()) > 0:
-            n = i.connected_ports()[0].node()
-            generatePythonGetSourceCodeLines(n, sourceCodeLines, indent)
+        if not i.is_exec:
+            n = getConnectedNode(i)
+            if n != None:
+                generatePythonGetSourceCodeLines(n, sourceCodeLines, indent)
 
 def getNextExecNode(port):
-    return port.connected_ports()[0].node() if len(port.connected_ports()) > 0 else None
+    return getConnectedNode(port)
 
 def getExecOutNode(node):
     for out in node._outputs:
         if out.is_exec:
-            if len(out.connected_ports()) == 0:
-                return None
-
-            return out.connected_ports()[0].node()
+            return getConnectedNode(out)
 
     return None
 
@@ -131,11 +665,31 @@ def makeCodeLine(code, indent):
     return indent + code
 
 def expandExecCode(execPort, sourceCodeLines, indent):
+    """
+    Expands the code of the execution chain connected to execPort.
+
+    If called by a flow control or custom code node the chain is not expanded right away
+    but handed back to generatePythonExecutionSourceCodeLines which continues with it
+    iteratively. This keeps the recursion depth independent of the length of the graph.
+    """
     nextNode = getNextExecNode(execPort)
-    if not nextNode is None:
+    if nextNode is None:
+        return
+
+    continuationSlots = getattr(sourceCodeLines, "continuationSlots", None)
+    if not continuationSlots:
         generatePythonExecutionSourceCodeLines(nextNode, sourceCodeLines, indent)
+        return
+
+    # Only one continuation can be handed back, expand a previous one in place.
+    if continuationSlots[-1] != None:
+        continuation = continuationSlots[-1]
+        continuationSlots[-1] = None
+        generateContinuationSourceCodeLines(continuation, sourceCodeLines)
 
-def expandCodeWithCondition(execPort, sourceCodeLines, conditionalLine, indent, preBodyLines=None):
+    continuationSlots[-1] = ExecContinuation(nextNode, sourceCodeLines, indent)
+
+def expandCodeWithCondition(execPort, sourceCodeLines, conditionalLine, indent, preBodyLines=None, isLoop=False):
     """
     Expands the code with a condition check line and a body.
 
@@ -145,11 +699,17 @@ def expandCodeWithCondition(execPort, sourceCodeLines, conditionalLine, indent,
         sourceCodeLines: The current source code lines that will be extended.
         conditionalLine (str): The code line with a condition (e.g. if or loop condition).
         indent (str): The current indentation level.
+        preBodyLines (list): Code lines inserted at the start of the body.
+        isLoop (bool): If True the conditionalLine is a loop header and loop invariant
+                       code of the body may be hoisted in front of it.
     """
 
     if preBodyLines == None:
         preBodyLines = []
         
+    if isLoop:
+        sourceCodeLines.enterLoop(indent)
+
     nextNode = getNextExecNode(execPort)
     sourceCodeLines.append(conditionalLine)
 
@@ -160,6 +720,9 @@ def expandCodeWithCondition(execPort, sourceCodeLines, conditionalLine, indent,
     else:
         sourceCodeLines.append(makeCodeLine("pass", indent + DEFAULT_INDENT))
 
+    if isLoop:
+        sourceCodeLines.leaveLoop()
+
 def handleForLoopSourceCodeLines(node, sourceCodeLines, indent):
     loopVar = getVarNameSource(node)
     loopStart = getParamName(node.in_start)
@@ -167,7 +730,7 @@ def handleForLoopSourceCodeLines(node, sourceCodeLines, indent):
 
     # Loop body code:    
     loopConditionCode = makeCodeLine(f"for {loopVar} in range({loopStart},{loopEnd}):", indent)
-    expandCodeWithCondition(node.loop_body_port, sourceCodeLines, loopConditionCode, indent)
+    expandCodeWithCondition(node.loop_body_port, sourceCodeLines, loopConditionCode, indent, isLoop=True)
 
     # Loop completion code:
     expandExecCode(node.loop_complete_port, sourceCodeLines, indent)
@@ -178,7 +741,7 @@ def handleForEachLoopSourceCodeLines(node, sourceCodeLines, indent):
     
     # Loop body code:    
     loopConditionCode = makeCodeLine(f"for {loopVar} in {collection}:", indent)
-    expandCodeWithCondition(node.loop_body_port, sourceCodeLines, loopConditionCode, indent)
+    expandCodeWithCondition(node.loop_body_port, sourceCodeLines, loopConditionCode, indent, isLoop=True)
 
     # Loop completion code:
     expandExecCode(node.loop_complete_port, sourceCodeLines, indent)
@@ -187,7 +750,7 @@ def handleWhileLoopNodeSourceCodeLines(node, sourceCodeLines, indent):
     # Check the condition, execute the code and then update the condition variables:
     loopConditionVar = getParamName(node.condition_port)
     loopConditionCode = makeCodeLine(f"while {loopConditionVar}:", indent)
-    expandCodeWithCondition(node.loop_body_port, sourceCodeLines, loopConditionCode, indent)
+    expandCodeWithCondition(node.loop_body_port, sourceCodeLines, loopConditionCode, indent, isLoop=True)
     generateParamSourceCodeLines(node, sourceCodeLines, indent + DEFAULT_INDENT)
 
     expandExecCode(node.loop_complete_port, sourceCodeLines, indent)
@@ -208,14 +771,9 @@ def getNonExecutionOutputPorts(node):
 
     return ports
 
-def generatePythonExecutionSourceCodeLines(node, sourceCodeLines, indent = "", initialParams = None):
-    if node == None:
-        return
-
-    if initialParams == None:
-        generateParamSourceCodeLines(node, sourceCodeLines, indent)
-
+def generateFlowSourceCodeLines(node, sourceCodeLines, indent):
     if isinstance(node, base_nodes.BaseCustomCodeNode):
+        sourceCodeLines.reach(node)
         node.generateCode(sourceCodeLines, indent)
     elif isinstance(node, flow_nodes.ForLoopNode):
         handleForLoopSourceCodeLines(node, sourceCodeLines, indent)
@@ -226,58 +784,146 @@ def generatePythonExecutionSourceCodeLines(node, sourceCodeLines, indent = "", i
     elif isinstance(node, flow_nodes.WhileLoopNode):
         handleWhileLoopNodeSourceCodeLines(node, sourceCodeLines, indent)
     else:
-        codeLine = getExecuteSource(node, getInputParamsSource(node) if initialParams == None else initialParams)
-        if len(getNonExecutionOutputPorts(node)) > 0:
-            varNames = [getVarNameSource(node, idx) for idx in range(0, len(getNonExecutionOutputPorts(node)))]
-            varName = ','.join(varNames)
-            codeLine =  f"{varName} = {codeLine}"
-        sourceCodeLines.append(makeCodeLine(codeLine, indent))
-        generatePythonExecutionSourceCodeLines(getExecOutNode(node), sourceCodeLines, indent)
+        return False
+
+    sourceCodeLines.reach(node, isImportNeeded=False)
+    return True
 
+def generateContinuationSourceCodeLines(continuation, sourceCodeLines):
+    """
+    Expands a deferred execution chain at the position it was requested.
+    Lines appended after the request are moved behind the expanded chain.
+    """
+    followingLines = sourceCodeLines[continuation.lineCount:]
+    del sourceCodeLines[continuation.lineCount:]
+    sourceCodeLines.scopes = continuation.scopes
+
+    generatePythonExecutionSourceCodeLines(continuation.node, sourceCodeLines, continuation.indent)
+    sourceCodeLines += followingLines
+
+def generatePythonExecutionSourceCodeLines(node, sourceCodeLines, indent = "", initialParams = None):
+    while node != None:
+        if initialParams == None:
+            generateParamSourceCodeLines(node, sourceCodeLines, indent)
+
+        if sourceCodeLines.reportProgress:
+            sourceCodeLines.append(ProgressCodeLine(makeCodeLine(f"{PROGRESS_FUNCTION_NAME}({node.id!r})", indent)))
+
+        sourceCodeLines.continuationSlots.append(None)
+        isFlowNode = generateFlowSourceCodeLines(node, sourceCodeLines, indent)
+        continuation = sourceCodeLines.continuationSlots.pop()
+
+        if isFlowNode:
+            # Continue with the execution chain that was handed back by expandExecCode:
+            if continuation == None:
+                node = None
+            elif continuation.lineCount == len(sourceCodeLines):
+                node = continuation.node
+                indent = continuation.indent
+            else:
+                generateContinuationSourceCodeLines(continuation, sourceCodeLines)
+                node = None
+        else:
+            if initialParams == None:
+                codeLine = getCachedCode(node, sourceCodeLines, lambda: getExecNodeCode(node))
+            else:
+                codeLine = getExecNodeCode(node, initialParams)
+            sourceCodeLines.append(makeCodeLine(codeLine, indent))
+            sourceCodeLines.reach(node)
+            node = getExecOutNode(node)
+
+        initialParams = None
 
 class CodeGenerator(object):
+    def __init__(self, incremental=False, hoistLoopInvariants=False, eliminateCommonSubexpressions=False, foldConstants=False):
+        """
+        Args:
+            incremental (bool): If True the code of each node is cached and only the nodes that were changed since
+                                the previous run are regenerated (see NodeCodeCache).
+            hoistLoopInvariants (bool): If True the code of pure nodes in loop bodies that only depends on
+                                        constant inputs is computed once per loop instead of once per iteration.
+            eliminateCommonSubexpressions (bool): If True pure nodes of the same type with equal properties and
+                                                  inputs reuse the variables of the first computation if their
+                                                  results are immutable (see isImmutableResult).
+            foldConstants (bool): If True pure nodes whose inputs are all constant are evaluated during code generation
+                                  and their result is emitted as a literal.
+        """
+        self.hoistLoopInvariants = hoistLoopInvariants
+        self.eliminateCommonSubexpressions = eliminateCommonSubexpressions
+        self.foldConstants = foldConstants
+        self.nodeCodeCache = NodeCodeCache() if incremental else None
+        # Scripting nodes without code in the last generated module because they are unreachable from the start node:
+        self.prunedNodes = []
+
     def getScriptingNodes(self, graph):
         return [n for n in graph.all_nodes() if n.isScriptingNode]
 
-    def generatePythonCode(self, graph, graphName, node, moduleName, targetFolder):
-        execFuncName = "execute"
-        sourceCodeLines = []
+    def generatePythonSource(self, graph, graphName, node, reportProgress=False):
+        """
+        Returns the source code of a python module with an execute function that runs the graph from the given start node.
+        If reportProgress is True the function PROGRESS_FUNCTION_NAME is called with the id of each execution node
+        before it is executed. It has to be defined in the module by the caller.
+        """
+        sourceCodeLines = self.generateSourceCodeLines(node, reportProgress)
+        return self.getModuleSource(node, sourceCodeLines, sourceCodeLines)
+
+    def generatePythonSources(self, graph, graphName, node):
+        """
+        Returns the source code of the module without and with progress reports (see generatePythonSource).
+        Both are created by the same generation pass.
+        """
+        sourceCodeLines = self.generateSourceCodeLines(node, reportProgress=True)
+        codeLines = [line for line in sourceCodeLines if not isinstance(line, ProgressCodeLine)]
+        return (self.getModuleSource(node, sourceCodeLines, codeLines), self.getModuleSource(node, sourceCodeLines, sourceCodeLines))
+
+    def generateSourceCodeLines(self, node, reportProgress):
+        sourceCodeLines = SourceCodeLines(hoistLoopInvariants=self.hoistLoopInvariants,
+                                          eliminateCommonSubexpressions=self.eliminateCommonSubexpressions,
+                                          foldConstants=self.foldConstants, reportProgress=reportProgress,
+                                          nodeCodeCache=self.nodeCodeCache)
+        if self.nodeCodeCache != None:
+            self.nodeCodeCache.trackGraph(node.graph)
 
-        startNodeParamValues = getDefaultInputParamsSource(node)
         startNodeParams = []
-        for i in range(0,len(startNodeParamValues)):
+        for i in range(0,len(getDefaultInputParamsSource(node))):
             startNodeParams.append(f"in{i}")
 
         generatePythonExecutionSourceCodeLines(node, sourceCodeLines, initialParams=startNodeParams)
 
-        # Create an empty python file with the name moduleName:
-        srcFilePath = path.join(targetFolder, moduleName + ".py")
-        srcFile = open(srcFilePath,"w+")
+        self.prunedNodes = [n for n in self.getScriptingNodes(node.graph) if not n.id in sourceCodeLines.reachedNodeIds]
+        return sourceCodeLines
+
+    def getModuleSource(self, node, sourceCodeLines, codeLines):
+        execFuncName = "execute"
 
-        # Generate imports:
+        # Generate imports only for the nodes that are referenced by the generated code:
         importLines = set()
-        for n in self.getScriptingNodes(graph):
+        for n in sourceCodeLines.importNodes.values():
             importLines = importLines.union(n.importLines)
             try:
-                importLine = f"import {n.getModule()}"
-                if not importLine in importLines:
-                    importLines.add(importLine)
+                moduleName = n.getModule()
+                if moduleName != None:
+                    importLines.add(f"import {moduleName}")
             except:
                 pass
 
-        sourceCode = "\n".join(importLines)
+        # Sorted to produce the same source for the same graph in every session:
+        sourceCode = "\n".join(sorted(importLines))
 
         # Append source code lines:
+        startNodeParamValues = getDefaultInputParamsSource(node)
         startNodeParamsWithInitialValues = []
         for i in range(0, len(startNodeParamValues)):
             startNodeParamsWithInitialValues.append(f"in{i}={startNodeParamValues[i]}")
 
         sourceCode += f"\n\ndef {execFuncName}({','.join(startNodeParamsWithInitialValues)}):\n"
-        for line in sourceCodeLines:
+        for line in codeLines:
             sourceCode += DEFAULT_INDENT + line + "\n"
 
-        srcFile.write(sourceCode)
+        return sourceCode
 
-        srcFile.close()
+    def generatePythonCode(self, graph, graphName, node, moduleName, targetFolder):
+        srcFilePath = path.join(targetFolder, moduleName + ".py")
+        writeFileIfChanged(srcFilePath, self.generatePythonSource(graph, graphName, node))
 
         return srcFilePath
\ No newline at end of file
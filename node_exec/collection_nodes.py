@@ -1,13 +1,11 @@
 from node_exec.base_nodes import defNode, defInlineNode
+from node_exec.runtime import collection_functions
 
 COLLECTION_IDENTIFIER = 'Collection'
 
-@defNode('Append', returnNames=["collection"], isExecutable=True, identifier=COLLECTION_IDENTIFIER)
-def append(collection, element):
-    collection.append(element)
-    return collection
+append = defNode('Append', returnNames=["collection"], isExecutable=True, identifier=COLLECTION_IDENTIFIER)(collection_functions.append)
 
-@defInlineNode('Length', returnNames=["len"], identifier=COLLECTION_IDENTIFIER)
+@defInlineNode('Length', returnNames=["len"], identifier=COLLECTION_IDENTIFIER, isPure=True, hasImmutableOutputs=True)
 def length(collection):
     return f'len({collection})'
 
@@ -15,7 +13,7 @@ def length(collection):
 def getDictValue(dictionary, key, default):
     return f'{dictionary}.get({key}, {default})'
 
-@defInlineNode('Contains', returnNames=["contains"], identifier=COLLECTION_IDENTIFIER)
+@defInlineNode('Contains', returnNames=["contains"], identifier=COLLECTION_IDENTIFIER, isPure=True, hasImmutableOutputs=True)
 def contains(collection, key):
     return f'{key} in {collection}'
 
@@ -27,17 +25,9 @@ def getValueByIndex(collection, index):
 def mergeDicts(dict0, dict1):
     return "{" + f'**{dict0}, **{dict1}' + "}"
 
-@defNode('Add Dictionary Entry', returnNames=["dict"], isExecutable=True, identifier=COLLECTION_IDENTIFIER)
-def addDictEntry(dictionary, key, value):
-    dictionary[key] = value
-    return dictionary
+addDictEntry = defNode('Add Dictionary Entry', returnNames=["dict"], isExecutable=True, identifier=COLLECTION_IDENTIFIER)(collection_functions.addDictEntry)
 
-@defNode('Remove Dictionary Key', returnNames=["key"], isExecutable=True, identifier=COLLECTION_IDENTIFIER)
-def removeDictKey(dictionary, key):
-    '''
-    Returns the removed key. If the key does not exist None is returned.
-    '''
-    return dictionary.pop(key, None)
+removeDictKey = defNode('Remove Dictionary Key', returnNames=["key"], isExecutable=True, identifier=COLLECTION_IDENTIFIER)(collection_functions.removeDictKey)
 
 @defInlineNode('Create Dictionary', isExecutable=True, returnNames=['dict'], identifier=COLLECTION_IDENTIFIER)
 def createDict():
@@ -45,4 +35,4 @@ def createDict():
 
 @defInlineNode('Create List', isExecutable=True, returnNames=['list'], identifier=COLLECTION_IDENTIFIER)
 def createList():
-    return '[]'
\ No newline at end of file
+    return '[]'
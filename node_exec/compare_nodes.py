@@ -1,28 +1,26 @@
 from node_exec.base_nodes import defNode, defInlineNode
+from node_exec.runtime import compare_functions
 
 COMPARE_IDENTIFIER = 'Compare'
 
-@defInlineNode('Greater', returnNames=["greater"], identifier=COMPARE_IDENTIFIER)
+@defInlineNode('Greater', returnNames=["greater"], identifier=COMPARE_IDENTIFIER, isPure=True)
 def greater(lhs, rhs):
     return f'{lhs} > {rhs}'
 
-@defInlineNode('Greater Equals', returnNames=["equals"], identifier=COMPARE_IDENTIFIER)
+@defInlineNode('Greater Equals', returnNames=["equals"], identifier=COMPARE_IDENTIFIER, isPure=True)
 def greaterEquals(lhs, rhs):
     return f'{lhs} >= {rhs}'
 
-@defInlineNode('Less', returnNames=["less"], identifier=COMPARE_IDENTIFIER)
+@defInlineNode('Less', returnNames=["less"], identifier=COMPARE_IDENTIFIER, isPure=True)
 def less(lhs, rhs):
     return f'{lhs} < {rhs}'
 
-@defInlineNode('Less Equals', returnNames=["lessEquals"], identifier=COMPARE_IDENTIFIER)
+@defInlineNode('Less Equals', returnNames=["lessEquals"], identifier=COMPARE_IDENTIFIER, isPure=True)
 def lessEquals(lhs, rhs):
     return f'{lhs} <= {rhs}'
 
-@defInlineNode('Equals', returnNames=["equals"], identifier=COMPARE_IDENTIFIER)
+@defInlineNode('Equals', returnNames=["equals"], identifier=COMPARE_IDENTIFIER, isPure=True)
 def equals(lhs, rhs):
     return f'{lhs} == {rhs}'
 
-@defNode('Select', returnNames=["selected"], identifier=COMPARE_IDENTIFIER)
-def select(condition, trueValue, falseValue):
-    return trueValue if condition else falseValue
-
+select = defNode('Select', returnNames=["selected"], identifier=COMPARE_IDENTIFIER)(compare_functions.select)
@@ -1,11 +1,8 @@
 from node_exec.base_nodes import defNode
+from node_exec.runtime import convert_functions
 
 CONVERSION_IDENTIFIER = 'Convert'
 
-@defNode(name='To Int', returnNames=["int"], identifier=CONVERSION_IDENTIFIER)
-def toInt(value):
-    return int(value)
+toInt = defNode(name='To Int', returnNames=["int"], identifier=CONVERSION_IDENTIFIER, isPure=True, hasImmutableOutputs=True)(convert_functions.toInt)
 
-@defNode(name='To String', returnNames=["str"], identifier=CONVERSION_IDENTIFIER)
-def toString(value):
-    return str(value)
\ No newline at end of file
+toString = defNode(name='To String', returnNames=["str"], identifier=CONVERSION_IDENTIFIER, isPure=True, hasImmutableOutputs=True)(convert_functions.toString)
@@ -1,11 +1,10 @@
 from node_exec.base_nodes import defNode, defInlineNode
+from node_exec.runtime import core_functions
 
 CORE_IDENTIFIER = 'Core'
 
-@defNode(name='Variable', returnNames=["var"], isExecutable=True, identifier=CORE_IDENTIFIER)
-def makeVar(initialValue=None):
-    return initialValue
+makeVar = defNode(name='Variable', returnNames=["var"], isExecutable=True, identifier=CORE_IDENTIFIER)(core_functions.makeVar)
 
 @defInlineNode(name='Assign', returnNames=["var"], isExecutable=True, identifier=CORE_IDENTIFIER)
 def assign(lhs, rhs):
-    return f'{lhs} = {rhs}'
\ No newline at end of file
+    return f'{lhs} = {rhs}'
@@ -1,52 +1,14 @@
 from node_exec.base_nodes import defNode, defInlineNode
 from node_exec.base_nodes import BaseCustomNode, BaseExecuteNode, InlineNode, BaseCustomCodeNode
+from node_exec.runtime import excel_functions
+from node_exec.runtime.excel_functions import ExcelTable
 from node_exec import code_generator
-import os 
-
-imported = False
-try:
-    import xlrd
-    imported = True
-except:
-    print("Note: Excel Nodes are not available because the xlrd module is missing: pip install xlrd")
 
 EXCEL_IDENTIFIER = 'Excel'
 
-class ExcelTable:
-    def __init__(self, sheet):
-        self.sheet = sheet
-
-    def getRowValues(self, rowIndex):
-        return self.sheet.row_values(rowIndex) if self.sheet != None else []
-
-    def getColumnValues(self, colIndex):
-        return self.sheet.col_values(colIndex) if self.sheet != None else []
-
-    def getColumnsWithoutHeader(self):
-        return [self.getColumnValues(i)[1:] for i in range(0, self.ncols)]
-
-    def getHeader(self,rowIndex=0):
-        return self.getRowValues(rowIndex)
-
-    @property
-    def ncols(self):
-        return self.sheet.ncols if self.sheet != None else 0
-
-    @property
-    def nrows(self):
-        return self.sheet.nrows if self.sheet != None else 0
-
-    def getRowsWithoutHeader(self):
-        for rowIdx in range(1, self.nrows):
-            yield self.getRowValues(rowIdx)
-
-    def getCellValue(self, rowIndex, colIndex):
-        return self.sheet.cell_value(rowIndex, colIndex) if self.sheet != None else None
-
-    def getRowAsDict(self, headerValues, rowValues):
-        return dict(zip(headerValues, rowValues))
+if excel_functions.imported:
+    import xlrd
 
-if imported:
     class ExcelSheetProcessorNode(BaseCustomCodeNode):
         __identifier__ = EXCEL_IDENTIFIER
         NODE_NAME = 'Excel Sheet Processor'
@@ -75,7 +37,7 @@ if imported:
 
             # Table output code:
             tableVar = code_generator.getVarNameSource(self, 0)
-            tableCreationCode =  f"{self.fullClassName}.createTableFromSheetName({','.join(inputParams[0:-1])})"
+            tableCreationCode =  f"{excel_functions.__name__}.createTableFromSheetName({','.join(inputParams[0:-1])})"
             tableInitCode = code_generator.makeCodeLine(f"{tableVar} = {tableCreationCode}", indent)
             sourceCodeLines.append(tableInitCode)
             headerVar = code_generator.getVarNameSource(self, 1)
@@ -96,19 +58,17 @@ if imported:
             loopConditionCode = code_generator.makeCodeLine(f"for {loopVar} in {collection}:", indent)
 
             preBodyLines.append(code_generator.makeCodeLine(f"{','.join(tableValueVars)} = {loopVar}", indent + code_generator.DEFAULT_INDENT))
-            code_generator.expandCodeWithCondition(self.loop_body_port, sourceCodeLines, loopConditionCode, indent, preBodyLines=preBodyLines)
+            code_generator.expandCodeWithCondition(self.loop_body_port, sourceCodeLines, loopConditionCode, indent, preBodyLines=preBodyLines, isLoop=True)
 
             # Loop completion code:
             code_generator.expandExecCode(self.loop_complete_port, sourceCodeLines, indent)
 
+        def getModule(self):
+            return excel_functions.__name__
 
         @staticmethod
         def createTableFromSheetName(workbookPath, sheetName, encodingOverride=None):
-            if os.path.exists(workbookPath):
-                return ExcelTable(xlrd.open_workbook(filename=workbookPath,encoding_override=encodingOverride).sheet_by_name(sheetName))
-            else:
-                print(f"Warning: The workbook file path \"{workbookPath}\" does not exist.")
-                return ExcelTable(None)
+            return excel_functions.createTableFromSheetName(workbookPath, sheetName, encodingOverride)
 
         def refresh(self):
             try:
@@ -144,14 +104,8 @@ if imported:
             except:
                 print("Excel Node: Incorrect input.")
 
-    @defNode(name='Open Sheet', returnNames=['table'], identifier=EXCEL_IDENTIFIER)
-    def openSheet(workbookPath, sheetName, encodingOverride=None):
-        return ExcelTable(xlrd.open_workbook(filename=workbookPath,encoding_override=encodingOverride if encodingOverride != '' else None).sheet_by_name(sheetName))
+    openSheet = defNode(name='Open Sheet', returnNames=['table'], identifier=EXCEL_IDENTIFIER)(excel_functions.openSheet)
 
-    @defNode(name='Open Workbook', returnNames=['workbook'], identifier=EXCEL_IDENTIFIER)
-    def openWorkbook(path, encodingOverride=None):
-        return xlrd.open_workbook(filename=path,encoding_override=encodingOverride if encodingOverride != '' else None)
+    openWorkbook = defNode(name='Open Workbook', returnNames=['workbook'], identifier=EXCEL_IDENTIFIER)(excel_functions.openWorkbook)
 
-    @defNode(name='Sheet By Name', returnNames=['table'], identifier=EXCEL_IDENTIFIER)
-    def getSheetByName(workbook, sheetName):
-        return ExcelTable(workbook.sheet_by_name(sheetName))
\ No newline at end of file
+    getSheetByName = defNode(name='Sheet By Name', returnNames=['table'], identifier=EXCEL_IDENTIFIER)(excel_functions.getSheetByName)
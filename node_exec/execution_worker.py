@@ -0,0 +1,101 @@
+"""
+Executes the generated code of a graph in a separate process.
+
+The job is read as JSON from stdin:
+{"source": str, "filename": str, "moduleName": str, "cacheFilePath": str or null, "createApplication": bool}.
+The code is loaded from or stored in the optional code cache file (see CompiledCodeCache).
+Jobs with "interpret": true hold the serialized graph as "session" and the "startNodeName" instead of the source.
+The graph is executed by the graph interpreter then (see GraphInterpreter).
+The output of the graph is written to stdout. Progress and the result are written to stdout as
+lines starting with PROGRESS_PREFIX and RESULT_PREFIX. Errors are printed and end the process with exit code 1.
+
+Usage: python -u -m node_exec.execution_worker
+"""
+
+import sys
+import json
+import time
+import traceback
+
+PROGRESS_PREFIX = "\x1enode_exec:progress:"
+RESULT_PREFIX = "\x1enode_exec:result:"
+
+# Minimum time between two progress reports in seconds:
+PROGRESS_INTERVAL = 0.05
+
+class ProgressReporter(object):
+    def __init__(self, stream):
+        self.stream = stream
+        self.lastReportTime = 0.0
+
+    def __call__(self, nodeId):
+        curTime = time.monotonic()
+        if curTime - self.lastReportTime >= PROGRESS_INTERVAL:
+            self.lastReportTime = curTime
+            self.stream.write(f"{PROGRESS_PREFIX}{nodeId}\n")
+            self.stream.flush()
+
+def runJob(job, stream, code=None):
+    """
+    Executes the job and returns the result of the graph.
+    The code can be compiled in advance, otherwise the source of the job is compiled.
+    """
+    import node_exec.nodes_cfg
+    node_exec.nodes_cfg.init()
+
+    from node_exec.runtime import PROGRESS_FUNCTION_NAME
+    from node_exec.code_cache import CompiledCodeCache
+
+    # The graph is loaded before the application is created, so it's headless:
+    if job.get("interpret", False):
+        from node_exec.graph_interpreter import GraphInterpreter, loadGraph
+        graph, startNode = loadGraph(job["session"], job["startNodeName"])
+
+    # Nodes like message boxes and file dialogs need an application:
+    if job.get("createApplication", False):
+        try:
+            from PySide2 import QtWidgets
+            app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        except ImportError:
+            pass
+
+    if job.get("interpret", False):
+        return GraphInterpreter(reportProgress=ProgressReporter(stream)).execute(startNode)
+
+    moduleName = job.get("moduleName", "graph")
+    filename = job.get("filename", "<graph>")
+    if code != None:
+        module = CompiledCodeCache.createModuleFromCode(code, moduleName, filename)
+    else:
+        module = CompiledCodeCache().createModule(job["source"], moduleName, filename, job.get("cacheFilePath"))
+
+    setattr(module, PROGRESS_FUNCTION_NAME, ProgressReporter(stream))
+    return module.execute()
+
+def reportJob(job, stream, code=None):
+    """
+    Executes the job and writes the result to the stream.
+    Returns the exit code of the execution.
+    """
+    try:
+        result = runJob(job, stream, code)
+    except:
+        traceback.print_exc()
+        return 1
+
+    resultRepr = repr(result).replace("\n", " ")
+    stream.write(f"{RESULT_PREFIX}{resultRepr}\n")
+    stream.flush()
+    return 0
+
+def main():
+    try:
+        job = json.load(sys.stdin)
+    except:
+        traceback.print_exc()
+        return 1
+
+    return reportJob(job, sys.stdout)
+
+if __name__ == '__main__':
+    sys.exit(main())
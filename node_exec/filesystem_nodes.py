@@ -1,68 +1,36 @@
 from node_exec.base_nodes import defNode, VariableInputCountNode, BaseCustomCodeNode
+from node_exec.runtime import filesystem_functions
 from node_exec import code_generator
-import shutil
-import os
-import distutils
-from distutils import dir_util
 
 IDENTIFIER = "Filesystem"
 
-@defNode("Join Paths", returnNames=["path"], identifier=IDENTIFIER)
-def joinPaths(*args):
-    return os.path.join(*args)
+joinPaths = defNode("Join Paths", returnNames=["path"], identifier=IDENTIFIER, isPure=True)(filesystem_functions.joinPaths)
 
-@defNode("Copy Directory", isExecutable=True, identifier=IDENTIFIER)
-def copyDirectory(srcPath, dstPath):
-    distutils.dir_util.copy_tree(srcPath, dstPath)
+copyDirectory = defNode("Copy Directory", isExecutable=True, identifier=IDENTIFIER)(filesystem_functions.copyDirectory)
 
-@defNode("Copy File", isExecutable=True, identifier=IDENTIFIER)
-def copyFile(srcPath, dstPath):
-    shutil.copy2(srcPath, dstPath)
+copyFile = defNode("Copy File", isExecutable=True, identifier=IDENTIFIER)(filesystem_functions.copyFile)
 
-@defNode("Move File or Directory", isExecutable=True, identifier=IDENTIFIER)
-def moveFileOrDirectory(srcPath, dstPath):
-    shutil.move(srcPath, dstPath)
+moveFileOrDirectory = defNode("Move File or Directory", isExecutable=True, identifier=IDENTIFIER)(filesystem_functions.moveFileOrDirectory)
 
-@defNode("Remove File", isExecutable=True, identifier=IDENTIFIER)
-def removeFile(filePath):
-    os.remove(filePath)
+removeFile = defNode("Remove File", isExecutable=True, identifier=IDENTIFIER)(filesystem_functions.removeFile)
 
-@defNode("Remove Directory", isExecutable=True, identifier=IDENTIFIER)
-def removeDirectory(dirPath):
-    distutils.dir_util.remove_tree(dirPath)
+removeDirectory = defNode("Remove Directory", isExecutable=True, identifier=IDENTIFIER)(filesystem_functions.removeDirectory)
 
-@defNode("Create Directory", isExecutable=True, identifier=IDENTIFIER)
-def createDirectory(dirPath):
-    if not os.path.exists(dirPath):
-        os.mkdir(dirPath)
+createDirectory = defNode("Create Directory", isExecutable=True, identifier=IDENTIFIER)(filesystem_functions.createDirectory)
 
-@defNode("Path Exists", returnNames=["exists"], identifier=IDENTIFIER)
-def pathExists(path):
-    return os.path.exists(path)
+pathExists = defNode("Path Exists", returnNames=["exists"], identifier=IDENTIFIER)(filesystem_functions.pathExists)
 
-@defNode("Is File", returnNames=["isFile"], identifier=IDENTIFIER)
-def isFile(path):
-    return os.path.isfile(path)
+isFile = defNode("Is File", returnNames=["isFile"], identifier=IDENTIFIER)(filesystem_functions.isFile)
 
-@defNode("Is Directory", returnNames=["isDir"], identifier=IDENTIFIER)
-def isDirectory(path):
-    return os.path.isdir(path)
+isDirectory = defNode("Is Directory", returnNames=["isDir"], identifier=IDENTIFIER)(filesystem_functions.isDirectory)
 
-@defNode("Path Basename", returnNames=["basename"], identifier=IDENTIFIER)
-def getPathBasename(path):
-    return os.path.basename(path)
+getPathBasename = defNode("Path Basename", returnNames=["basename"], identifier=IDENTIFIER, isPure=True)(filesystem_functions.getPathBasename)
 
-@defNode("Path Directory", returnNames=["name"], identifier=IDENTIFIER)
-def getPathDirName(path):
-    return os.path.dirname(path)
+getPathDirName = defNode("Path Directory", returnNames=["name"], identifier=IDENTIFIER, isPure=True)(filesystem_functions.getPathDirName)
 
-@defNode("File Extension", returnNames=["ext"], identifier=IDENTIFIER)
-def getFileExtension(filePath):
-    return os.path.splitext(filePath)[1]
+getFileExtension = defNode("File Extension", returnNames=["ext"], identifier=IDENTIFIER, isPure=True)(filesystem_functions.getFileExtension)
 
-@defNode("Path Basename Without Extension", returnNames=["name"], identifier=IDENTIFIER)
-def getPathBasenameWithoutExt(filePath):
-    return os.path.splitext(os.path.basename(filePath))[0]
+getPathBasenameWithoutExt = defNode("Path Basename Without Extension", returnNames=["name"], identifier=IDENTIFIER, isPure=True)(filesystem_functions.getPathBasenameWithoutExt)
 
 class FileAndDirectoryWalker(BaseCustomCodeNode):
         __identifier__ = IDENTIFIER
@@ -98,7 +66,7 @@ class FileAndDirectoryWalker(BaseCustomCodeNode):
             walkStatement = f"os.walk({inputParams[0]})"
             loopConditionCode = code_generator.makeCodeLine(f"for {loopVarRoot},{loopVarDirs},{loopVarFiles} in {walkStatement}:", indent)
 
-            code_generator.expandCodeWithCondition(self.loop_body_port, sourceCodeLines, loopConditionCode, indent)
+            code_generator.expandCodeWithCondition(self.loop_body_port, sourceCodeLines, loopConditionCode, indent, isLoop=True)
 
             sourceCodeLines.append(code_generator.makeCodeLine(f"if not {code_generator.getParamName(self.recursiveInput)}:", indent=indent + code_generator.DEFAULT_INDENT))
             sourceCodeLines.append(code_generator.makeCodeLine(f"break", indent=indent + code_generator.DEFAULT_INDENT*2))
@@ -155,7 +123,7 @@ class FileWalker(BaseCustomCodeNode):
                             code_generator.makeCodeLine(f"if {extensions} != None and not {extensionOut} in {extensions}:", indent=indent + code_generator.DEFAULT_INDENT*2),
                             code_generator.makeCodeLine(f"continue", indent=indent + code_generator.DEFAULT_INDENT*3)]
 
-            code_generator.expandCodeWithCondition(self.loop_body_port, sourceCodeLines, innerLoopConditionCode, indent + code_generator.DEFAULT_INDENT, preBodyLines=preBodyLines)
+            code_generator.expandCodeWithCondition(self.loop_body_port, sourceCodeLines, innerLoopConditionCode, indent + code_generator.DEFAULT_INDENT, preBodyLines=preBodyLines, isLoop=True)
 
             sourceCodeLines.append(code_generator.makeCodeLine(f"if not {code_generator.getParamName(self.recursiveInput)}:", indent=indent + code_generator.DEFAULT_INDENT))
             sourceCodeLines.append(code_generator.makeCodeLine(f"break", indent=indent + code_generator.DEFAULT_INDENT*2))
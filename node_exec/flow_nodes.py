@@ -18,6 +18,10 @@ class ForLoopNode(BaseExecuteNode):
 
         self.add_output('Index')
 
+    @property
+    def hasImmutableOutputs(self):
+        return True
+
 
 class ForEachLoopNode(BaseExecuteNode):
     __identifier__ = FLOW_CONTROL_IDENTIFIER
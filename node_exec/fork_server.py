@@ -0,0 +1,249 @@
+"""
+A warm server process that executes graphs in forked children.
+
+The server imports the node runtime modules once and compiles the generated code of each job before it forks,
+so a run only pays for the fork instead of a new interpreter and the imports of all node modules.
+Jobs are received over a unix socket in the format of node_exec.execution_worker. The output of a forked
+child is written to its connection: the first line starts with PID_PREFIX and holds the process id of the
+child, followed by the output of execution_worker.reportJob and a final line starting with EXIT_PREFIX.
+
+Forking requires a POSIX system, see isSupported.
+
+Usage: python -u -m node_exec.fork_server <socket path>
+"""
+
+import os
+import sys
+import json
+import shutil
+import signal
+import socket
+import tempfile
+import threading
+import traceback
+import subprocess
+
+PID_PREFIX = "\x1enode_exec:pid:"
+EXIT_PREFIX = "\x1enode_exec:exit:"
+READY_LINE = "node_exec:fork_server:ready"
+
+# Seconds between two checks whether the process that started the server is still alive:
+PARENT_CHECK_INTERVAL = 1.0
+
+def isSupported():
+    return hasattr(os, "fork") and hasattr(socket, "AF_UNIX")
+
+def preloadModules():
+    # Generated code only imports the runtime modules, the node modules of the editor are not needed:
+    import node_exec.runtime.all_functions
+    import node_exec.execution_worker
+
+def readJob(conn):
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+def runChild(conn, job, code):
+    """
+    Executes the job in the forked child with stdout and stderr redirected to the connection.
+    Never returns.
+    """
+    exitCode = 1
+    try:
+        from node_exec import execution_worker
+
+        # The server ignores SIGCHLD to reap its children, graphs starting processes need the default:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        os.dup2(conn.fileno(), sys.stdout.fileno())
+        os.dup2(conn.fileno(), sys.stderr.fileno())
+
+        sys.stdout.write(f"{PID_PREFIX}{os.getpid()}\n")
+        sys.stdout.flush()
+        exitCode = execution_worker.reportJob(job, sys.stdout, code)
+    except:
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.write(f"{EXIT_PREFIX}{exitCode}\n")
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exitCode)
+
+def serve(socketPath):
+    from node_exec.code_cache import CompiledCodeCache
+
+    preloadModules()
+    codeCache = CompiledCodeCache()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socketPath)
+    server.listen()
+    server.settimeout(PARENT_CHECK_INTERVAL)
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    print(READY_LINE, flush=True)
+
+    parentPid = os.getppid()
+    try:
+        while os.getppid() == parentPid:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+
+            with conn:
+                conn.setblocking(True)
+                try:
+                    job = readJob(conn)
+                    # Interpreted jobs have no source, the child loads the graph:
+                    code = None
+                    if not job.get("interpret", False):
+                        code = codeCache.getCode(job["source"], job.get("filename", "<graph>"), job.get("cacheFilePath"))
+                except:
+                    conn.sendall((traceback.format_exc() + f"{EXIT_PREFIX}1\n").encode("utf-8"))
+                    continue
+
+                sys.stdout.flush()
+                sys.stderr.flush()
+                if os.fork() == 0:
+                    server.close()
+                    runChild(conn, job, code)
+    finally:
+        server.close()
+        shutil.rmtree(os.path.dirname(socketPath), ignore_errors=True)
+
+class ForkedRun(object):
+    """
+    A graph execution in a child of the fork server.
+    Provides the stdout, kill and wait members of subprocess.Popen used by the ExecutionService.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.pid = None
+        self.exitCode = None
+        self.isKilled = False
+        self.lock = threading.Lock()
+        self.stdout = self.readLines()
+
+    def readLines(self):
+        with self.conn, self.conn.makefile("r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.startswith(PID_PREFIX):
+                    with self.lock:
+                        self.pid = int(line[len(PID_PREFIX):])
+                        if self.isKilled:
+                            self.killChild()
+                elif line.startswith(EXIT_PREFIX):
+                    self.exitCode = int(line[len(EXIT_PREFIX):])
+                else:
+                    yield line
+
+    def killChild(self):
+        try:
+            os.kill(self.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+    def kill(self):
+        with self.lock:
+            self.isKilled = True
+            if self.pid != None:
+                self.killChild()
+
+    def wait(self):
+        """
+        Returns the exit code of the child or -SIGKILL if it ended without reporting one.
+        """
+        return self.exitCode if self.exitCode != None else -signal.SIGKILL
+
+class ForkServerClient(object):
+    """
+    Starts the fork server on demand and submits jobs to it.
+    The server ends when the process that started it ends. The temporary folder of its socket
+    is removed when the server ends, is stopped or is restarted.
+    """
+
+    def __init__(self, env=None):
+        self.env = env
+        self.process = None
+        self.socketPath = None
+        self.lock = threading.Lock()
+
+    def removeSocketFolder(self):
+        if self.socketPath != None:
+            shutil.rmtree(os.path.dirname(self.socketPath), ignore_errors=True)
+            self.socketPath = None
+
+    @staticmethod
+    def drainOutput(stream):
+        # The output of the server itself is discarded, reading it keeps the server from blocking on a full pipe:
+        for line in stream:
+            pass
+
+    def start(self):
+        """
+        Starts the server if it's not running and waits until it accepts jobs.
+
+        Returns:
+            bool: True if the server is ready.
+        """
+        with self.lock:
+            if self.process != None and self.process.poll() == None:
+                return True
+
+            self.removeSocketFolder()
+            self.socketPath = os.path.join(tempfile.mkdtemp(prefix="node_exec_"), "fork_server.sock")
+            self.process = subprocess.Popen([sys.executable, "-u", "-m", "node_exec.fork_server", self.socketPath],
+                                            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, env=self.env, text=True)
+
+            for line in self.process.stdout:
+                if line.rstrip("\n") == READY_LINE:
+                    threading.Thread(target=ForkServerClient.drainOutput, args=(self.process.stdout,), daemon=True).start()
+                    return True
+
+            print("Note: The fork server failed to start.")
+            self.process.wait()
+            self.process = None
+            self.removeSocketFolder()
+            return False
+
+    def stop(self):
+        with self.lock:
+            if self.process != None:
+                self.process.terminate()
+                self.process.wait()
+                self.process = None
+
+            self.removeSocketFolder()
+
+    def submit(self, job):
+        """
+        Sends the job to the server.
+
+        Returns:
+            ForkedRun: The run or None if the server is not available.
+        """
+        if not self.start():
+            return None
+
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(self.socketPath)
+            conn.sendall(json.dumps(job).encode("utf-8"))
+            conn.shutdown(socket.SHUT_WR)
+        except OSError as e:
+            print(f"Note: Failed to submit the job to the fork server: {str(e)}")
+            conn.close()
+            return None
+
+        return ForkedRun(conn)
+
+if __name__ == '__main__':
+    serve(sys.argv[1])
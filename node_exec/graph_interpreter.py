@@ -0,0 +1,252 @@
+"""
+This module executes a node graph directly without generating and importing a python module.
+"""
+
+from node_exec import base_nodes
+from node_exec import flow_nodes
+from node_exec import code_generator
+
+class GraphReturn(Exception):
+    """
+    Raised by return statements of the graph to leave the execution.
+    """
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+def loadGraph(session, startNodeName):
+    """
+    Creates a node graph with the registered nodes from a serialized session.
+    If no QApplication exists yet the graph is headless (see NodeGraph.headless).
+
+    Returns:
+        The graph and its start node.
+    """
+    import node_exec.nodes_cfg
+    node_exec.nodes_cfg.init()
+    # The code generator checks the node classes of both import paths of base_nodes (see getExecuteSource):
+    import VisualScripting.node_exec.base_nodes
+    from node_exec import all_nodes
+    import node_exec.NodeGraphQt_mod
+    from NodeGraphQt import NodeGraph
+
+    graph = NodeGraph()
+    for n in node_exec.nodes_cfg.NODES_TO_REGISTER:
+        try:
+            graph.register_node(n)
+        except:
+            pass
+
+    graph.deserialize_session(session)
+    return graph, graph.get_node_by_name(startNodeName)
+
+class GraphInterpreter(object):
+    """
+    Walks the execution chain from the start node and executes the code of each node in place.
+
+    The code of a node is the same code line the code generator emits. It is compiled once
+    and executed in an environment that holds the node outputs as variables. Data nodes are
+    evaluated on demand and their outputs are reused within the same block, like the
+    generated code does. The flow nodes of flow_nodes.py are handled by the interpreter itself.
+    Other custom code nodes are not supported (see isSupported).
+    """
+
+    def __init__(self, reportProgress=None):
+        """
+        Args:
+            reportProgress (callable): Optional function called with the id of each execution node before it is executed,
+                                       like PROGRESS_FUNCTION_NAME of generated modules with progress reports.
+        """
+        self.reportProgress = reportProgress
+        self.compiledCode = dict()
+        self.namespace = dict()
+        self.importLines = set()
+
+    def getCode(self, source, node, mode="exec"):
+        code = self.compiledCode.get((source, mode))
+        if code == None:
+            code = compile(source, f"<{node.name()}>", mode)
+            self.compiledCode[(source, mode)] = code
+
+        return code
+
+    def importModules(self, node, env):
+        importLines = list(node.importLines)
+        try:
+            moduleName = node.getModule()
+            if moduleName != None:
+                importLines.append(f"import {moduleName}")
+        except:
+            pass
+
+        for importLine in importLines:
+            if not importLine in self.importLines:
+                exec(importLine, self.namespace)
+                self.importLines.add(importLine)
+                env.update(self.namespace)
+
+    def isSupported(self, startNode):
+        """
+        Returns True if all execution nodes reachable from the start node can be interpreted.
+        """
+        visitedNodeIds = set()
+        stack = [startNode]
+        while len(stack) > 0:
+            node = stack.pop()
+            if node.id in visitedNodeIds:
+                continue
+
+            visitedNodeIds.add(node.id)
+            if isinstance(node, base_nodes.BaseCustomCodeNode) and not isinstance(node, flow_nodes.TryExceptFinallyNode):
+                return False
+
+            for port in node._outputs:
+                nextNode = code_generator.getConnectedNode(port) if port.is_exec else None
+                if nextNode != None:
+                    stack.append(nextNode)
+
+        return True
+
+    def execute(self, startNode, **kwargs):
+        """
+        Executes the graph from the start node.
+        The keyword arguments in0, in1, ... override the default inputs of the start node like for the generated execute function.
+
+        Returns:
+            The value of the executed return node or None.
+        """
+        env = dict(self.namespace)
+
+        paramValues = code_generator.getDefaultInputParamsSource(startNode)
+        params = []
+        for i in range(0, len(paramValues)):
+            paramName = f"in{i}"
+            params.append(paramName)
+            env[paramName] = kwargs[paramName] if paramName in kwargs else eval(str(paramValues[i]), env)
+
+        try:
+            self.executeChain(startNode, env, initialParams=params)
+        except GraphReturn as ret:
+            return ret.value
+
+        return None
+
+    def evaluate(self, source, node, env):
+        return eval(self.getCode(source, node, mode="eval"), env)
+
+    def run(self, source, node, env):
+        self.importModules(node, env)
+
+        # Return statements can't be executed outside of a function:
+        if source.startswith("return ") or source == "return":
+            raise GraphReturn(self.evaluate(source[len("return"):].strip() or "None", node, env))
+
+        exec(self.getCode(source, node), env)
+
+    def evaluateDataNode(self, node, env, boundNodeIds):
+        # Same walk as code_generator.generatePythonGetSourceCodeLines.
+        stack = [(node, False)]
+        while len(stack) > 0:
+            node, inputsExpanded = stack.pop()
+            if code_generator.isExecNode(node) or node.id in boundNodeIds:
+                continue
+
+            if inputsExpanded:
+                self.run(code_generator.getDataNodeCode(node), node, env)
+                boundNodeIds.add(node.id)
+            else:
+                stack.append((node, True))
+                for i in reversed(node._inputs):
+                    srcNode = code_generator.getConnectedNode(i)
+                    if srcNode != None:
+                        stack.append((srcNode, False))
+
+    def evaluateParams(self, node, env, boundNodeIds):
+        for i in node._inputs:
+            if not i.is_exec:
+                srcNode = code_generator.getConnectedNode(i)
+                if srcNode != None:
+                    self.evaluateDataNode(srcNode, env, boundNodeIds)
+
+    def executeBody(self, execPort, env):
+        """
+        Executes the chain connected to execPort in a new block.
+        Returns the ids of the data nodes bound at the end of the block.
+        """
+        boundNodeIds = set()
+        nextNode = code_generator.getNextExecNode(execPort)
+        if nextNode != None:
+            self.executeChain(nextNode, env, boundNodeIds)
+
+        return boundNodeIds
+
+    def executeChain(self, node, env, boundNodeIds=None, initialParams=None):
+        if boundNodeIds == None:
+            boundNodeIds = set()
+
+        while node != None:
+            if initialParams == None:
+                self.evaluateParams(node, env, boundNodeIds)
+
+            if self.reportProgress != None:
+                self.reportProgress(node.id)
+
+            if isinstance(node, flow_nodes.ForLoopNode):
+                loopVar = code_generator.getVarNameSource(node)
+                start = self.evaluate(code_generator.getParamName(node.in_start), node, env)
+                end = self.evaluate(code_generator.getParamName(node.in_end), node, env)
+                for env[loopVar] in range(start, end):
+                    self.executeBody(node.loop_body_port, env)
+                node = self.continueAfterBlock(node.loop_complete_port, boundNodeIds)
+            elif isinstance(node, flow_nodes.ForEachLoopNode):
+                loopVar = code_generator.getVarNameSource(node)
+                for env[loopVar] in self.evaluate(code_generator.getParamName(node._in), node, env):
+                    self.executeBody(node.loop_body_port, env)
+                node = self.continueAfterBlock(node.loop_complete_port, boundNodeIds)
+            elif isinstance(node, flow_nodes.WhileLoopNode):
+                condition = code_generator.getParamName(node.condition_port)
+                while self.evaluate(condition, node, env):
+                    bodyBoundNodeIds = self.executeBody(node.loop_body_port, env)
+                    self.evaluateParams(node, env, bodyBoundNodeIds)
+                node = self.continueAfterBlock(node.loop_complete_port, boundNodeIds)
+            elif isinstance(node, flow_nodes.IfNode):
+                if self.evaluate(code_generator.getParamName(node._in), node, env):
+                    self.executeBody(node.truePort, env)
+                else:
+                    self.executeBody(node.falsePort, env)
+                # The generated code ends after an if node.
+                node = None
+            elif isinstance(node, flow_nodes.TryExceptFinallyNode):
+                self.executeTryExceptFinally(node, env)
+                node = self.continueAfterBlock(node.completed_port, boundNodeIds)
+            elif isinstance(node, base_nodes.BaseCustomCodeNode):
+                raise NotImplementedError(f"The graph interpreter does not support {node.NODE_NAME} nodes.")
+            else:
+                self.run(code_generator.getExecNodeCode(node, initialParams), node, env)
+                node = code_generator.getExecOutNode(node)
+
+            initialParams = None
+
+    def continueAfterBlock(self, execPort, boundNodeIds):
+        # The code following a block starts a new context (see code_generator.SourceCodeLines.updateScopes).
+        boundNodeIds.clear()
+        return code_generator.getNextExecNode(execPort)
+
+    def executeTryExceptFinally(self, node, env):
+        # Without an exception variable the generated code uses a bare except clause:
+        hasExceptionVar = len(code_generator.getConnectedPorts(node.exception_var_port)) > 0
+        try:
+            self.executeBody(node.try_body_port, env)
+        except GraphReturn:
+            raise
+        except BaseException as e:
+            if hasExceptionVar and not isinstance(e, Exception):
+                raise
+
+            if hasExceptionVar:
+                env[code_generator.getVarNameSource(node)] = e
+
+            self.executeBody(node.except_body_port, env)
+        finally:
+            self.executeBody(node.finally_body_port, env)
@@ -17,12 +17,20 @@ class ConstInputNode(InlineNode):
 class ConstantStringNode(ConstInputNode):
     NODE_NAME = 'Constant String'
 
+    @property
+    def isPure(self):
+        return True
+
     def getInlineCode(self):
         return '{!r}'.format(self.get_property('constant'))
 
 class ConstantIntNode(ConstInputNode):
     NODE_NAME = 'Constant Int'
 
+    @property
+    def isPure(self):
+        return True
+
     def getInlineCode(self):
         try:
             val = self.get_property('constant')
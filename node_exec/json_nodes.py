@@ -1,35 +1,16 @@
-import json
 from node_exec.base_nodes import defNode
-import os
+from node_exec.runtime import json_functions
 
 IDENTIFIER = "Json"
 
-@defNode("Json Load From String", returnNames=["dict"], isExecutable=True, identifier=IDENTIFIER)
-def loadFromString(inputString):
-    return json.loads(inputString)
+loadFromString = defNode("Json Load From String", returnNames=["dict"], isExecutable=True, identifier=IDENTIFIER)(json_functions.loadFromString)
 
-@defNode("Json Load From File", returnNames=["dict"], isExecutable=True, identifier=IDENTIFIER)
-def loadFromFile(file):
-    return json.load(file)
+loadFromFile = defNode("Json Load From File", returnNames=["dict"], isExecutable=True, identifier=IDENTIFIER)(json_functions.loadFromFile)
 
-@defNode("Json Load From File Path", returnNames=["dict"], isExecutable=True, identifier=IDENTIFIER)
-def loadFromFilePath(filePath):
-    if os.path.exists(filePath):
-        with open(filePath, "r") as f:
-            return json.load(f)
-    else:
-        return None
+loadFromFilePath = defNode("Json Load From File Path", returnNames=["dict"], isExecutable=True, identifier=IDENTIFIER)(json_functions.loadFromFilePath)
 
-@defNode("Json Save To String", isExecutable=True, identifier=IDENTIFIER)
-def saveToString(obj, indent=4, sortKeys=True):
-    json.dumps(obj, indent=indent, sort_keys=sortKeys)
+saveToString = defNode("Json Save To String", isExecutable=True, identifier=IDENTIFIER)(json_functions.saveToString)
 
-@defNode("Json Save To File", isExecutable=True, identifier=IDENTIFIER)
-def saveToFile(obj, file, indent=4, sortKeys=True):
-    json.dump(obj, file, indent=indent, sort_keys=sortKeys)
+saveToFile = defNode("Json Save To File", isExecutable=True, identifier=IDENTIFIER)(json_functions.saveToFile)
 
-@defNode("Json Save To File Path", isExecutable=True, identifier=IDENTIFIER)
-def saveToFilePath(obj, filePath, indent=4, sortKeys=True):
-    if os.path.exists(filePath):
-        with open(filePath, "r") as f:
-            json.dump(obj, f, indent=indent, sort_keys=sortKeys)
+saveToFilePath = defNode("Json Save To File Path", isExecutable=True, identifier=IDENTIFIER)(json_functions.saveToFilePath)
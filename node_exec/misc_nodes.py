@@ -1,5 +1,6 @@
 from node_exec.base_nodes import BaseExecuteNode, ExecuteNode, defNode, BaseCustomNode, InlineNode
 from NodeGraphQt.widgets.node_property import NodeLineEdit
+from node_exec.runtime import misc_functions
 
 MISC_IDENTIFIER = 'Misc'
 
@@ -12,9 +13,15 @@ class ExecStart(BaseExecuteNode):
 
         self.add_exec_output("Execute")
 
+    def getFunctionName(self):
+        return f"{misc_functions.__name__}.execStart"
+
+    def getModule(self):
+        return misc_functions.__name__
+
     @staticmethod
     def execute():
-        pass
+        misc_functions.execStart()
 
 class PythonStatementNode(InlineNode):
     __identifier__ = MISC_IDENTIFIER
@@ -31,7 +38,4 @@ class PythonStatementNode(InlineNode):
     def getInlineCode(self):
         return self.get_property('code')
 
-@defNode('Print', identifier=MISC_IDENTIFIER, isExecutable=True)
-def _print(value):
-    print(value)
-
+_print = defNode('Print', identifier=MISC_IDENTIFIER, isExecutable=True)(misc_functions._print)
@@ -1,4 +1,5 @@
 from node_exec.base_nodes import defNode, defInlineNode, BaseCustomNode
+from node_exec.runtime import operator_functions
 
 OPERATOR_IDENTIFIER = 'Operator'
 
@@ -26,22 +27,32 @@ class AddMultipleNode(BaseCustomNode):
         for i in range(0, count):
             self.add_input(f"in{i}")
 
+    @property
+    def isPure(self):
+        return True
+
+    def getFunctionName(self):
+        return f"{operator_functions.__name__}.addMultiple"
+
+    def getModule(self):
+        return operator_functions.__name__
+
     @staticmethod
     def execute(*argv):
-        return sum(argv)
+        return operator_functions.addMultiple(*argv)
 
-@defInlineNode('Add', returnNames=["sum"], identifier=OPERATOR_IDENTIFIER)
+@defInlineNode('Add', returnNames=["sum"], identifier=OPERATOR_IDENTIFIER, isPure=True)
 def add(lhs, rhs):
     return f'{lhs} + {rhs}'
 
-@defInlineNode('Multiply', returnNames=["product"], identifier=OPERATOR_IDENTIFIER)
+@defInlineNode('Multiply', returnNames=["product"], identifier=OPERATOR_IDENTIFIER, isPure=True)
 def multiply(lhs, rhs):
     return f'{lhs} * {rhs}'
 
-@defInlineNode('Divide', returnNames=["quotient"], identifier=OPERATOR_IDENTIFIER)
+@defInlineNode('Divide', returnNames=["quotient"], identifier=OPERATOR_IDENTIFIER, isPure=True)
 def divide(lhs, rhs):
     return f'{lhs} / {rhs}'
 
-@defInlineNode('Subtract', returnNames=["difference"], identifier=OPERATOR_IDENTIFIER)
+@defInlineNode('Subtract', returnNames=["difference"], identifier=OPERATOR_IDENTIFIER, isPure=True)
 def subtract(lhs, rhs):
-    return f'{lhs} - {rhs}'
\ No newline at end of file
+    return f'{lhs} - {rhs}'
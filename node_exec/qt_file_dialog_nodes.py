@@ -1,20 +1,12 @@
 from node_exec.base_nodes import defNode, defInlineNode, BaseCustomNode
-from PySide2.QtWidgets import QFileDialog
+from node_exec.runtime import qt_file_dialog_functions
 
 IDENTIFIER = 'File Dialog'
 
-@defNode("Choose Existing Directory", isExecutable=True, returnNames=["directory"], identifier=IDENTIFIER)
-def chooseExistingDirectory(parentWindow=None, initialDir=""):
-    return QFileDialog.getExistingDirectory(parentWindow, "Open Directory", initialDir)
+chooseExistingDirectory = defNode("Choose Existing Directory", isExecutable=True, returnNames=["directory"], identifier=IDENTIFIER)(qt_file_dialog_functions.chooseExistingDirectory)
 
-@defNode("Choose File Name", isExecutable=True, returnNames=["filename", "selectedFilter"], identifier=IDENTIFIER)
-def chooseFileName(parentWindow=None, initialDir="", extensionFilter="Example (*.example *.exml);;Images (*.jpg *.tif)", selectedFilter=""):
-    return QFileDialog.getOpenFileName(parentWindow, "Open File", initialDir, extensionFilter)
+chooseFileName = defNode("Choose File Name", isExecutable=True, returnNames=["filename", "selectedFilter"], identifier=IDENTIFIER)(qt_file_dialog_functions.chooseFileName)
 
-@defNode("Choose File Names", isExecutable=True, returnNames=["filenames", "selectedFilter"], identifier=IDENTIFIER)
-def chooseFileNames(parentWindow=None, initialDir="", extensionFilter="Example (*.example *.exml);;Images (*.jpg *.tif)", selectedFilter=""):
-    return QFileDialog.getOpenFileNames(parentWindow, "Open Files", initialDir, extensionFilter)
+chooseFileNames = defNode("Choose File Names", isExecutable=True, returnNames=["filenames", "selectedFilter"], identifier=IDENTIFIER)(qt_file_dialog_functions.chooseFileNames)
 
-@defNode("Choose Save File Name", isExecutable=True, returnNames=["filename", "selectedFilter"], identifier=IDENTIFIER)
-def chooseSaveFileName(parentWindow=None, initialDir="", extensionFilter="Example (*.example *.exml);;Jpegs (*.jpg);;Tiffs (*.tif)", selectedFilter=""):
-    return QFileDialog.getSaveFileName(parentWindow, "Save File", initialDir, extensionFilter)
+chooseSaveFileName = defNode("Choose Save File Name", isExecutable=True, returnNames=["filename", "selectedFilter"], identifier=IDENTIFIER)(qt_file_dialog_functions.chooseSaveFileName)
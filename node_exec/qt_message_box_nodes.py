@@ -1,24 +1,14 @@
 from node_exec.base_nodes import defNode
-from PySide2.QtWidgets import QMessageBox
+from node_exec.runtime import qt_message_box_functions
 
 IDENTIFIER = "Message Box"
 
-@defNode("Question Message Box", isExecutable=True, returnNames=["Clicked Yes"], identifier=IDENTIFIER)
-def question(parentWindow=None, title="Question", text=""):
-    return QMessageBox.question(parentWindow, title,text) == QMessageBox.Yes
+question = defNode("Question Message Box", isExecutable=True, returnNames=["Clicked Yes"], identifier=IDENTIFIER)(qt_message_box_functions.question)
 
-@defNode("Critical Message Box", isExecutable=True, returnNames=["Clicked Ok"], identifier=IDENTIFIER)
-def critical(parentWindow=None, title="Critical", text=""):
-    return QMessageBox.critical(parentWindow, title, text) == QMessageBox.Ok
+critical = defNode("Critical Message Box", isExecutable=True, returnNames=["Clicked Ok"], identifier=IDENTIFIER)(qt_message_box_functions.critical)
 
-@defNode("Warning Message Box", isExecutable=True, returnNames=["Clicked Ok"], identifier=IDENTIFIER)
-def warning(parentWindow=None, title="Warning", text=""):
-    return QMessageBox.warning(parentWindow, title, text) == QMessageBox.Ok
+warning = defNode("Warning Message Box", isExecutable=True, returnNames=["Clicked Ok"], identifier=IDENTIFIER)(qt_message_box_functions.warning)
 
-@defNode("Information Message Box", isExecutable=True, returnNames=["Clicked Ok"], identifier=IDENTIFIER)
-def information(parentWindow=None, title="Information", text=""):
-    return QMessageBox.information(parentWindow, title, text) == QMessageBox.Ok
+information = defNode("Information Message Box", isExecutable=True, returnNames=["Clicked Ok"], identifier=IDENTIFIER)(qt_message_box_functions.information)
 
-@defNode("About Message Box", isExecutable=True, returnNames=[], identifier=IDENTIFIER)
-def about(parentWindow=None, title="About", text=""):
-    QMessageBox.about(parentWindow, title, text)
\ No newline at end of file
+about = defNode("About Message Box", isExecutable=True, returnNames=[], identifier=IDENTIFIER)(qt_message_box_functions.about)
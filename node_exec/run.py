@@ -0,0 +1,190 @@
+"""
+Executes saved graphs from the command line without the editor and without a QApplication.
+
+The graph is resolved by its category and name in the serialization folders and the execute function of
+its saved module is called with the given parameters. Parameter sets of a file are executed in parallel
+by a process pool. Every execution writes one JSON line to stdout:
+{"index": int, "params": dict, "result": ..., "error": str or null, "duration": float}
+Results that can't be written as JSON are written as their repr. The output of the graphs is redirected
+to stderr. The exit code is 1 if any execution failed.
+
+The parameter file contains one JSON object per line or a JSON list of objects, e.g. {"in0": "a.txt", "in1": 3}.
+Graphs with nodes that show dialogs need a QApplication and can't be executed by this runner.
+
+Usage:
+    python -m node_exec.run --folder <serialization folder> <category> <name> [--param in0=<value> ...]
+    python -m node_exec.run --folder <serialization folder> <category> <name> --params-file <file> [--jobs <count>]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import traceback
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+# The module of the graph, loaded once per process:
+graphModule = None
+
+def loadGraphModule(pythonFile, moduleName):
+    global graphModule
+
+    # Modules generated before the runtime split import the node modules, which register
+    # their nodes in nodes_cfg.NODES_TO_REGISTER when they are imported:
+    import node_exec.nodes_cfg
+    node_exec.nodes_cfg.init()
+
+    from node_exec.code_cache import CompiledCodeCache
+
+    with open(pythonFile, "r") as f:
+        source = f.read()
+
+    # Notes printed by imported modules must not mix with the result lines:
+    with contextlib.redirect_stdout(sys.stderr):
+        graphModule = CompiledCodeCache().createModule(source, moduleName, pythonFile)
+
+def toJsonValue(value):
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return repr(value)
+
+def executeParams(index, params):
+    """
+    Executes the loaded graph with the params and returns the result line as a dict.
+    """
+    result = None
+    error = None
+    startTime = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            result = toJsonValue(graphModule.execute(**params))
+    except Exception:
+        error = traceback.format_exc()
+
+    return {"index": index, "params": params, "result": result, "error": error, "duration": time.perf_counter() - startTime}
+
+def getFailedResultLine(index, params, error):
+    return {"index": index, "params": params, "result": None, "error": error, "duration": 0.0}
+
+def parseParam(param):
+    name, sep, value = param.partition("=")
+    if sep == "":
+        raise argparse.ArgumentTypeError(f"Expected <name>=<value>: {param}")
+
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, value
+
+def loadParamSets(paramsFilePath):
+    with open(paramsFilePath, "r") as f:
+        content = f.read()
+
+    if content.lstrip().startswith("["):
+        paramSets = json.loads(content)
+    else:
+        paramSets = [json.loads(line) for line in content.splitlines() if line.strip() != ""]
+
+    for paramSet in paramSets:
+        if not isinstance(paramSet, dict):
+            raise ValueError(f"Expected a JSON object as parameter set: {paramSet!r}")
+
+    return paramSets
+
+def writeResultLine(resultLine):
+    sys.stdout.write(json.dumps(resultLine) + "\n")
+    sys.stdout.flush()
+
+def runParamSets(pythonFile, moduleName, paramSets, jobs):
+    """
+    Executes the parameter sets in a process pool and writes the results in the order they complete.
+    If the pool breaks (e.g. a worker fails to load the graph module) the pending parameter sets fail.
+
+    Returns:
+        bool: True if all executions succeeded.
+    """
+    succeeded = True
+    with ProcessPoolExecutor(max_workers=jobs, initializer=loadGraphModule, initargs=(pythonFile, moduleName)) as executor:
+        futures = dict()
+        for i, params in enumerate(paramSets):
+            try:
+                futures[executor.submit(executeParams, i, params)] = i
+            except BrokenProcessPool as e:
+                succeeded = False
+                writeResultLine(getFailedResultLine(i, params, f"The process pool failed: {str(e)}"))
+
+        for future in as_completed(futures):
+            try:
+                resultLine = future.result()
+            except BrokenProcessPool as e:
+                i = futures[future]
+                resultLine = getFailedResultLine(i, paramSets[i], f"The process pool failed: {str(e)}")
+
+            succeeded = succeeded and resultLine["error"] == None
+            writeResultLine(resultLine)
+
+    return succeeded
+
+def createArgumentParser():
+    parser = argparse.ArgumentParser(prog="python -m node_exec.run", description="Executes a saved graph without the editor.")
+    parser.add_argument("category", help="The category of the graph.")
+    parser.add_argument("name", help="The name of the graph.")
+    parser.add_argument("--folder", dest="folders", action="append", required=True,
+                        help="A serialization folder that contains the graphs folder. Can be repeated.")
+    parser.add_argument("--param", dest="params", action="append", default=[], type=parseParam,
+                        help="An input of the start node as <name>=<value>, e.g. in0=\"a.txt\". The value is parsed as JSON if possible.")
+    parser.add_argument("--params-file", help="A file of parameter sets to execute the graph with.")
+    parser.add_argument("--catalog", help="A catalog database of the graphs to look up the graph without scanning the folders (see GraphCatalogDatabase).")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="The number of processes executing the parameter sets.")
+    return parser
+
+def main(args=None):
+    parser = createArgumentParser()
+    args = parser.parse_args(args)
+
+    from node_exec.GraphManager import GraphManager
+
+    graphManager = GraphManager(args.folders, catalogPath=args.catalog)
+    try:
+        settings = graphManager.getGraphSettings(args.name, args.category)
+    finally:
+        # Waits for the background scan of the catalog, no thread may be running when the process pool forks:
+        graphManager.close()
+
+    if settings == None:
+        parser.error(f"Unknown graph: {args.category}/{args.name}")
+
+    pythonFile = graphManager.getPythonCodePath(settings)
+    if not os.path.isfile(pythonFile):
+        parser.error(f"The graph has no generated module, save it in the editor first: {pythonFile}")
+
+    moduleName = graphManager.getModuleNameFromGraphName(settings.name)
+    params = dict(args.params)
+
+    try:
+        loadGraphModule(pythonFile, moduleName)
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+    if args.params_file == None:
+        resultLine = executeParams(0, params)
+        writeResultLine(resultLine)
+        return 0 if resultLine["error"] == None else 1
+
+    try:
+        paramSets = loadParamSets(args.params_file)
+    except (OSError, ValueError) as e:
+        parser.error(f"Failed to load the parameter sets: {str(e)}")
+
+    # Parameters of the command line apply to all parameter sets:
+    paramSets = [dict(params, **paramSet) for paramSet in paramSets]
+    return 0 if runParamSets(pythonFile, moduleName, paramSets, max(args.jobs, 1)) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
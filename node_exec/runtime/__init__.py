@@ -0,0 +1,10 @@
+"""
+The runtime functions and helper classes called by the generated code of the nodes.
+
+The modules of this package must not import Qt, NodeGraphQt or node_exec.base_nodes (except for the
+functions of nodes that show dialogs), so generated graph modules can be executed without loading the editor.
+The node modules of node_exec register these functions as nodes.
+"""
+
+# Module level function called with the id of each execution node if progress reports are generated:
+PROGRESS_FUNCTION_NAME = "_reportNodeProgress"
@@ -0,0 +1,22 @@
+import node_exec.runtime.collection_functions
+import node_exec.runtime.compare_functions
+import node_exec.runtime.convert_functions
+import node_exec.runtime.core_functions
+import node_exec.runtime.csv_functions
+import node_exec.runtime.excel_functions
+import node_exec.runtime.filesystem_functions
+import node_exec.runtime.json_functions
+import node_exec.runtime.misc_functions
+import node_exec.runtime.operator_functions
+import node_exec.runtime.qt_file_dialog_functions
+import node_exec.runtime.qt_input_functions
+import node_exec.runtime.qt_message_box_functions
+import node_exec.runtime.string_functions
+import node_exec.runtime.table_functions
+import node_exec.runtime.xml_functions
+import node_exec.runtime.zip_functions
+
+import os
+# Add functions that are only supported on windows:
+if os.name == 'nt':
+    import node_exec.runtime.windows_functions
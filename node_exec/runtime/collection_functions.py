@@ -0,0 +1,13 @@
+def append(collection, element):
+    collection.append(element)
+    return collection
+
+def addDictEntry(dictionary, key, value):
+    dictionary[key] = value
+    return dictionary
+
+def removeDictKey(dictionary, key):
+    '''
+    Returns the removed key. If the key does not exist None is returned.
+    '''
+    return dictionary.pop(key, None)
@@ -0,0 +1,2 @@
+def select(condition, trueValue, falseValue):
+    return trueValue if condition else falseValue
@@ -0,0 +1,5 @@
+def toInt(value):
+    return int(value)
+
+def toString(value):
+    return str(value)
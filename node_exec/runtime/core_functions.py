@@ -0,0 +1,2 @@
+def makeVar(initialValue=None):
+    return initialValue
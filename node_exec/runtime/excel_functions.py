@@ -0,0 +1,59 @@
+import os
+
+imported = False
+try:
+    import xlrd
+    imported = True
+except:
+    print("Note: Excel Nodes are not available because the xlrd module is missing: pip install xlrd")
+
+class ExcelTable:
+    def __init__(self, sheet):
+        self.sheet = sheet
+
+    def getRowValues(self, rowIndex):
+        return self.sheet.row_values(rowIndex) if self.sheet != None else []
+
+    def getColumnValues(self, colIndex):
+        return self.sheet.col_values(colIndex) if self.sheet != None else []
+
+    def getColumnsWithoutHeader(self):
+        return [self.getColumnValues(i)[1:] for i in range(0, self.ncols)]
+
+    def getHeader(self,rowIndex=0):
+        return self.getRowValues(rowIndex)
+
+    @property
+    def ncols(self):
+        return self.sheet.ncols if self.sheet != None else 0
+
+    @property
+    def nrows(self):
+        return self.sheet.nrows if self.sheet != None else 0
+
+    def getRowsWithoutHeader(self):
+        for rowIdx in range(1, self.nrows):
+            yield self.getRowValues(rowIdx)
+
+    def getCellValue(self, rowIndex, colIndex):
+        return self.sheet.cell_value(rowIndex, colIndex) if self.sheet != None else None
+
+    def getRowAsDict(self, headerValues, rowValues):
+        return dict(zip(headerValues, rowValues))
+
+if imported:
+    def createTableFromSheetName(workbookPath, sheetName, encodingOverride=None):
+        if os.path.exists(workbookPath):
+            return ExcelTable(xlrd.open_workbook(filename=workbookPath,encoding_override=encodingOverride).sheet_by_name(sheetName))
+        else:
+            print(f"Warning: The workbook file path \"{workbookPath}\" does not exist.")
+            return ExcelTable(None)
+
+    def openSheet(workbookPath, sheetName, encodingOverride=None):
+        return ExcelTable(xlrd.open_workbook(filename=workbookPath,encoding_override=encodingOverride if encodingOverride != '' else None).sheet_by_name(sheetName))
+
+    def openWorkbook(path, encodingOverride=None):
+        return xlrd.open_workbook(filename=path,encoding_override=encodingOverride if encodingOverride != '' else None)
+
+    def getSheetByName(workbook, sheetName):
+        return ExcelTable(workbook.sheet_by_name(sheetName))
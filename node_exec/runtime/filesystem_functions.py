@@ -0,0 +1,47 @@
+import shutil
+import os
+import distutils
+from distutils import dir_util
+
+def joinPaths(*args):
+    return os.path.join(*args)
+
+def copyDirectory(srcPath, dstPath):
+    distutils.dir_util.copy_tree(srcPath, dstPath)
+
+def copyFile(srcPath, dstPath):
+    shutil.copy2(srcPath, dstPath)
+
+def moveFileOrDirectory(srcPath, dstPath):
+    shutil.move(srcPath, dstPath)
+
+def removeFile(filePath):
+    os.remove(filePath)
+
+def removeDirectory(dirPath):
+    distutils.dir_util.remove_tree(dirPath)
+
+def createDirectory(dirPath):
+    if not os.path.exists(dirPath):
+        os.mkdir(dirPath)
+
+def pathExists(path):
+    return os.path.exists(path)
+
+def isFile(path):
+    return os.path.isfile(path)
+
+def isDirectory(path):
+    return os.path.isdir(path)
+
+def getPathBasename(path):
+    return os.path.basename(path)
+
+def getPathDirName(path):
+    return os.path.dirname(path)
+
+def getFileExtension(filePath):
+    return os.path.splitext(filePath)[1]
+
+def getPathBasenameWithoutExt(filePath):
+    return os.path.splitext(os.path.basename(filePath))[0]
@@ -0,0 +1,26 @@
+import json
+import os
+
+def loadFromString(inputString):
+    return json.loads(inputString)
+
+def loadFromFile(file):
+    return json.load(file)
+
+def loadFromFilePath(filePath):
+    if os.path.exists(filePath):
+        with open(filePath, "r") as f:
+            return json.load(f)
+    else:
+        return None
+
+def saveToString(obj, indent=4, sortKeys=True):
+    json.dumps(obj, indent=indent, sort_keys=sortKeys)
+
+def saveToFile(obj, file, indent=4, sortKeys=True):
+    json.dump(obj, file, indent=indent, sort_keys=sortKeys)
+
+def saveToFilePath(obj, filePath, indent=4, sortKeys=True):
+    if os.path.exists(filePath):
+        with open(filePath, "r") as f:
+            json.dump(obj, f, indent=indent, sort_keys=sortKeys)
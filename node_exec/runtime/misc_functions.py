@@ -0,0 +1,5 @@
+def execStart():
+    pass
+
+def _print(value):
+    print(value)
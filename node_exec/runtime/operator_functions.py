@@ -0,0 +1,2 @@
+def addMultiple(*argv):
+    return sum(argv)
@@ -0,0 +1,13 @@
+from PySide2.QtWidgets import QFileDialog
+
+def chooseExistingDirectory(parentWindow=None, initialDir=""):
+    return QFileDialog.getExistingDirectory(parentWindow, "Open Directory", initialDir)
+
+def chooseFileName(parentWindow=None, initialDir="", extensionFilter="Example (*.example *.exml);;Images (*.jpg *.tif)", selectedFilter=""):
+    return QFileDialog.getOpenFileName(parentWindow, "Open File", initialDir, extensionFilter)
+
+def chooseFileNames(parentWindow=None, initialDir="", extensionFilter="Example (*.example *.exml);;Images (*.jpg *.tif)", selectedFilter=""):
+    return QFileDialog.getOpenFileNames(parentWindow, "Open Files", initialDir, extensionFilter)
+
+def chooseSaveFileName(parentWindow=None, initialDir="", extensionFilter="Example (*.example *.exml);;Jpegs (*.jpg);;Tiffs (*.tif)", selectedFilter=""):
+    return QFileDialog.getSaveFileName(parentWindow, "Save File", initialDir, extensionFilter)
@@ -0,0 +1,16 @@
+from PySide2.QtWidgets import QMessageBox
+
+def question(parentWindow=None, title="Question", text=""):
+    return QMessageBox.question(parentWindow, title,text) == QMessageBox.Yes
+
+def critical(parentWindow=None, title="Critical", text=""):
+    return QMessageBox.critical(parentWindow, title, text) == QMessageBox.Ok
+
+def warning(parentWindow=None, title="Warning", text=""):
+    return QMessageBox.warning(parentWindow, title, text) == QMessageBox.Ok
+
+def information(parentWindow=None, title="Information", text=""):
+    return QMessageBox.information(parentWindow, title, text) == QMessageBox.Ok
+
+def about(parentWindow=None, title="About", text=""):
+    QMessageBox.about(parentWindow, title, text)
@@ -0,0 +1,53 @@
+import re
+
+def concat(seperator, *argv):
+    sep = seperator if seperator != None else ''
+    return sep.join([(s if s != None else '') for s in argv])
+
+def removeWhiteSpace(value):
+    return "".join(value.split())
+
+def _strip(value):
+    return value.strip()
+
+def _split(value, seperator):
+    return value.split(None if seperator == '' else seperator)
+
+def isEmptyOrWhitespace(value):
+    return value == None or value == '' or value.isspace()
+
+def regexMatch(pattern, string, flags):
+    return re.match(pattern, string, flags=(0 if flags == None or flags == '' else flags))
+
+def regexFullmatch(pattern, string, flags):
+    return re.fullmatch(pattern, string, flags=(0 if flags == None or flags == '' else flags))
+
+def regexSearch(pattern, string, flags):
+    return re.search(pattern, string, flags=(0 if flags == None or flags == '' else flags))
+
+def regexFindall(pattern, string, flags):
+    return re.findall(pattern, string, flags=(0 if flags == None or flags == '' else flags))
+
+def regexSplit(pattern, string, flags):
+    return re.split(pattern, string, flags=(0 if flags == None or flags == '' else flags))
+
+def regexSub(pattern, replacement, string, count, flags):
+    if count == None or count == '':
+        count = 0
+
+    return re.sub(pattern, replacement, string, count=count, flags=(0 if flags == None or flags == '' else flags))
+
+def regexFindIter(pattern, string, flags):
+    return re.finditer(pattern, string, flags=(0 if flags == None or flags == '' else flags))
+
+def regexEscape(pattern):
+    return re.escape(pattern)
+
+def regexMatchObjectGroup(matchObject, groupIndex):
+    return matchObject.group(groupIndex) if matchObject != None else None
+
+def regexMatchObjectAllGroups(matchObject):
+    return matchObject.groups() if matchObject != None else ()
+    
+def regexMatchObjectGroupDict(matchObject):
+    return matchObject.groupdict() if matchObject != None else dict()
@@ -0,0 +1,5 @@
+def getRowValues(table, rowIndex):
+    return table.getRowValues(rowIndex)
+
+def getCellValue(table, rowIndex, colIndex):
+    return table.getCellValue(rowIndex, colIndex)
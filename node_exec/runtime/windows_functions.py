@@ -0,0 +1,10 @@
+import subprocess
+import os
+
+def selectInExplorer(path):
+    if os.path.exists(path):
+        subprocess.Popen(f'explorer /select,"{os.path.normpath(path)}"')
+
+def openFile(filePath):
+    if os.path.exists(filePath):
+        subprocess.Popen(f'explorer /start,"{os.path.normpath(filePath)}"')
@@ -0,0 +1,81 @@
+import xml.etree.cElementTree as ET
+from collections import OrderedDict
+
+imported = False
+try:
+    import xmltodict
+    imported = True
+except:
+    print("Note: XML to dict nodes are not available because the xmltodict module is missing: pip install xmltodict")
+
+if imported:
+    def xmlStringToDict(xmlString=""):
+        return xmltodict.parse(xmlString)
+
+    def xmlFileToDict(xmlPath=""):
+        try:
+            with open(xmlPath, 'r') as f:
+                return xmltodict.parse(f.read())
+        except Exception as e:
+            print(f"Warning: Failed to parse {xmlPath} : {str(e)}")
+            return dict()
+
+    def flattenDict(d):
+        def items():
+            for key, value in d.items():
+                if isinstance(value, dict):
+                    for subkey, subvalue in flattenDict(value).items():
+                        yield key + "." + subkey, subvalue
+                else:
+                    yield key, value
+
+        return OrderedDict(items())
+
+    def xmlFileAsFlatDict(xmlPath=""):
+        try:
+            with open(xmlPath, 'r') as f:
+                theDict = xmltodict.parse(f.read())
+
+            return flattenDict(theDict)
+        except Exception as e:
+            print(f"Warning: Failed to parse {xmlPath}: {str(e)}")
+            return dict()
+
+def xmlToFlatDict(element, theDict):
+    if len(element) > 0:
+        for child in element:
+            xmlToFlatDict(child, theDict)
+    else:
+        theDict[element.tag] = element.text
+
+def xmlFileAsSimpleFlatDict(xmlPath=""):
+    rootElement = ET.parse(xmlPath).getroot()
+
+    theDict = OrderedDict()
+    xmlToFlatDict(rootElement, theDict)
+
+    return theDict
+
+def getXMLRoot(xmlPath=""):
+    return ET.parse(xmlPath).getroot()
+        
+def getXMLElements(xmlElement=None, key=""):
+    return xmlElement.findall(key)
+
+def findXMLElement(xmlElement=None, key=""):
+    return xmlElement.find(key)
+
+def findXMLElementAndGetTag(xmlElement=None, key=""):
+    return xmlElement.find(key).tag
+
+def findXMLElementAndGetText(xmlElement=None, key=""):
+    return xmlElement.find(key).text
+
+def getXMLElementValue(xmlElement=None, key=""):
+    return xmlElement.get(key)
+
+def getXMLElementText(xmlElement=None, key=""):
+    return xmlElement.text
+
+def getXMLElementTag(xmlElement=None, key=""):
+    return xmlElement.tag
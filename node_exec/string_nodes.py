@@ -1,5 +1,5 @@
 from node_exec.base_nodes import defNode, BaseCustomNode, VariableInputCountNode
-import re
+from node_exec.runtime import string_functions
 
 STRING_IDENTIFIER = 'String'
 
@@ -13,70 +13,46 @@ class ConcatNode(VariableInputCountNode):
         self.add_input("seperator")
         self.add_output("return")
 
+    @property
+    def isPure(self):
+        return True
+
+    def getFunctionName(self):
+        return f"{string_functions.__name__}.concat"
+
+    def getModule(self):
+        return string_functions.__name__
+
     @staticmethod
     def execute(seperator, *argv):
-        sep = seperator if seperator != None else ''
-        return sep.join([(s if s != None else '') for s in argv])
-
-@defNode('Remove Whitespace', returnNames=["str"], identifier=STRING_IDENTIFIER)
-def removeWhiteSpace(value):
-    return "".join(value.split())
-
-@defNode('Strip', returnNames=["str"], identifier=STRING_IDENTIFIER)
-def _strip(value):
-    return value.strip()
-
-@defNode('Split', returnNames=["str_list"], identifier=STRING_IDENTIFIER)
-def _split(value, seperator):
-    return value.split(None if seperator == '' else seperator)
-
-@defNode('Is Empty or Whitespace', returnNames=["str"], identifier=STRING_IDENTIFIER)
-def isEmptyOrWhitespace(value):
-    return value == None or value == '' or value.isspace()
-
-@defNode('Regex Match', returnNames=["MatchObj"], identifier=STRING_IDENTIFIER)
-def regexMatch(pattern, string, flags):
-    return re.match(pattern, string, flags=(0 if flags == None or flags == '' else flags))
-
-@defNode('Regex Full Match', returnNames=["MatchObj"], identifier=STRING_IDENTIFIER)
-def regexFullmatch(pattern, string, flags):
-    return re.fullmatch(pattern, string, flags=(0 if flags == None or flags == '' else flags))
-
-@defNode('Regex Search', returnNames=["MatchObj"], identifier=STRING_IDENTIFIER)
-def regexSearch(pattern, string, flags):
-    return re.search(pattern, string, flags=(0 if flags == None or flags == '' else flags))
-
-@defNode('Regex Find All', returnNames=["MatchObjects"], identifier=STRING_IDENTIFIER)
-def regexFindall(pattern, string, flags):
-    return re.findall(pattern, string, flags=(0 if flags == None or flags == '' else flags))
-
-@defNode('Regex Split', returnNames=["substring_list"], identifier=STRING_IDENTIFIER)
-def regexSplit(pattern, string, flags):
-    return re.split(pattern, string, flags=(0 if flags == None or flags == '' else flags))
-
-@defNode('Regex Sub', returnNames=["str"], identifier=STRING_IDENTIFIER)
-def regexSub(pattern, replacement, string, count, flags):
-    if count == None or count == '':
-        count = 0
-
-    return re.sub(pattern, replacement, string, count=count, flags=(0 if flags == None or flags == '' else flags))
-
-@defNode('Regex Find Iterator', returnNames=["iter"], identifier=STRING_IDENTIFIER)
-def regexFindIter(pattern, string, flags):
-    return re.finditer(pattern, string, flags=(0 if flags == None or flags == '' else flags))
-
-@defNode('Regex Escape', returnNames=["str"], identifier=STRING_IDENTIFIER)
-def regexEscape(pattern):
-    return re.escape(pattern)
-
-@defNode('Regex MatchObject Group', returnNames=["str"], identifier=STRING_IDENTIFIER)
-def regexMatchObjectGroup(matchObject, groupIndex):
-    return matchObject.group(groupIndex) if matchObject != None else None
-
-@defNode('Regex MatchObject All Groups', returnNames=["groups"], identifier=STRING_IDENTIFIER)
-def regexMatchObjectAllGroups(matchObject):
-    return matchObject.groups() if matchObject != None else []
-    
-@defNode('Regex MatchObject Group Dict', returnNames=["dict"], identifier=STRING_IDENTIFIER)
-def regexMatchObjectGroupDict(matchObject):
-    return matchObject.groupdict() if matchObject != None else dict()
\ No newline at end of file
+        return string_functions.concat(seperator, *argv)
+
+removeWhiteSpace = defNode('Remove Whitespace', returnNames=["str"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions.removeWhiteSpace)
+
+_strip = defNode('Strip', returnNames=["str"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions._strip)
+
+_split = defNode('Split', returnNames=["str_list"], identifier=STRING_IDENTIFIER)(string_functions._split)
+
+isEmptyOrWhitespace = defNode('Is Empty or Whitespace', returnNames=["str"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions.isEmptyOrWhitespace)
+
+regexMatch = defNode('Regex Match', returnNames=["MatchObj"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions.regexMatch)
+
+regexFullmatch = defNode('Regex Full Match', returnNames=["MatchObj"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions.regexFullmatch)
+
+regexSearch = defNode('Regex Search', returnNames=["MatchObj"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions.regexSearch)
+
+regexFindall = defNode('Regex Find All', returnNames=["MatchObjects"], identifier=STRING_IDENTIFIER)(string_functions.regexFindall)
+
+regexSplit = defNode('Regex Split', returnNames=["substring_list"], identifier=STRING_IDENTIFIER)(string_functions.regexSplit)
+
+regexSub = defNode('Regex Sub', returnNames=["str"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions.regexSub)
+
+regexFindIter = defNode('Regex Find Iterator', returnNames=["iter"], identifier=STRING_IDENTIFIER)(string_functions.regexFindIter)
+
+regexEscape = defNode('Regex Escape', returnNames=["str"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions.regexEscape)
+
+regexMatchObjectGroup = defNode('Regex MatchObject Group', returnNames=["str"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions.regexMatchObjectGroup)
+
+regexMatchObjectAllGroups = defNode('Regex MatchObject All Groups', returnNames=["groups"], identifier=STRING_IDENTIFIER, isPure=True)(string_functions.regexMatchObjectAllGroups)
+
+regexMatchObjectGroupDict = defNode('Regex MatchObject Group Dict', returnNames=["dict"], identifier=STRING_IDENTIFIER)(string_functions.regexMatchObjectGroupDict)
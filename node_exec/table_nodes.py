@@ -1,19 +1,16 @@
 from node_exec.base_nodes import defNode, defInlineNode
+from node_exec.runtime import table_functions
 
 TABLE_IDENTIFIER = 'Table'
 
-@defNode(name='Row Values', returnNames=['row values'], identifier=TABLE_IDENTIFIER)
-def getRowValues(table, rowIndex):
-    return table.getRowValues(rowIndex)
+getRowValues = defNode(name='Row Values', returnNames=['row values'], identifier=TABLE_IDENTIFIER)(table_functions.getRowValues)
 
-@defInlineNode(name='Number Of Columns', returnNames=['value'], identifier=TABLE_IDENTIFIER)
+@defInlineNode(name='Number Of Columns', returnNames=['value'], identifier=TABLE_IDENTIFIER, isPure=True, hasImmutableOutputs=True)
 def getNumberOfColumns(table):
     return f'{table}.ncols'
 
-@defInlineNode(name='Number Of Rows', returnNames=['value'], identifier=TABLE_IDENTIFIER)
+@defInlineNode(name='Number Of Rows', returnNames=['value'], identifier=TABLE_IDENTIFIER, isPure=True, hasImmutableOutputs=True)
 def getNumberOfRows(table):
     return f'{table}.nrows'
 
-@defNode(name='Get Cell Value', returnNames=['value'], identifier=TABLE_IDENTIFIER)
-def getCellValue(table, rowIndex, colIndex):
-    return table.getCellValue(rowIndex, colIndex)
\ No newline at end of file
+getCellValue = defNode(name='Get Cell Value', returnNames=['value'], identifier=TABLE_IDENTIFIER)(table_functions.getCellValue)
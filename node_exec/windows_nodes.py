@@ -1,15 +1,8 @@
 from node_exec.base_nodes import defNode, defInlineNode
-import subprocess
-import os
+from node_exec.runtime import windows_functions
 
 WINDOWS_NODE_IDENTIFIER = "Windows"
 
-@defNode("Select in Explorer", isExecutable=True, identifier=WINDOWS_NODE_IDENTIFIER)
-def selectInExplorer(path):
-    if os.path.exists(path):
-        subprocess.Popen(f'explorer /select,"{os.path.normpath(path)}"')
+selectInExplorer = defNode("Select in Explorer", isExecutable=True, identifier=WINDOWS_NODE_IDENTIFIER)(windows_functions.selectInExplorer)
 
-@defNode("Open File", isExecutable=True, identifier=WINDOWS_NODE_IDENTIFIER)
-def openFile(filePath):
-    if os.path.exists(filePath):
-        subprocess.Popen(f'explorer /start,"{os.path.normpath(filePath)}"')
\ No newline at end of file
+openFile = defNode("Open File", isExecutable=True, identifier=WINDOWS_NODE_IDENTIFIER)(windows_functions.openFile)
@@ -0,0 +1,53 @@
+import importlib.util
+import os
+import re
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# The repository root is the VisualScripting package:
+if "VisualScripting" not in sys.modules:
+    spec = importlib.util.spec_from_file_location("VisualScripting", os.path.join(ROOT, "__init__.py"),
+                                                  submodule_search_locations=[ROOT])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["VisualScripting"] = module
+    spec.loader.exec_module(module)
+
+import node_exec.nodes_cfg
+node_exec.nodes_cfg.init()
+import VisualScripting.node_exec.base_nodes
+from node_exec import all_nodes
+import node_exec.NodeGraphQt_mod
+from NodeGraphQt import NodeGraph
+
+
+def createGraph():
+    graph = NodeGraph()
+    for n in node_exec.nodes_cfg.NODES_TO_REGISTER:
+        try:
+            graph.register_node(n)
+        except:
+            pass
+
+    return graph
+
+def connect(outNode, outPortName, inNode, inPortName):
+    outNode.outputs()[outPortName].connect_to(inNode.inputs()[inPortName])
+
+def normalizeIds(source):
+    """
+    Replaces the node ids in generated code by numbers in the order of their first appearance.
+    """
+    ids = {}
+    return re.sub(r"0x[0-9a-f]+", lambda m: ids.setdefault(m.group(0), f"n{len(ids)}"), source)
+
+@pytest.fixture
+def graph():
+    """
+    Headless node graph with the scripting nodes registered.
+    """
+    return createGraph()
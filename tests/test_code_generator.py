@@ -0,0 +1,279 @@
+import pytest
+
+from conftest import connect, normalizeIds
+from node_exec import code_generator
+from node_exec.runtime import PROGRESS_FUNCTION_NAME
+
+
+def createLoopGraph(graph):
+    """
+    for i in range(0,3): print(i + 2 * 3); print(i + 2 * 3)
+    The multiplication is loop invariant and both additions are equal. The PathExists node is unreachable.
+    """
+    start = graph.create_node("Misc.ExecStart", name="Start")
+    loop = graph.create_node("Flow Control.ForLoopNode")
+    loop.set_property("p_Start", 0)
+    loop.set_property("p_End", 3)
+    connect(start, "Execute", loop, "Execute")
+
+    mul = graph.create_node("Operator.Multiply")
+    mul.set_property("p_lhs", 2)
+    mul.set_property("p_rhs", 3)
+
+    prevNode = loop
+    prevPortName = "Iteration"
+    for i in range(2):
+        add = graph.create_node("Operator.Add")
+        connect(loop, "Index", add, "lhs")
+        connect(mul, "product", add, "rhs")
+
+        printNode = graph.create_node("Misc.Print")
+        connect(prevNode, prevPortName, printNode, "Execute")
+        connect(add, "sum", printNode, "value")
+        prevNode = printNode
+        prevPortName = "Execute"
+
+    graph.create_node("Filesystem.PathExists")
+    return start
+
+HEADER = (
+    "import node_exec.runtime.misc_functions\n"
+    "\n"
+    "def execute():\n"
+    "    node_exec.runtime.misc_functions.execStart()\n"
+)
+
+GOLDEN_SOURCES = {
+    "default": HEADER + (
+        "    for var_n0_0 in range(0,3):\n"
+        "        var_n1_0 = 2 * 3\n"
+        "        var_n2_0 = var_n0_0 + var_n1_0\n"
+        "        node_exec.runtime.misc_functions._print(var_n2_0)\n"
+        "        var_n3_0 = var_n0_0 + var_n1_0\n"
+        "        node_exec.runtime.misc_functions._print(var_n3_0)\n"
+    ),
+    "hoistLoopInvariants": HEADER + (
+        "    var_n0_pending = True\n"
+        "    for var_n1_0 in range(0,3):\n"
+        "        if var_n0_pending: var_n0_0 = 2 * 3; var_n0_pending = False\n"
+        "        var_n2_0 = var_n1_0 + var_n0_0\n"
+        "        node_exec.runtime.misc_functions._print(var_n2_0)\n"
+        "        var_n3_0 = var_n1_0 + var_n0_0\n"
+        "        node_exec.runtime.misc_functions._print(var_n3_0)\n"
+    ),
+    "eliminateCommonSubexpressions": HEADER + (
+        "    for var_n0_0 in range(0,3):\n"
+        "        var_n1_0 = 2 * 3\n"
+        "        var_n2_0 = var_n0_0 + var_n1_0\n"
+        "        node_exec.runtime.misc_functions._print(var_n2_0)\n"
+        "        var_n3_0 = var_n2_0\n"
+        "        node_exec.runtime.misc_functions._print(var_n3_0)\n"
+    ),
+    "foldConstants": HEADER + (
+        "    for var_n0_0 in range(0,3):\n"
+        "        var_n1_0 = 6\n"
+        "        var_n2_0 = var_n0_0 + var_n1_0\n"
+        "        node_exec.runtime.misc_functions._print(var_n2_0)\n"
+        "        var_n3_0 = var_n0_0 + var_n1_0\n"
+        "        node_exec.runtime.misc_functions._print(var_n3_0)\n"
+    ),
+}
+
+@pytest.mark.parametrize("option", sorted(GOLDEN_SOURCES))
+def test_golden_source(graph, option, capsys):
+    start = createLoopGraph(graph)
+    options = {} if option == "default" else {option: True}
+    source = code_generator.CodeGenerator(**options).generatePythonSource(graph, "G", start)
+
+    assert normalizeIds(source) == GOLDEN_SOURCES[option]
+
+    # Every option prints the same values:
+    namespace = {}
+    exec(source, namespace)
+    namespace["execute"]()
+    assert capsys.readouterr().out.split() == ["6", "6", "7", "7", "8", "8"]
+
+def test_pruned_nodes(graph):
+    start = createLoopGraph(graph)
+    generator = code_generator.CodeGenerator()
+    generator.generatePythonSource(graph, "G", start)
+    assert [n.type_ for n in generator.prunedNodes] == ["Filesystem.PathExists"]
+
+def test_deep_data_chain(graph):
+    start = graph.create_node("Misc.ExecStart", name="Start")
+    add = graph.create_node("Operator.Add")
+    add.set_property("p_lhs", 1)
+    add.set_property("p_rhs", 1)
+    # Deeper than the default recursion limit:
+    for i in range(1500):
+        nextAdd = graph.create_node("Operator.Add")
+        connect(add, "sum", nextAdd, "lhs")
+        nextAdd.set_property("p_rhs", 1)
+        add = nextAdd
+
+    returnNode = graph.create_node("Default.Return")
+    connect(start, "Execute", returnNode, "Execute")
+    connect(add, "sum", returnNode, "inParam")
+
+    source = code_generator.CodeGenerator().generatePythonSource(graph, "G", start)
+    namespace = {}
+    exec(source, namespace)
+    assert namespace["execute"]() == 1502
+
+@pytest.mark.parametrize("foldConstants", [False, True])
+def test_hoisted_code_in_empty_loop_is_not_executed(graph, foldConstants):
+    start = graph.create_node("Misc.ExecStart", name="Start")
+    createList = graph.create_node("Collection.CreateList")
+    connect(start, "Execute", createList, "Execute")
+    loop = graph.create_node("Flow Control.ForEachLoopNode")
+    connect(createList, "Execute", loop, "Execute")
+    connect(createList, "list", loop, "Collection")
+
+    divide = graph.create_node("Operator.Divide")
+    divide.set_property("p_lhs", 1)
+    divide.set_property("p_rhs", 0)
+    printNode = graph.create_node("Misc.Print")
+    connect(loop, "Iteration", printNode, "Execute")
+    connect(divide, "quotient", printNode, "value")
+
+    generator = code_generator.CodeGenerator(hoistLoopInvariants=True, foldConstants=foldConstants)
+    source = generator.generatePythonSource(graph, "G", start)
+    assert "_pending" in source
+
+    # The collection is empty, 1 / 0 must not be computed:
+    namespace = {}
+    exec(source, namespace)
+    namespace["execute"]()
+
+def test_mutable_results_are_not_hoisted(graph, capsys):
+    start = graph.create_node("Misc.ExecStart", name="Start")
+    loop = graph.create_node("Flow Control.ForLoopNode")
+    loop.set_property("p_Start", 0)
+    loop.set_property("p_End", 2)
+    connect(start, "Execute", loop, "Execute")
+
+    # [1] + [2] creates a new list in every iteration, which is changed by the append node:
+    add = graph.create_node("Operator.Add")
+    add.set_property("p_lhs", "[1]")
+    add.set_property("p_rhs", "[2]")
+    append = graph.create_node("Collection.Append")
+    connect(loop, "Iteration", append, "Execute")
+    connect(add, "sum", append, "collection")
+    connect(loop, "Index", append, "element")
+    printNode = graph.create_node("Misc.Print")
+    connect(append, "Execute", printNode, "Execute")
+    connect(append, "collection", printNode, "value")
+
+    source = code_generator.CodeGenerator(hoistLoopInvariants=True).generatePythonSource(graph, "G", start)
+    assert "_pending" not in source
+
+    namespace = {}
+    exec(source, namespace)
+    namespace["execute"]()
+    assert capsys.readouterr().out.splitlines() == ["[1, 2, 0]", "[1, 2, 1]"]
+
+def test_mutable_results_are_not_shared(graph, capsys):
+    start = graph.create_node("Misc.ExecStart", name="Start")
+    prevNode = start
+    for i in range(2):
+        add = graph.create_node("Operator.Add")
+        add.set_property("p_lhs", "[1]")
+        add.set_property("p_rhs", "[2]")
+        append = graph.create_node("Collection.Append")
+        append.set_property("p_element", i)
+        connect(prevNode, "Execute", append, "Execute")
+        connect(add, "sum", append, "collection")
+        printNode = graph.create_node("Misc.Print")
+        connect(append, "Execute", printNode, "Execute")
+        connect(append, "collection", printNode, "value")
+        prevNode = printNode
+
+    source = code_generator.CodeGenerator(eliminateCommonSubexpressions=True).generatePythonSource(graph, "G", start)
+    namespace = {}
+    exec(source, namespace)
+    namespace["execute"]()
+    assert capsys.readouterr().out.splitlines() == ["[1, 2, 0]", "[1, 2, 1]"]
+
+def test_large_constants_are_not_folded(graph):
+    start = graph.create_node("Misc.ExecStart", name="Start")
+    mul = graph.create_node("Operator.Multiply")
+    mul.set_property("p_lhs", "'x'")
+    mul.set_property("p_rhs", 10**6)
+    returnNode = graph.create_node("Default.Return")
+    connect(start, "Execute", returnNode, "Execute")
+    connect(mul, "product", returnNode, "inParam")
+
+    source = code_generator.CodeGenerator(foldConstants=True).generatePythonSource(graph, "G", start)
+    assert "'x' * 1000000" in source
+    assert len(source) < code_generator.MAX_CONSTANT_REPR_LENGTH * 4
+
+def test_sources_with_and_without_progress(graph):
+    start = createLoopGraph(graph)
+    generator = code_generator.CodeGenerator()
+    source, progressSource = generator.generatePythonSources(graph, "G", start)
+
+    assert source == generator.generatePythonSource(graph, "G", start)
+    assert progressSource == generator.generatePythonSource(graph, "G", start, reportProgress=True)
+    assert PROGRESS_FUNCTION_NAME not in source
+    assert PROGRESS_FUNCTION_NAME in progressSource
+
+def test_incremental_generation(graph, monkeypatch):
+    start = createLoopGraph(graph)
+    generator = code_generator.CodeGenerator(incremental=True)
+    generator.generatePythonSource(graph, "G", start)
+    cache = generator.nodeCodeCache
+    assert cache.dirtyNodeIds == set()
+
+    createdNodeIds = []
+    getDataNodeCode = code_generator.getDataNodeCode
+    def countedGetDataNodeCode(node):
+        createdNodeIds.append(node.id)
+        return getDataNodeCode(node)
+    monkeypatch.setattr(code_generator, "getDataNodeCode", countedGetDataNodeCode)
+
+    def regenerate():
+        """
+        Returns the ids of the data nodes whose code was created by the incremental run.
+        """
+        expectedSource = code_generator.CodeGenerator().generatePythonSource(graph, "G", start)
+        del createdNodeIds[:]
+        assert generator.generatePythonSource(graph, "G", start) == expectedSource
+        assert not any(n.id in cache.dirtyNodeIds for n in graph.all_nodes())
+        return sorted(createdNodeIds)
+
+    # Unchanged nodes reuse their code:
+    assert regenerate() == []
+
+    # The changed node and the nodes connected to its outputs are regenerated:
+    mul = graph.get_node_by_name("Multiply")
+    adds = [n for n in graph.all_nodes() if n.type_ == "Operator.Add"]
+    mul.set_property("p_lhs", 5)
+    assert cache.dirtyNodeIds == {mul.id} | {add.id for add in adds}
+    assert regenerate() == sorted([mul.id] + [add.id for add in adds])
+
+    adds[0].inputs()["rhs"].disconnect_from(mul.outputs()["product"])
+    assert regenerate() == [adds[0].id]
+
+    graph.undo_stack().undo()
+    assert regenerate() == [adds[0].id]
+
+    graph.delete_nodes([graph.get_node_by_name("Print 1")])
+    regenerate()
+    graph.undo_stack().undo()
+    regenerate()
+
+def test_connected_ports_are_not_copied(graph, monkeypatch, capsys):
+    from NodeGraphQt.base.port import Port
+    from node_exec.graph_interpreter import GraphInterpreter
+
+    start = createLoopGraph(graph)
+    expectedSource = code_generator.CodeGenerator().generatePythonSource(graph, "G", start)
+
+    # The generator and the interpreter read the stored connections instead of the copies of Port.connected_ports:
+    copiedPorts = []
+    connectedPorts = Port.connected_ports
+    monkeypatch.setattr(Port, "connected_ports", lambda port: copiedPorts.append(port) or connectedPorts(port))
+    assert code_generator.CodeGenerator().generatePythonSource(graph, "G", start) == expectedSource
+    GraphInterpreter().execute(start)
+    assert copiedPorts == []
+    assert capsys.readouterr().out.split() == ["6", "6", "7", "7", "8", "8"]
@@ -0,0 +1,84 @@
+import io
+
+from conftest import connect
+from test_code_generator import createLoopGraph
+from node_exec import code_generator
+from node_exec import execution_worker
+from node_exec.GraphManager import GraphManager
+from node_exec.graph_interpreter import GraphInterpreter, loadGraph
+
+
+def createReturnGraph(graph):
+    """
+    return 2 * 3 + 1
+    """
+    start = graph.create_node("Misc.ExecStart", name="Start")
+    mul = graph.create_node("Operator.Multiply")
+    mul.set_property("p_lhs", 2)
+    mul.set_property("p_rhs", 3)
+    add = graph.create_node("Operator.Add")
+    connect(mul, "product", add, "lhs")
+    returnNode = graph.create_node("Default.Return")
+    connect(start, "Execute", returnNode, "Execute")
+    connect(add, "sum", returnNode, "inParam")
+    return start, add
+
+def test_interpret_loop(graph, capsys):
+    start = createLoopGraph(graph)
+    executedNodeIds = []
+    assert GraphInterpreter(reportProgress=executedNodeIds.append).execute(start) == None
+    assert capsys.readouterr().out.split() == ["6", "6", "7", "7", "8", "8"]
+
+    # Progress is reported for the same nodes as by the generated code:
+    source = code_generator.CodeGenerator().generatePythonSource(graph, "G", start, reportProgress=True)
+    reportedNodeIds = []
+    namespace = {code_generator.PROGRESS_FUNCTION_NAME: reportedNodeIds.append}
+    exec(source, namespace)
+    namespace["execute"]()
+    assert executedNodeIds == reportedNodeIds
+
+def test_interpret_return(graph):
+    start, add = createReturnGraph(graph)
+    add.set_property("p_rhs", 1)
+    interpreter = GraphInterpreter()
+    assert interpreter.execute(start) == 7
+
+    # The compiled code of unchanged nodes is reused:
+    codeCount = len(interpreter.compiledCode)
+    add.set_property("p_rhs", 2)
+    assert interpreter.execute(start) == 8
+    assert len(interpreter.compiledCode) == codeCount + 1
+
+def test_interpret_job(graph):
+    start, add = createReturnGraph(graph)
+    add.set_property("p_rhs", 4)
+    job = {"interpret": True, "session": graph.serialize_session(), "startNodeName": "Start"}
+
+    stream = io.StringIO()
+    assert execution_worker.reportJob(job, stream) == 0
+    assert stream.getvalue().rstrip("\n").split("\n")[-1] == f"{execution_worker.RESULT_PREFIX}10"
+
+    loadedGraph, loadedStart = loadGraph(job["session"], "Start")
+    assert loadedGraph.headless()
+    assert GraphInterpreter().execute(loadedStart) == 10
+
+def test_execute_graph(graph, tmp_path, capsys):
+    start, add = createReturnGraph(graph)
+    add.set_property("p_rhs", 4)
+    graphManager = GraphManager([str(tmp_path)], catalogPath=str(tmp_path / "catalog.sqlite"))
+    try:
+        graphManager.saveGraph(graph, str(tmp_path), "G", "Default", "Start")
+        assert graphManager.canInterpretCurrentSession()
+        assert graphManager.executeGraph(interpret=True) == 10
+        assert graphManager.executedModules == {}
+
+        # Unsupported nodes fall back to the generated code:
+        walker = graph.create_node("Filesystem.FileWalker")
+        walker.set_property("p_directory", repr(str(tmp_path)))
+        connect(start, "Execute", walker, "Execute")
+        assert not graphManager.canInterpretCurrentSession()
+        assert graphManager.executeGraph(interpret=True) == None
+        assert "can't be interpreted" in capsys.readouterr().out
+        assert len(graphManager.executedModules) == 1
+    finally:
+        graphManager.close()
@@ -0,0 +1,48 @@
+import os
+import threading
+
+from node_exec import GraphManager as graph_manager
+from node_exec.GraphManager import GraphCatalog, GraphSettings, SETTINGS_FILE_SUFFIX
+
+
+def writeGraphSettings(graphsFolder, name, category="Default"):
+    settings = GraphSettings(name, category, "Start", graphsFolder)
+    os.makedirs(settings.dataFolder, exist_ok=True)
+    settingsPath = os.path.join(settings.dataFolder, name + SETTINGS_FILE_SUFFIX)
+    settings.save(settingsPath)
+    return settings, settingsPath
+
+def test_catalog_is_validated_in_the_background(tmp_path, monkeypatch):
+    graphsFolder = str(tmp_path)
+    writeGraphSettings(graphsFolder, "A")
+
+    scanThreads = []
+    getDirectoryMtimes = graph_manager.getDirectoryMtimes
+    def recordedGetDirectoryMtimes(*args):
+        scanThreads.append(threading.current_thread())
+        return getDirectoryMtimes(*args)
+    monkeypatch.setattr(graph_manager, "getDirectoryMtimes", recordedGetDirectoryMtimes)
+
+    catalog = GraphCatalog(validationInterval=0.0)
+    try:
+        # New folders are scanned before the query returns:
+        assert catalog.containsGraph([graphsFolder], "A", "Default")
+        assert scanThreads == [threading.current_thread()]
+
+        # Known folders are checked on another thread and the changes are swapped in:
+        del scanThreads[:]
+        writeGraphSettings(graphsFolder, "B")
+        catalog.update([graphsFolder])
+        catalog.waitForRefresh()
+        assert len(scanThreads) == 1 and scanThreads[0] is not threading.current_thread()
+        assert sorted(s.name for s in catalog.getAllGraphSettings([graphsFolder])) == ["A", "B"]
+
+        # Saved graphs are added directly and kept by the next refresh:
+        catalog.waitForRefresh()
+        settings, settingsPath = writeGraphSettings(graphsFolder, "C")
+        catalog.add(graphsFolder, settings, settingsPath)
+        assert catalog.containsGraph([graphsFolder], "C", "Default")
+        catalog.waitForRefresh()
+        assert catalog.getGraphIds([graphsFolder]) == {GraphSettings(n, "Default", "Start", graphsFolder).id for n in "ABC"}
+    finally:
+        catalog.close()
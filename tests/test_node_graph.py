@@ -0,0 +1,176 @@
+from conftest import connect, createGraph
+
+
+def createChain(graph, count):
+    """
+    Add nodes connected from the sum output to the lhs input of the next node.
+    """
+    nodes = [graph.create_node("Operator.Add") for i in range(count)]
+    for outNode, inNode in zip(nodes, nodes[1:]):
+        connect(outNode, "sum", inNode, "lhs")
+
+    return nodes
+
+def getConnections(graph):
+    return sorted((outPort.node().name(), outPort.name(), inPort.node().name(), inPort.name())
+                  for node in graph.all_nodes()
+                  for inPort in node.inputs().values()
+                  for outPort in inPort.connected_ports())
+
+def test_name_index(graph):
+    add, add1 = createChain(graph, 2)
+    assert (add.name(), add1.name()) == ("Add", "Add 1")
+    assert graph.get_node_by_name("Add 1") is add1
+    assert graph.get_unique_name("Add") == "Add 2"
+
+    add1.set_name("Sum")
+    assert graph.get_node_by_name("Add 1") is None
+    assert graph.get_node_by_name("Sum") is add1
+
+    add.view.name = "First"
+    add.update_model()
+    assert graph.get_node_by_name("Add") is None
+    assert graph.get_node_by_name("First") is add
+    assert graph.get_unique_name("Add") == "Add"
+
+def test_connected_ports(graph):
+    add, add1 = createChain(graph, 2)
+    ports = add.outputs()["sum"].connected_ports()
+    assert isinstance(ports, list)
+    assert ports == [add1.inputs()["lhs"]]
+
+    add1.inputs()["lhs"].disconnect_from(add.outputs()["sum"])
+    assert add.outputs()["sum"].connected_ports() == []
+    assert add1.inputs()["lhs"].connected_ports() == []
+
+def test_serialize_round_trip(graph):
+    nodes = createChain(graph, 5)
+    connect(nodes[0], "sum", nodes[4], "rhs")
+    connections = getConnections(graph)
+
+    data = graph.serialize_session()
+    assert len(data["connections"]) == 5
+
+    loadedGraph = createGraph()
+    loadedGraph.deserialize_session(data)
+    assert sorted(n.name() for n in loadedGraph.all_nodes()) == sorted(n.name() for n in nodes)
+    assert getConnections(loadedGraph) == connections
+
+def test_load_session_in_bulk(graph):
+    createChain(graph, 3)
+    data = graph.serialize_session()
+
+    loadedGraph = createGraph()
+    loadedGraph.create_node("Operator.Multiply")
+    connectedPorts = []
+    sessions = []
+    loadedGraph.port_connected.connect(lambda srcPort, trgPort: connectedPorts.append(srcPort))
+    loadedGraph.session_loaded.connect(sessions.append)
+    loadedGraph.deserialize_session(data)
+
+    assert getConnections(loadedGraph) == getConnections(graph)
+    # Sessions are loaded without undo commands and signals per connection:
+    assert loadedGraph.undo_stack().count() == 0
+    assert connectedPorts == []
+    assert sessions == [""]
+
+def test_delete_and_clear(graph):
+    add, add1, add2 = createChain(graph, 3)
+    graph.delete_nodes([add1])
+    assert add.outputs()["sum"].connected_ports() == []
+    assert add2.inputs()["lhs"].connected_ports() == []
+    assert graph.get_node_by_name("Add 1") is None
+
+    graph.undo_stack().undo()
+    assert getConnections(graph) == [("Add", "sum", "Add 1", "lhs"), ("Add 1", "sum", "Add 2", "lhs")]
+
+    graph.clear_session()
+    assert graph.all_nodes() == []
+    assert graph.topological_order() == []
+
+def test_topological_order(graph):
+    nodes = createChain(graph, 4)
+    # Connect against the creation order:
+    last = graph.create_node("Operator.Add")
+    connect(last, "sum", nodes[0], "rhs")
+
+    order = graph.topological_order()
+    assert order.index(last) < order.index(nodes[0])
+    assert [n for n in order if n is not last] == nodes
+
+    graph.set_acyclic(False)
+    connect(nodes[3], "sum", last, "lhs")
+    assert graph.topological_order() is None
+
+def test_upstream_and_downstream(graph):
+    add, add1, add2 = createChain(graph, 3)
+    assert set(graph.downstream(add)) == {add1, add2}
+    assert set(graph.upstream(add2)) == {add, add1}
+
+    add2.inputs()["lhs"].disconnect_from(add1.outputs()["sum"])
+    assert set(graph.downstream(add)) == {add1}
+    assert set(graph.upstream(add2)) == set()
+
+    connect(add, "sum", add2, "rhs")
+    assert set(graph.downstream(add)) == {add1, add2}
+    assert set(graph.upstream(add2)) == {add}
+
+    graph.undo_stack().undo()
+    graph.undo_stack().undo()
+    assert set(graph.downstream(add)) == {add1, add2}
+    assert set(graph.upstream(add2)) == {add, add1}
+
+def test_upstream_and_downstream_after_bulk_load(graph):
+    add, add1 = createChain(graph, 2)
+    assert graph.downstream(add) == [add1]
+
+    graph._deserialize(graph._serialize([add, add1]), bulk=True)
+    loaded = [n for n in graph.all_nodes() if n not in (add, add1)]
+    assert len(loaded) == 2
+    loadedOut = next(n for n in loaded if n.outputs()["sum"].connected_ports())
+    loadedIn = next(n for n in loaded if n is not loadedOut)
+    assert graph.downstream(loadedOut) == [loadedIn]
+    assert graph.upstream(loadedIn) == [loadedOut]
+    assert graph.downstream(add) == [add1]
+
+def test_headless(graph):
+    assert graph.headless()
+    assert graph.viewer() is None
+
+    add, add1 = createChain(graph, 2)
+    data = graph.serialize_session()
+    loadedGraph = createGraph()
+    loadedGraph.deserialize_session(data)
+    assert getConnections(loadedGraph) == getConnections(graph)
+
+def test_cycles_are_refused(graph):
+    add, add1 = createChain(graph, 2)
+    undoCount = graph.undo_stack().count()
+
+    connect(add1, "sum", add, "rhs")
+    assert add.inputs()["rhs"].connected_ports() == []
+    assert graph.undo_stack().count() == undoCount
+    assert graph.topological_order() == [add, add1]
+
+    graph.set_acyclic(False)
+    connect(add1, "sum", add, "rhs")
+    assert add.inputs()["rhs"].connected_ports() == [add1.outputs()["sum"]]
+    assert graph.topological_order() is None
+
+def test_port_signals(graph):
+    add, add1, add2 = createChain(graph, 3)
+    events = []
+    graph.port_connected.connect(lambda port, connectedPort: events.append(("connected", port.node(), connectedPort.node())))
+    graph.port_disconnected.connect(lambda port, connectedPort: events.append(("disconnected", port.node(), connectedPort.node())))
+
+    add2.inputs()["lhs"].disconnect_from(add1.outputs()["sum"])
+    graph.undo_stack().undo()
+    graph.undo_stack().redo()
+    assert events == [("disconnected", add2, add1), ("connected", add2, add1), ("disconnected", add2, add1)]
+
+    # Only the connections to the remaining nodes are reported:
+    del events[:]
+    connect(add1, "sum", add2, "lhs")
+    graph.delete_nodes([add, add1])
+    graph.undo_stack().undo()
+    assert events == [("connected", add1, add2), ("disconnected", add1, add2), ("connected", add1, add2)]